@@ -0,0 +1,417 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains persistent cache used to store DCCs discovery results between launcher sessions
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import json
+import time
+import logging
+import threading
+
+from artellapipe.launcher.plugins.dccselector.core import descriptors
+
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
+
+CACHE_VERSION = 1
+CACHE_PATH_ENV = 'ARTELLAPIPE_LAUNCHER_PLUGINS_DCCSELECTOR_DISCOVERY_CACHE'
+NEGATIVE_CACHE_TTL = 24 * 60 * 60
+
+
+def get_cache_path():
+    """
+    Returns path where DCCs discovery cache file is stored
+    :return: str
+    """
+
+    cache_path = os.environ.get(CACHE_PATH_ENV, None)
+    if cache_path:
+        return os.path.normpath(cache_path)
+
+    return os.path.normpath(os.path.join(
+        os.path.expanduser('~'), 'artellapipe', 'cache', 'artellapipe-launcher-plugins-dccselector-discovery.json'))
+
+
+def get_negative_cache_path():
+    """
+    Returns path where DCCs negative cache file is stored. It is located next to the discovery cache
+    :return: str
+    """
+
+    cache_path = get_cache_path()
+
+    return '{}-negative{}'.format(*os.path.splitext(cache_path))
+
+
+def get_install_roots(dcc_module):
+    """
+    Returns the folders the given DCC module probes to find installations
+    :param dcc_module: module
+    :return: list(str)
+    """
+
+    descriptor = getattr(dcc_module, 'DESCRIPTOR', None)
+    if descriptor is not None:
+        return descriptor.get_search_roots()
+
+    fn = getattr(dcc_module, 'get_install_roots', None)
+    if not fn:
+        return list()
+
+    return list(fn() or list())
+
+
+def fingerprint_roots(install_roots):
+    """
+    Returns a fingerprint of the given install roots. If any of the roots is modified (a DCC is installed or
+    uninstalled) its modification time changes and the fingerprint will not match anymore
+    :param install_roots: list(str)
+    :return: list(list)
+    """
+
+    fingerprint = list()
+    for root in sorted(set(install_roots or list())):
+        try:
+            root_stat = os.stat(root)
+            fingerprint.append([root, root_stat.st_mtime, root_stat.st_ino])
+        except OSError:
+            fingerprint.append([root, None, None])
+
+    return fingerprint
+
+
+class JsonCache(object):
+    """
+    Base class for caches stored in disk as JSON files. Cache file is loaded the first time is accessed
+    """
+
+    DATA_KEY = 'data'
+
+    def __init__(self, cache_path):
+        super(JsonCache, self).__init__()
+
+        self._cache_path = cache_path
+        self._entries = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @property
+    def cache_path(self):
+        """
+        Returns path where cache is stored
+        :return: str
+        """
+
+        return self._cache_path
+
+    def load(self):
+        """
+        Loads cache entries from disk
+        :return: dict
+        """
+
+        with self._lock:
+            return self._load()
+
+    def save(self):
+        """
+        Writes cache into disk if it has been modified
+        :return: bool
+        """
+
+        with self._lock:
+            if not self._dirty:
+                return False
+
+            cache_dir = os.path.dirname(self._cache_path)
+            tmp_path = '{}.tmp'.format(self._cache_path)
+            try:
+                if not os.path.isdir(cache_dir):
+                    os.makedirs(cache_dir)
+                with open(tmp_path, 'w') as fh:
+                    json.dump({'version': CACHE_VERSION, self.DATA_KEY: self._entries}, fh)
+                if os.path.isfile(self._cache_path):
+                    os.remove(self._cache_path)
+                os.rename(tmp_path, self._cache_path)
+            except (IOError, OSError) as exc:
+                LOGGER.warning('Impossible to write cache "{}": {}'.format(self._cache_path, exc))
+                return False
+
+            self._dirty = False
+
+        return True
+
+    def _load(self):
+        """
+        Internal function that loads cache file the first time is accessed. Must be called with lock acquired
+        :return: dict
+        """
+
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = dict()
+        if not os.path.isfile(self._cache_path):
+            return self._entries
+
+        try:
+            with open(self._cache_path, 'r') as fh:
+                cache_data = json.load(fh)
+        except (IOError, OSError, ValueError) as exc:
+            LOGGER.warning('Impossible to read cache "{}": {}'.format(self._cache_path, exc))
+            return self._entries
+
+        if isinstance(cache_data, dict) and cache_data.get('version') == CACHE_VERSION:
+            self._entries = cache_data.get(self.DATA_KEY, None) or dict()
+
+        return self._entries
+
+
+class DiscoveryCache(JsonCache):
+    """
+    Stores DCCs installation paths in disk. Entries are keyed by DCC name, supported versions and a fingerprint
+    of the install roots the DCC module probes
+    """
+
+    DATA_KEY = 'dccs'
+
+    def __init__(self, cache_path=None):
+        super(DiscoveryCache, self).__init__(cache_path=cache_path or get_cache_path())
+
+    def get(self, dcc_name, supported_versions, install_roots):
+        """
+        Returns cached installation paths of the given DCC or None if cache entry is missing or stale
+        :param dcc_name: str
+        :param supported_versions: list(str)
+        :param install_roots: list(str)
+        :return: dict or None
+        """
+
+        with self._lock:
+            entry = self._load().get(dcc_name, None)
+            if not entry:
+                return None
+            if entry.get('versions') != sorted(supported_versions or list()):
+                return None
+            if entry.get('fingerprint') != fingerprint_roots(install_roots):
+                return None
+
+            return dict(entry.get('installation_paths') or dict())
+
+    def set(self, dcc_name, supported_versions, install_roots, installation_paths):
+        """
+        Stores installation paths of the given DCC
+        :param dcc_name: str
+        :param supported_versions: list(str)
+        :param install_roots: list(str)
+        :param installation_paths: dict
+        """
+
+        entry = {
+            'versions': sorted(supported_versions or list()),
+            'fingerprint': fingerprint_roots(install_roots),
+            'installation_paths': dict(installation_paths or dict())
+        }
+        with self._lock:
+            entries = self._load()
+            if entries.get(dcc_name) == entry:
+                return
+            entries[dcc_name] = entry
+            self._dirty = True
+
+
+class NegativeCache(JsonCache):
+    """
+    Stores in disk DCC modules that do not exist and DCC versions that are not installed, so they are not imported
+    or probed again until their entries expire. Missing versions are stored with a fingerprint of the DCC install
+    roots, so they are discarded as soon as a DCC is installed or uninstalled
+    """
+
+    DATA_KEY = 'negative'
+
+    def __init__(self, cache_path=None, ttl=NEGATIVE_CACHE_TTL):
+        super(NegativeCache, self).__init__(cache_path=cache_path or get_negative_cache_path())
+
+        self._ttl = ttl
+
+    def is_module_missing(self, module_name, search_paths=None):
+        """
+        Returns whether the given DCC module was not found recently. If the folders where the module is searched
+        changed since then (for example, DCCs package was upgraded), the module is not considered missing
+        :param module_name: str
+        :param search_paths: list(str) or None, folders where the module is searched
+        :return: bool
+        """
+
+        with self._lock:
+            entry = self._load().get('modules', dict()).get(module_name, None)
+        if not isinstance(entry, dict) or entry.get('fingerprint') != fingerprint_roots(search_paths):
+            return False
+
+        return self._is_valid(entry.get('timestamp', None))
+
+    def set_module_missing(self, module_name, search_paths=None):
+        """
+        Stores that the given DCC module does not exist
+        :param module_name: str
+        :param search_paths: list(str) or None, folders where the module was searched
+        """
+
+        entry = {'timestamp': time.time(), 'fingerprint': fingerprint_roots(search_paths)}
+        with self._lock:
+            self._load().setdefault('modules', dict())[module_name] = entry
+            self._dirty = True
+
+    def get_missing_versions(self, dcc_name, install_roots=None):
+        """
+        Returns the versions of the given DCC that were not installed recently. If the install roots changed since
+        the versions were stored, they are discarded
+        :param dcc_name: str
+        :param install_roots: list(str) or None
+        :return: list(str)
+        """
+
+        fingerprint = fingerprint_roots(install_roots)
+        with self._lock:
+            dcc_versions = self._load().get('versions', dict())
+            entry = dcc_versions.get(dcc_name, None)
+            if not entry:
+                return list()
+            if entry.get('fingerprint') != fingerprint:
+                dcc_versions.pop(dcc_name, None)
+                self._dirty = True
+                return list()
+            versions = dict(entry.get('versions', None) or dict())
+
+        return [version for version, timestamp in versions.items() if self._is_valid(timestamp)]
+
+    def update_versions(self, dcc_name, probed_versions, installed_versions, install_roots=None):
+        """
+        Updates missing versions of the given DCC with the result of a probe
+        :param dcc_name: str
+        :param probed_versions: list(str)
+        :param installed_versions: list(str)
+        :param install_roots: list(str) or None, install roots probed to find the installed versions
+        """
+
+        now = time.time()
+        fingerprint = fingerprint_roots(install_roots)
+        with self._lock:
+            dcc_versions = self._load().setdefault('versions', dict())
+            entry = dcc_versions.get(dcc_name, None)
+            if not entry or entry.get('fingerprint') != fingerprint:
+                entry = dcc_versions[dcc_name] = {'fingerprint': fingerprint, 'versions': dict()}
+                self._dirty = True
+            dcc_versions = entry['versions']
+            for version in probed_versions:
+                if version in installed_versions:
+                    if dcc_versions.pop(version, None) is not None:
+                        self._dirty = True
+                elif not self._is_valid(dcc_versions.get(version, None)):
+                    dcc_versions[version] = now
+                    self._dirty = True
+
+    def clear(self, dcc_name=None):
+        """
+        Removes the missing versions of the given DCC. If no DCC is given, all entries are removed
+        :param dcc_name: str or None
+        """
+
+        with self._lock:
+            entries = self._load()
+            if dcc_name is None:
+                entries.clear()
+            else:
+                entries.get('versions', dict()).pop(dcc_name, None)
+            self._dirty = True
+
+    def _is_valid(self, timestamp):
+        """
+        Internal function that returns whether an entry stored at the given time has not expired yet
+        :param timestamp: float or None
+        :return: bool
+        """
+
+        return timestamp is not None and 0 <= time.time() - timestamp < self._ttl
+
+
+def probe_installation_paths(dcc_module, supported_versions, snapshot=None):
+    """
+    Runs installation paths discovery of the given DCC module. DCC modules that define a DESCRIPTOR are discovered
+    through the descriptors engine, otherwise their get_installation_paths function is used
+    :param dcc_module: module
+    :param supported_versions: list(str)
+    :param snapshot: descriptors.FileSystemSnapshot or None, file system snapshot shared by the discovery pass
+    :return: dict
+    """
+
+    descriptor = getattr(dcc_module, 'DESCRIPTOR', None)
+    if descriptor is not None:
+        return descriptors.discover(descriptor, supported_versions, snapshot=snapshot)
+
+    return dict(dcc_module.get_installation_paths(supported_versions) or dict())
+
+
+def get_cached_installation_paths(cache, dcc_name, dcc_module, supported_versions):
+    """
+    Returns cached installation paths of the given DCC or None if they are not cached or cache entry is stale
+    :param cache: DiscoveryCache or None
+    :param dcc_name: str
+    :param dcc_module: module
+    :param supported_versions: list(str)
+    :return: dict or None
+    """
+
+    if cache is None:
+        return None
+
+    return cache.get(dcc_name, supported_versions, get_install_roots(dcc_module))
+
+
+def update_installation_paths(cache, dcc_name, dcc_module, supported_versions, snapshot=None, versions_to_probe=None):
+    """
+    Probes the given DCC module and updates its cache entry. Cache entry is always keyed by all the supported
+    versions, so it does not change when only some of them are probed
+    :param cache: DiscoveryCache or None
+    :param dcc_name: str
+    :param dcc_module: module
+    :param supported_versions: list(str)
+    :param snapshot: descriptors.FileSystemSnapshot or None, file system snapshot shared by the discovery pass
+    :param versions_to_probe: list(str) or None, versions to probe. If None, all supported versions are probed
+    :return: dict
+    """
+
+    if versions_to_probe is None:
+        versions_to_probe = supported_versions
+    installation_paths = probe_installation_paths(dcc_module, versions_to_probe, snapshot=snapshot)
+    if cache is not None:
+        cache.set(dcc_name, supported_versions, get_install_roots(dcc_module), installation_paths)
+
+    return installation_paths
+
+
+def resolve_installation_paths(cache, dcc_name, dcc_module, supported_versions):
+    """
+    Returns installation paths of the given DCC using the cache if possible. If the entry is not cached (or the
+    install roots fingerprint does not match) the DCC module is probed and the result is stored in the cache
+    :param cache: DiscoveryCache or None
+    :param dcc_name: str
+    :param dcc_module: module
+    :param supported_versions: list(str)
+    :return: tuple(dict, bool), installation paths and whether they were retrieved from cache or not
+    """
+
+    installation_paths = get_cached_installation_paths(cache, dcc_name, dcc_module, supported_versions)
+    if installation_paths is not None:
+        return installation_paths, True
+
+    return update_installation_paths(cache, dcc_name, dcc_module, supported_versions), False
@@ -0,0 +1,317 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains declarative DCC descriptors and the generic engine used to discover their installations
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import re
+import logging
+import platform
+import threading
+
+from artellapipe.launcher.plugins.dccselector.core import installs, registry
+
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
+
+
+def get_system():
+    """
+    Returns the name of the current OS, used to retrieve OS specific descriptors data
+    :return: str
+    """
+
+    return platform.system().lower()
+
+
+class RegistryLookup(object):
+    """
+    Describes where a DCC registers its installations in Windows registry (HKEY_LOCAL_MACHINE)
+    """
+
+    def __init__(self, key_path, subkey_pattern, value_key='{subkey}', value_name='InstallPath'):
+        """
+        :param key_path: str, key whose subkeys are the installed versions of the DCC
+        :param subkey_pattern: str, regular expression that matches installation subkeys. Must define a version group
+        :param value_key: str, key (relative to key_path) that contains installation folder. {subkey} is replaced by
+            the name of the installation subkey
+        :param value_name: str, name of the value that contains installation folder
+        """
+
+        super(RegistryLookup, self).__init__()
+
+        self.key_path = key_path
+        self.subkey_pattern = re.compile(subkey_pattern, re.IGNORECASE)
+        self.value_key = value_key
+        self.value_name = value_name
+
+    def get_value_key(self, subkey):
+        """
+        Returns the full path of the key that contains installation folder of the given installation subkey
+        :param subkey: str
+        :return: str
+        """
+
+        return '{}\\{}'.format(self.key_path, self.value_key.format(subkey=subkey))
+
+
+class DccDescriptor(object):
+    """
+    Describes how installations of a DCC can be found. All the data is defined per OS (windows, linux, darwin)
+    """
+
+    def __init__(self, name, search_roots=None, folder_patterns=None, executables=None, registry_lookups=None):
+        """
+        :param name: str, name of the DCC
+        :param search_roots: dict(str, list(str)), folders where DCC installation folders are located
+        :param folder_patterns: dict(str, str), regular expressions that match DCC installation folder names. Named
+            groups can be used in executables. Version group is used to retrieve installation version. If version
+            group is not defined (or does not match), the installation is used for the first supported version
+        :param executables: dict(str, list(str)), candidate executables paths relative to installation folder.
+            Named groups of the folder pattern can be used ("Nuke{release}.exe")
+        :param registry_lookups: list(RegistryLookup), Windows registry keys where DCC installations are registered
+        """
+
+        super(DccDescriptor, self).__init__()
+
+        self.name = name
+        self.search_roots = search_roots or dict()
+        self.folder_patterns = dict(
+            (system, re.compile(pattern, re.IGNORECASE)) for system, pattern in (folder_patterns or dict()).items())
+        self.executables = executables or dict()
+        self.registry_lookups = registry_lookups or list()
+
+    def __str__(self):
+        msg = super(DccDescriptor, self).__str__()
+
+        msg += '\tName: {}\n'.format(self.name)
+        msg += '\tSearch Roots: {}\n'.format(self.search_roots)
+        msg += '\tFolder Patterns: {}\n'.format(
+            dict((system, pattern.pattern) for system, pattern in self.folder_patterns.items()))
+        msg += '\tExecutables: {}\n'.format(self.executables)
+
+        return msg
+
+    def get_search_roots(self, system=None):
+        """
+        Returns folders where DCC installations are located in the given OS
+        :param system: str or None, if None, current OS is used
+        :return: list(str)
+        """
+
+        return list(self.search_roots.get(system or get_system(), list()))
+
+    def get_folder_pattern(self, system=None):
+        """
+        Returns regular expression that matches DCC installation folders in the given OS
+        :param system: str or None, if None, current OS is used
+        :return: re.Pattern or None
+        """
+
+        return self.folder_patterns.get(system or get_system(), None)
+
+    def get_executables(self, system=None):
+        """
+        Returns candidate executables, relative to installation folder, in the given OS
+        :param system: str or None, if None, current OS is used
+        :return: list(str)
+        """
+
+        return list(self.executables.get(system or get_system(), list()))
+
+
+class FileSystemSnapshot(object):
+    """
+    Memoizes directory listings and file stats. A single snapshot is shared by all the descriptors probed in the same
+    discovery pass, so a folder is listed only once no matter how many DCCs are installed in it. Is thread safe, so
+    it can be shared by probes running concurrently
+    """
+
+    def __init__(self):
+        super(FileSystemSnapshot, self).__init__()
+
+        self._folders = dict()
+        self._files = dict()
+        self._lock = threading.Lock()
+        self._root_locks = dict()
+        self.listings = 0
+
+    def list_folders(self, root):
+        """
+        Returns name and path of the folders located in the given root
+        :param root: str
+        :return: list(tuple(str, str))
+        """
+
+        with self._lock:
+            if root in self._folders:
+                return self._folders[root]
+            root_lock = self._root_locks.setdefault(root, threading.Lock())
+
+        with root_lock:
+            with self._lock:
+                if root in self._folders:
+                    return self._folders[root]
+            folders = list(installs.iter_folders(root))
+            with self._lock:
+                self._folders[root] = folders
+                self.listings += 1
+
+        return folders
+
+    def isfile(self, file_path):
+        """
+        Returns whether given path is an existing file or not
+        :param file_path: str
+        :return: bool
+        """
+
+        with self._lock:
+            if file_path in self._files:
+                return self._files[file_path]
+
+        is_file = os.path.isfile(file_path)
+        with self._lock:
+            self._files[file_path] = is_file
+
+        return is_file
+
+    def prefetch(self, roots):
+        """
+        Lists all the given roots
+        :param roots: list(str)
+        """
+
+        for root in roots:
+            self.list_folders(root)
+
+
+def find_installations(descriptor, snapshot, search_roots=None, system=None):
+    """
+    Returns all the installations of the given DCC. Registry installations have priority over the ones found in
+    search roots
+    :param descriptor: DccDescriptor
+    :param snapshot: FileSystemSnapshot
+    :param search_roots: list(str) or None, if None, descriptor search roots are used
+    :param system: str or None, if None, current OS is used
+    :return: dict(str, tuple(str, dict)), maps installed versions with their installation folder and the named
+        groups of the folder (or registry key) match. Installations without version are stored with None key
+    """
+
+    system = system or get_system()
+    index = dict()
+
+    if system == 'windows' and descriptor.registry_lookups:
+        registry_reader = registry.get_reader()
+        for lookup in descriptor.registry_lookups:
+            matches = dict()
+            for subkey in registry_reader.get_subkeys(lookup.key_path):
+                match = lookup.subkey_pattern.match(subkey)
+                if match:
+                    matches[lookup.get_value_key(subkey)] = match.groupdict()
+            values = registry_reader.read_batch([(value_key, lookup.value_name) for value_key in matches])
+            for value_key, groups in matches.items():
+                folder = values.get((value_key, lookup.value_name), None)
+                if folder:
+                    index.setdefault(groups.get('version', None), (folder, groups))
+
+    folder_pattern = descriptor.get_folder_pattern(system)
+    if folder_pattern:
+        roots = descriptor.get_search_roots(system) if search_roots is None else search_roots
+        for root in roots:
+            for folder_name, folder_path in snapshot.list_folders(root):
+                match = folder_pattern.match(folder_name)
+                if match:
+                    groups = match.groupdict()
+                    index.setdefault(groups.get('version', None), (folder_path, groups))
+
+    return index
+
+
+def get_executable(descriptor, installation_folder, groups, snapshot, system=None):
+    """
+    Returns the executable of the given DCC installation folder
+    :param descriptor: DccDescriptor
+    :param installation_folder: str
+    :param groups: dict, named groups of the installation folder match
+    :param snapshot: FileSystemSnapshot
+    :param system: str or None, if None, current OS is used
+    :return: str or None
+    """
+
+    format_groups = dict((k, v) for k, v in groups.items() if v is not None)
+    for executable in descriptor.get_executables(system):
+        try:
+            executable_path = os.path.join(installation_folder, executable.format(**format_groups))
+        except (KeyError, IndexError):
+            continue
+        if snapshot.isfile(executable_path):
+            return executable_path
+
+    return None
+
+
+def discover(descriptor, versions, snapshot=None, search_roots=None, system=None):
+    """
+    Returns the executables of the given versions of the given DCC
+    :param descriptor: DccDescriptor
+    :param versions: list(str)
+    :param snapshot: FileSystemSnapshot or None, if None, a new snapshot is used
+    :param search_roots: list(str) or None, if None, descriptor search roots are used
+    :param system: str or None, if None, current OS is used
+    :return: dict(str, str)
+    """
+
+    snapshot = snapshot or FileSystemSnapshot()
+    index = find_installations(descriptor, snapshot, search_roots=search_roots, system=system)
+    versioned = dict((version, installation) for version, installation in index.items() if version is not None)
+
+    found = dict()
+    for version in versions:
+        installation = installs.find_version(versioned, version)
+        if not installation:
+            continue
+        executable = get_executable(descriptor, installation[0], installation[1], snapshot, system=system)
+        if not executable:
+            LOGGER.warning(
+                '{} {} installation path: {} is not valid!'.format(descriptor.name, version, installation[0]))
+            continue
+        found[version] = executable
+
+    if None in index and versions and versions[0] not in found:
+        executable = get_executable(descriptor, index[None][0], index[None][1], snapshot, system=system)
+        if executable:
+            found[versions[0]] = executable
+
+    return found
+
+
+def discover_all(descriptors_versions, snapshot=None, system=None):
+    """
+    Discovers the installations of multiple DCCs in a single pass. All search roots are listed once and shared by
+    all the descriptors
+    :param descriptors_versions: list(tuple(DccDescriptor, list(str)))
+    :param snapshot: FileSystemSnapshot or None, if None, a new snapshot is used
+    :param system: str or None, if None, current OS is used
+    :return: dict(str, dict(str, str)), maps DCC names with their installation paths
+    """
+
+    snapshot = snapshot or FileSystemSnapshot()
+    roots = list()
+    for descriptor, _ in descriptors_versions:
+        for root in descriptor.get_search_roots(system):
+            if root not in roots:
+                roots.append(root)
+    snapshot.prefetch(roots)
+
+    return dict(
+        (descriptor.name, discover(descriptor, versions, snapshot=snapshot, system=system))
+        for descriptor, versions in descriptors_versions)
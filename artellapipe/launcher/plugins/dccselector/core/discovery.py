@@ -0,0 +1,252 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains engine used to run DCCs installation probes concurrently
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import time
+import logging
+import threading
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
+
+DEFAULT_TIMEOUT = 10.0
+
+
+class DiscoveryResult(object):
+    def __init__(self, name, value=None, error=None, timed_out=False, cancelled=False, elapsed=0.0):
+        super(DiscoveryResult, self).__init__()
+
+        self.name = name
+        self.value = value
+        self.error = error
+        self.timed_out = timed_out
+        self.cancelled = cancelled
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        """
+        Returns whether probe finished properly or not
+        :return: bool
+        """
+
+        return not self.error and not self.timed_out and not self.cancelled
+
+    def __str__(self):
+        msg = super(DiscoveryResult, self).__str__()
+
+        msg += '\tName: {}\n'.format(self.name)
+        msg += '\tValue: {}\n'.format(self.value)
+        msg += '\tError: {}\n'.format(self.error)
+        msg += '\tTimed Out: {}\n'.format(self.timed_out)
+        msg += '\tCancelled: {}\n'.format(self.cancelled)
+        msg += '\tElapsed: {}\n'.format(self.elapsed)
+
+        return msg
+
+
+class _DiscoveryJob(object):
+    def __init__(self, name, fn, args, kwargs, timeout):
+        super(_DiscoveryJob, self).__init__()
+
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.timeout = timeout
+        self.start_time = None
+        self.done = False
+
+
+class DiscoveryEngine(object):
+    """
+    Runs DCC probes concurrently in a pool of worker threads. Each probe has its own timeout: when a probe takes
+    longer than its timeout a timed out result is returned and its worker is abandoned (workers are daemon
+    threads so a hung probe never blocks launcher exit) and replaced, so the remaining probes keep running.
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, max_workers=None):
+        super(DiscoveryEngine, self).__init__()
+
+        self._timeout = timeout
+        self._max_workers = max_workers
+        self._jobs = list()
+        self._jobs_queue = queue.Queue()
+        self._results_queue = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._started = False
+
+    @property
+    def cancel_event(self):
+        """
+        Returns event that is set when discovery is cancelled. Probes can check it to exit early
+        :return: threading.Event
+        """
+
+        return self._cancel_event
+
+    def is_cancelled(self):
+        """
+        Returns whether discovery has been cancelled or not
+        :return: bool
+        """
+
+        return self._cancel_event.is_set()
+
+    def submit(self, name, fn, args=None, kwargs=None, timeout=None):
+        """
+        Adds a new probe to run
+        :param name: str, name that identifies the probe result
+        :param fn: callable
+        :param args: tuple
+        :param kwargs: dict
+        :param timeout: float or None, seconds to wait for the probe. If None, engine default timeout is used
+        """
+
+        if self._started:
+            raise RuntimeError('Impossible to submit probes once discovery has started!')
+
+        job = _DiscoveryJob(name, fn, tuple(args or ()), dict(kwargs or dict()),
+                            self._timeout if timeout is None else timeout)
+        self._jobs.append(job)
+
+    def cancel(self):
+        """
+        Cancels discovery. Probes that have not started yet are skipped and pending results are returned as cancelled
+        """
+
+        self._cancel_event.set()
+
+    def iter_results(self):
+        """
+        Starts all submitted probes and yields their results as soon as they are available
+        :return: generator(DiscoveryResult)
+        """
+
+        if self._started:
+            raise RuntimeError('Discovery has already been started!')
+        self._started = True
+
+        if not self._jobs:
+            return
+
+        for job in self._jobs:
+            self._jobs_queue.put(job)
+        workers_count = len(self._jobs)
+        if self._max_workers:
+            workers_count = min(workers_count, self._max_workers)
+        for _ in range(workers_count):
+            self._start_worker()
+
+        pending = list(self._jobs)
+        while pending:
+            if self.is_cancelled():
+                for job in pending:
+                    job.done = True
+                    yield DiscoveryResult(job.name, cancelled=True, elapsed=self._get_elapsed(job))
+                return
+
+            now = time.time()
+            for job in list(pending):
+                if job.done or job.start_time is None or job.timeout is None or job.timeout <= 0:
+                    continue
+                if now - job.start_time >= job.timeout:
+                    job.done = True
+                    pending.remove(job)
+                    LOGGER.warning('DCC discovery probe "{}" timed out after {} seconds'.format(job.name, job.timeout))
+                    self._start_worker()
+                    yield DiscoveryResult(job.name, timed_out=True, elapsed=now - job.start_time)
+
+            if not pending:
+                return
+
+            try:
+                job, result = self._results_queue.get(timeout=self._get_wait_time(pending))
+            except queue.Empty:
+                continue
+            if job.done:
+                continue
+            job.done = True
+            pending.remove(job)
+            yield result
+
+    def run(self):
+        """
+        Runs all submitted probes and waits for them to finish
+        :return: dict(str, DiscoveryResult)
+        """
+
+        return dict((result.name, result) for result in self.iter_results())
+
+    def _start_worker(self):
+        """
+        Internal function that starts a new worker thread
+        """
+
+        worker = threading.Thread(target=self._worker, name='DCCSelectorDiscovery')
+        worker.daemon = True
+        worker.start()
+
+    def _worker(self):
+        """
+        Internal function that runs queued probes. Exits when there are no more probes to run or if the probe
+        it was running timed out (in that case, a new worker was started to replace it)
+        """
+
+        while True:
+            try:
+                job = self._jobs_queue.get_nowait()
+            except queue.Empty:
+                return
+            if self.is_cancelled():
+                return
+
+            job.start_time = time.time()
+            try:
+                value = job.fn(*job.args, **job.kwargs)
+                result = DiscoveryResult(job.name, value=value, elapsed=self._get_elapsed(job))
+            except Exception as exc:
+                LOGGER.warning('DCC discovery probe "{}" failed: {}'.format(job.name, exc))
+                result = DiscoveryResult(job.name, error=exc, elapsed=self._get_elapsed(job))
+            self._results_queue.put((job, result))
+            if job.done:
+                return
+
+    def _get_wait_time(self, pending):
+        """
+        Internal function that returns the time to wait for a result before checking probes timeouts again
+        :param pending: list(_DiscoveryJob)
+        :return: float
+        """
+
+        wait_time = 0.05
+        now = time.time()
+        for job in pending:
+            if job.start_time is None or job.timeout is None or job.timeout <= 0:
+                continue
+            wait_time = min(wait_time, max(0.0, job.start_time + job.timeout - now))
+
+        return wait_time
+
+    @staticmethod
+    def _get_elapsed(job):
+        """
+        Internal function that returns the time the given probe has been running
+        :param job: _DiscoveryJob
+        :return: float
+        """
+
+        return time.time() - job.start_time if job.start_time is not None else 0.0
@@ -0,0 +1,150 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to build the paths lists registered in launched DCCs environment
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import logging
+from collections import OrderedDict
+
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
+
+PYTHONPATH_VAR = 'PYTHONPATH'
+
+_BASE_PATHS = dict()
+
+
+class PathList(object):
+    """
+    Ordered list of paths without duplicates. Paths are normalized once, when they are added, and paths that only
+    differ in case (in case insensitive file systems) or in separators are considered the same path
+    """
+
+    def __init__(self, paths=None, base_path=None):
+        """
+        :param paths: list(str) or None, initial paths
+        :param base_path: str or None, relative paths are joined to this path
+        """
+
+        super(PathList, self).__init__()
+
+        self._base_path = base_path
+        self._paths = OrderedDict()
+        if paths:
+            self.extend(paths)
+
+    def __iter__(self):
+        return iter(self._paths.values())
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __contains__(self, path):
+        return self._get_key(self.normalize(path)) in self._paths
+
+    def normalize(self, path):
+        """
+        Returns the normalized version of the given path
+        :param path: str
+        :return: str
+        """
+
+        if self._base_path:
+            path = os.path.join(self._base_path, path)
+
+        return os.path.normpath(path)
+
+    def add(self, path):
+        """
+        Adds given path at the end of the list, if it is not already in the list
+        :param path: str
+        :return: bool, True if the path was added; False otherwise
+        """
+
+        if not path:
+            return False
+
+        path = self.normalize(path)
+        key = self._get_key(path)
+        if key in self._paths:
+            return False
+        self._paths[key] = path
+
+        return True
+
+    def extend(self, paths):
+        """
+        Adds given paths at the end of the list, skipping the ones that are already in the list
+        :param paths: list(str)
+        """
+
+        for path in paths:
+            self.add(path)
+
+    def to_string(self, separator=os.pathsep):
+        """
+        Returns the paths joined with the given separator, ready to be stored in an environment variable
+        :param separator: str
+        :return: str
+        """
+
+        return separator.join(self._paths.values())
+
+    def _get_key(self, path):
+        """
+        Internal function that returns the key used to detect duplicated paths
+        :param path: str
+        :return: str
+        """
+
+        return os.path.normcase(path)
+
+
+def split_paths(value, separator=os.pathsep):
+    """
+    Returns the paths stored in the given environment variable value
+    :param value: str or None
+    :param separator: str
+    :return: list(str)
+    """
+
+    return [path for path in (value or '').split(separator) if path]
+
+
+def get_base_paths(var_name=PYTHONPATH_VAR):
+    """
+    Returns the paths the given environment variable had the first time the launcher registered paths on it.
+    Launches always start from these paths, so the variable does not grow launch after launch
+    :param var_name: str
+    :return: list(str)
+    """
+
+    if var_name not in _BASE_PATHS:
+        _BASE_PATHS[var_name] = split_paths(os.environ.get(var_name, None))
+
+    return list(_BASE_PATHS[var_name])
+
+
+def set_paths(paths, var_name=PYTHONPATH_VAR):
+    """
+    Stores the base paths of the given environment variable followed by the given ones. Environment is written once
+    :param paths: list(str)
+    :param var_name: str
+    :return: str, new value of the environment variable
+    """
+
+    path_list = PathList(get_base_paths(var_name))
+    path_list.extend(paths)
+    value = path_list.to_string()
+    os.environ[var_name] = value
+
+    return value
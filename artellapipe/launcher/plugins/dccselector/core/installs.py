@@ -0,0 +1,86 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to list DCC install roots and match installed versions
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+
+def iter_folders(install_root):
+    """
+    Yields name and path of all the folders located in the given install root using a single directory pass
+    :param install_root: str
+    :return: generator(tuple(str, str))
+    """
+
+    if scandir is not None:
+        try:
+            entries = list(scandir(install_root))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                yield entry.name, entry.path
+    else:
+        try:
+            names = os.listdir(install_root)
+        except OSError:
+            return
+        for name in names:
+            folder_path = os.path.join(install_root, name)
+            if os.path.isdir(folder_path):
+                yield name, folder_path
+
+
+def find_version(index, version):
+    """
+    Returns the value of the given version from the given index of installed versions. If the exact version is not
+    indexed, the most recent build of that version is returned ("18.0" matches "18.0.499")
+    :param index: dict(str, object)
+    :param version: str
+    :return: object or None
+    """
+
+    if version in index:
+        return index[version]
+
+    builds = [v for v in index if v.startswith('{}.'.format(version))]
+    if not builds:
+        return None
+
+    return index[max(builds, key=_version_key)]
+
+
+def _version_key(version):
+    """
+    Internal function that returns a key that can be used to sort version strings
+    :param version: str
+    :return: tuple
+    """
+
+    key = list()
+    for token in version.replace('v', '.').split('.'):
+        key.append((0, int(token), '') if token.isdigit() else (1, 0, token))
+
+    return tuple(key)
@@ -0,0 +1,270 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the launch plans of DCCs and the state machine that drives their launch
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import time
+import logging
+from collections import namedtuple
+
+from artellapipe.launcher.plugins.dccselector.core import environment
+
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
+
+IDLE_STATE = 'idle'
+RUNNING_STATE = 'running'
+FINISHED_STATE = 'finished'
+FAILED_STATE = 'failed'
+CANCELLED_STATE = 'cancelled'
+
+
+class LaunchError(Exception):
+    """
+    Exception raised by launch phases when the DCC cannot be launched
+    """
+
+    pass
+
+
+def call_now(delay, fn):
+    """
+    Scheduler that calls the given function immediately. Delays are ignored
+    :param delay: float
+    :param fn: callable
+    """
+
+    fn()
+
+
+class LaunchPlan(namedtuple('LaunchPlan', [
+        'dcc_name', 'version', 'exec_', 'install_path', 'bootstrap_path', 'folders_to_register', 'python_paths',
+        'launch_fn', 'error'])):
+    """
+    Immutable description of everything needed to launch a DCC version: executable, bootstrap path and paths that
+    are registered in launched DCC environment. Plans are built before the user selects a DCC, so launching only
+    applies the plan environment and spawns the DCC
+    """
+
+    __slots__ = ()
+
+    def apply_environment(self):
+        """
+        Registers plan paths in PYTHONPATH environment variable. Paths registered by previous launches are not kept
+        """
+
+        if not self.python_paths:
+            return
+
+        LOGGER.info("Registering following paths: \n")
+        for f in self.folders_to_register:
+            LOGGER.info(f)
+
+        python_path = environment.set_paths(self.python_paths)
+        LOGGER.debug('PYTHONPATH: {}'.format(python_path))
+
+    def spawn(self):
+        """
+        Launches the DCC
+        :return: object, value returned by DCC launch function
+        """
+
+        return self.launch_fn(exec_=self.exec_, setup_path=self.bootstrap_path)
+
+
+class LaunchPhase(object):
+    def __init__(self, name, fn, progress=0, message=''):
+        """
+        :param name: str, name of the phase
+        :param fn: callable, function that does the phase work. Receives the launch context dictionary
+        :param progress: int, progress value shown while the phase runs
+        :param message: str, message shown while the phase runs
+        """
+
+        super(LaunchPhase, self).__init__()
+
+        self.name = name
+        self.fn = fn
+        self.progress = progress
+        self.message = message
+
+
+class LaunchStateMachine(object):
+    """
+    Runs launch phases one after another. Each phase starts as soon as the previous one finishes, the only wait is
+    the optional minimum display time, that is scheduled (not slept) before finishing. Control is given back to
+    the scheduler between the progress notification of a phase and its work, so UI can be repainted without
+    processing events manually
+    """
+
+    def __init__(self, phases, scheduler=None, min_display_time=0.0, on_progress=None, on_finished=None,
+                 on_failed=None):
+        """
+        :param phases: list(LaunchPhase)
+        :param scheduler: callable or None, function that receives a delay (in seconds) and a function and calls
+            the function once the delay expires. If None, functions are called immediately and delays are ignored
+        :param min_display_time: float, minimum seconds between launch start and launch finish
+        :param on_progress: callable or None, called with progress and message when a phase starts
+        :param on_finished: callable or None, called with the launch context when all phases finish
+        :param on_failed: callable or None, called with the exception raised by a phase
+        """
+
+        super(LaunchStateMachine, self).__init__()
+
+        self._phases = list(phases)
+        self._scheduler = scheduler or call_now
+        self._min_display_time = min_display_time
+        self._on_progress = on_progress
+        self._on_finished = on_finished
+        self._on_failed = on_failed
+        self._state = IDLE_STATE
+        self._index = 0
+        self._context = dict()
+        self._start_time = None
+        self.timings = list()
+
+    @property
+    def state(self):
+        """
+        Returns current state of the launch
+        :return: str
+        """
+
+        return self._state
+
+    @property
+    def context(self):
+        """
+        Returns dictionary shared by all the phases
+        :return: dict
+        """
+
+        return self._context
+
+    def start(self, context=None):
+        """
+        Starts running launch phases
+        :param context: dict or None, initial launch context
+        """
+
+        if self._state == RUNNING_STATE:
+            return
+
+        self._state = RUNNING_STATE
+        self._index = 0
+        self._context = context if context is not None else dict()
+        self._start_time = time.time()
+        self.timings = list()
+        self._advance()
+
+    def cancel(self):
+        """
+        Cancels the launch. Current phase finishes but no more phases are run
+        """
+
+        if self._state == RUNNING_STATE:
+            self._state = CANCELLED_STATE
+
+    def _advance(self):
+        """
+        Internal function that notifies the progress of the next phase and schedules its work. If all phases are
+        done, launch finish is scheduled once minimum display time expires
+        """
+
+        if self._state != RUNNING_STATE:
+            return
+
+        if self._index >= len(self._phases):
+            remaining = max(0.0, self._min_display_time - (time.time() - self._start_time))
+            self._scheduler(remaining, self._finish)
+            return
+
+        phase = self._phases[self._index]
+        if self._on_progress:
+            self._on_progress(phase.progress, phase.message)
+        self._scheduler(0.0, self._run_phase)
+
+    def _run_phase(self):
+        """
+        Internal function that runs the work of the current phase and advances to the next one
+        """
+
+        if self._state != RUNNING_STATE:
+            return
+
+        phase = self._phases[self._index]
+        phase_start_time = time.time()
+        try:
+            phase.fn(self._context)
+        except Exception as exc:
+            self._state = FAILED_STATE
+            LOGGER.error('Launch phase "{}" failed: {}'.format(phase.name, exc))
+            if self._on_failed:
+                self._on_failed(exc)
+            else:
+                raise
+            return
+        self.timings.append((phase.name, time.time() - phase_start_time))
+
+        self._index += 1
+        self._advance()
+
+    def _finish(self):
+        """
+        Internal function that finishes the launch
+        """
+
+        if self._state != RUNNING_STATE:
+            return
+
+        self._state = FINISHED_STATE
+        LOGGER.debug('Launch phases timings: {}'.format(self.timings))
+        if self._on_finished:
+            self._on_finished(self._context)
+
+
+def get_launch_phases(dcc_name, version, get_launch_plan, check_launch_plan=None):
+    """
+    Returns the phases that launch the given DCC version: launch plan resolution, environment setup and DCC spawn.
+    Resolved plan is stored in launch context "launch_plan" key and the value returned by DCC launch function in
+    "process" key
+    :param dcc_name: str
+    :param version: str
+    :param get_launch_plan: callable, called with DCC name and version, returns the LaunchPlan of the DCC version
+    :param check_launch_plan: callable or None, called with the resolved plan before its environment is set
+    :return: list(LaunchPhase)
+    """
+
+    def _resolve(context):
+        launch_plan = get_launch_plan(dcc_name, version)
+        if launch_plan.error:
+            raise LaunchError(launch_plan.error)
+        if not launch_plan.launch_fn:
+            raise LaunchError('Selected DCC: {} has no launch function!'.format(dcc_name))
+        if check_launch_plan:
+            check_launch_plan(launch_plan)
+        context['launch_plan'] = launch_plan
+
+    def _apply_environment(context):
+        context['launch_plan'].apply_environment()
+
+    def _spawn(context):
+        context['process'] = context['launch_plan'].spawn()
+
+    dcc_title = dcc_name.title()
+
+    return [
+        LaunchPhase('resolve', _resolve, progress=1, message='Creating {} launch configuration ...'.format(dcc_title)),
+        LaunchPhase(
+            'environment', _apply_environment, progress=4,
+            message='Setting {} environment variables ...'.format(dcc_title)),
+        LaunchPhase('spawn', _spawn, progress=5, message='Launching DCC: {} ...'.format(dcc_name))
+    ]
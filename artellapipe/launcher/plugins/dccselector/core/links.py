@@ -0,0 +1,117 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the index of the "-link" files used in development mode to register external modules folders
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import logging
+
+from artellapipe.launcher.plugins.dccselector.core import cache
+
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
+
+LINK_SUFFIX = '-link'
+
+
+def get_link_index_path():
+    """
+    Returns path where link files index is stored. It is located next to the discovery cache
+    :return: str
+    """
+
+    return '{}-links{}'.format(*os.path.splitext(cache.get_cache_path()))
+
+
+def read_link_file(link_path):
+    """
+    Returns the folder the given link file points to
+    :param link_path: str
+    :return: str or None, None if the link file cannot be read or is empty
+    """
+
+    try:
+        with open(link_path, 'r') as fh:
+            target_path = fh.readline().strip()
+    except (IOError, OSError) as exc:
+        LOGGER.warning('Impossible to read link file "{}": {}'.format(link_path, exc))
+        return None
+
+    if not target_path:
+        return None
+
+    return os.path.normpath(target_path)
+
+
+class LinkIndex(cache.JsonCache):
+    """
+    Stores the link files of each folder, their modification time and the folder they point to. Folders are only
+    listed again when their modification time changes (a link file is added or removed) and link files are only
+    read again when their modification time changes. Link targets are stored as they are and validated each time
+    they are used, so a target folder created later is found without the link file changing
+    """
+
+    DATA_KEY = 'links'
+
+    def __init__(self, cache_path=None):
+        super(LinkIndex, self).__init__(cache_path=cache_path or get_link_index_path())
+
+    def get_link_paths(self, folder_path):
+        """
+        Returns the existing folders the link files located in the given folder point to
+        :param folder_path: str
+        :return: list(str)
+        """
+
+        try:
+            folder_mtime = os.stat(folder_path).st_mtime
+        except OSError:
+            return list()
+
+        with self._lock:
+            entry = self._load().get(folder_path, None) or dict()
+        link_entries = entry.get('files', None) or dict()
+
+        if entry.get('mtime') == folder_mtime:
+            link_paths = sorted(link_entries.keys())
+        else:
+            try:
+                file_names = sorted(os.listdir(folder_path))
+            except OSError:
+                return list()
+            link_paths = [os.path.join(folder_path, file_name) for file_name in file_names if
+                          file_name.endswith(LINK_SUFFIX)]
+
+        changed = entry.get('mtime') != folder_mtime
+        new_link_entries = dict()
+        for link_path in link_paths:
+            try:
+                link_mtime = os.stat(link_path).st_mtime
+            except OSError:
+                changed = True
+                continue
+            link_entry = link_entries.get(link_path, None)
+            if not link_entry or link_entry.get('mtime') != link_mtime:
+                if not os.path.isfile(link_path):
+                    changed = True
+                    continue
+                link_entry = {'mtime': link_mtime, 'target': read_link_file(link_path)}
+                changed = True
+            new_link_entries[link_path] = link_entry
+
+        if changed:
+            with self._lock:
+                self._load()[folder_path] = {'mtime': folder_mtime, 'files': new_link_entries}
+                self._dirty = True
+
+        target_paths = [new_link_entries[link_path].get('target', None) for link_path in sorted(new_link_entries)]
+
+        return [target_path for target_path in target_paths if target_path and os.path.isdir(target_path)]
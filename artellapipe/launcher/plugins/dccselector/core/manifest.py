@@ -0,0 +1,139 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains studio installation manifest, used to retrieve DCCs installation paths without probing
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import json
+import logging
+import platform
+
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
+
+MANIFEST_PATH_ENV = 'ARTELLAPIPE_LAUNCHER_PLUGINS_DCCSELECTOR_MANIFEST'
+
+
+def get_manifest_path():
+    """
+    Returns path of the studio installation manifest. Manifest path can be defined using
+    ARTELLAPIPE_LAUNCHER_PLUGINS_DCCSELECTOR_MANIFEST environment variable. Otherwise a site wide path is used:
+        - Windows: C:/ProgramData/artellapipe/dccs_manifest.json
+        - Other OS: /etc/artellapipe/dccs_manifest.json
+    :return: str
+    """
+
+    manifest_path = os.environ.get(MANIFEST_PATH_ENV, None)
+    if manifest_path:
+        return os.path.normpath(manifest_path)
+
+    if platform.system().lower() == 'windows':
+        program_data = os.environ.get('PROGRAMDATA', 'C:/ProgramData')
+        return os.path.normpath(os.path.join(program_data, 'artellapipe', 'dccs_manifest.json'))
+
+    return os.path.normpath('/etc/artellapipe/dccs_manifest.json')
+
+
+class InstallationManifest(object):
+    """
+    Maps DCCs versions with their executables. Manifest files are JSON files with the following format:
+        {
+            "dccs": {
+                "maya": {"2019": "C:/Program Files/Autodesk/Maya2019/bin/maya.exe"},
+                "houdini": {"18.0": "C:/Program Files/Side Effects Software/Houdini 18.0.499/bin/houdini.exe"}
+            }
+        }
+    """
+
+    def __init__(self, entries=None, manifest_path=None):
+        super(InstallationManifest, self).__init__()
+
+        self._manifest_path = manifest_path
+        self._entries = dict()
+        for dcc_name, versions in (entries or dict()).items():
+            self._entries[self._get_key(dcc_name)] = dict((str(v), path) for v, path in (versions or dict()).items())
+
+    @classmethod
+    def load(cls, manifest_path=None):
+        """
+        Loads manifest from given path. If manifest file does not exist or is not valid, an empty manifest is returned
+        :param manifest_path: str or None, if None, default manifest path is used
+        :return: InstallationManifest
+        """
+
+        manifest_path = manifest_path or get_manifest_path()
+        if not manifest_path or not os.path.isfile(manifest_path):
+            return cls(manifest_path=manifest_path)
+
+        try:
+            with open(manifest_path, 'r') as fh:
+                manifest_data = json.load(fh)
+        except (IOError, OSError, ValueError) as exc:
+            LOGGER.warning('Impossible to read DCCs installation manifest "{}": {}'.format(manifest_path, exc))
+            return cls(manifest_path=manifest_path)
+
+        if not isinstance(manifest_data, dict):
+            LOGGER.warning('DCCs installation manifest "{}" is not valid!'.format(manifest_path))
+            return cls(manifest_path=manifest_path)
+
+        LOGGER.info('Using DCCs installation manifest: {}'.format(manifest_path))
+
+        return cls(entries=manifest_data.get('dccs', manifest_data), manifest_path=manifest_path)
+
+    @property
+    def manifest_path(self):
+        """
+        Returns path of the manifest file
+        :return: str or None
+        """
+
+        return self._manifest_path
+
+    def __bool__(self):
+        return bool(self._entries)
+
+    __nonzero__ = __bool__
+
+    def get_installation_paths(self, dcc_name, versions):
+        """
+        Returns the executables of the given DCC versions that are defined in the manifest. Entries whose
+        executable does not exist are ignored
+        :param dcc_name: str
+        :param versions: list(str)
+        :return: dict(str, str)
+        """
+
+        dcc_entries = self._entries.get(self._get_key(dcc_name), None)
+        if not dcc_entries:
+            return dict()
+
+        installation_paths = dict()
+        for version in versions:
+            executable = dcc_entries.get(version, None)
+            if not executable:
+                continue
+            if not os.path.isfile(executable):
+                LOGGER.warning('{} {} executable defined in installation manifest does not exist: {}'.format(
+                    dcc_name, version, executable))
+                continue
+            installation_paths[version] = executable
+
+        return installation_paths
+
+    @staticmethod
+    def _get_key(dcc_name):
+        """
+        Internal function that returns manifest key of the given DCC
+        :param dcc_name: str
+        :return: str
+        """
+
+        return dcc_name.lower().replace(' ', '')
@@ -0,0 +1,111 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to locate Python modules folders without importing them
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import sys
+import logging
+import threading
+
+try:
+    from importlib.machinery import PathFinder
+except ImportError:
+    import imp
+    PathFinder = None
+
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
+
+_MODULE_PATHS = dict()
+_LOCK = threading.Lock()
+
+
+def get_module_path(module_name):
+    """
+    Returns the folder of the given module: the package folder if the module is a package or the folder that
+    contains the module otherwise. Module specs are used, so neither the module nor its parent packages are
+    imported. Found folders are cached. Modules that are not found are not cached, so they are located again next
+    time (they can be installed while the launcher is opened)
+    :param module_name: str, full name of the module
+    :return: str or None, None if the module is not found
+    """
+
+    with _LOCK:
+        module_path = _MODULE_PATHS.get(module_name, None)
+    if module_path is not None:
+        return module_path
+
+    try:
+        module_path = _find_module_path(module_name)
+    except (ImportError, OSError, ValueError) as exc:
+        LOGGER.debug('Impossible to find module {}: {}'.format(module_name, exc))
+        module_path = None
+
+    if module_path is not None:
+        with _LOCK:
+            _MODULE_PATHS[module_name] = module_path
+
+    return module_path
+
+
+def clear_cache():
+    """
+    Removes cached modules folders
+    """
+
+    with _LOCK:
+        _MODULE_PATHS.clear()
+
+
+def _find_module_path(module_name):
+    """
+    Internal function that finds the folder of the given module, walking its parent packages search locations
+    :param module_name: str
+    :return: str or None
+    """
+
+    search_paths = None
+    module_names = module_name.split('.')
+    for i, name in enumerate(module_names):
+
+        # Already imported packages are not located again
+        imported_module = sys.modules.get('.'.join(module_names[:i + 1]), None)
+        package_paths = getattr(imported_module, '__path__', None)
+        if package_paths is not None:
+            package_paths = list(package_paths)
+            module_path = package_paths[0] if package_paths else None
+        elif PathFinder is not None:
+            spec = PathFinder.find_spec(name, search_paths)
+            if spec is None:
+                return None
+            if spec.submodule_search_locations is not None:
+                package_paths = list(spec.submodule_search_locations)
+                module_path = package_paths[0] if package_paths else None
+            else:
+                module_path = os.path.dirname(spec.origin) if spec.origin else None
+        else:
+            module_file, pathname, description = imp.find_module(name, search_paths)
+            if module_file:
+                module_file.close()
+            if description[2] == imp.PKG_DIRECTORY:
+                package_paths = [pathname]
+                module_path = pathname
+            else:
+                module_path = os.path.dirname(pathname)
+
+        if i == len(module_names) - 1:
+            return module_path
+        if not package_paths:
+            return None
+        search_paths = package_paths
+
+    return None
@@ -0,0 +1,361 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains shared Windows registry access layer used by DCCs discovery
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import time
+import logging
+import threading
+
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
+
+
+class RegistryBackend(object):
+    """
+    Base class for registry backends. Backends read HKEY_LOCAL_MACHINE keys
+    """
+
+    def __init__(self):
+        super(RegistryBackend, self).__init__()
+
+        self.calls = 0
+
+    def list_subkeys(self, key_path):
+        """
+        Returns the names of the subkeys of the given key. If the key does not exist, an empty list is returned
+        :param key_path: str
+        :return: list(str)
+        """
+
+        raise NotImplementedError('list_subkeys function not implemented in {}'.format(self.__class__.__name__))
+
+    def read_values(self, key_path, value_names):
+        """
+        Returns the data of the given values of the given key. Values that do not exist are not returned
+        :param key_path: str
+        :param value_names: list(str)
+        :return: dict(str, object)
+        """
+
+        raise NotImplementedError('read_values function not implemented in {}'.format(self.__class__.__name__))
+
+    def close(self):
+        """
+        Releases backend resources
+        """
+
+        pass
+
+
+class NullRegistryBackend(RegistryBackend):
+    """
+    Backend used in platforms without registry
+    """
+
+    def list_subkeys(self, key_path):
+        return list()
+
+    def read_values(self, key_path, value_names):
+        return dict()
+
+
+class WindowsRegistryBackend(RegistryBackend):
+    """
+    Backend that reads Windows registry. A single connection to HKEY_LOCAL_MACHINE hive is shared by all reads and
+    all opened keys are closed after being read
+    """
+
+    def __init__(self, winreg):
+        super(WindowsRegistryBackend, self).__init__()
+
+        self._winreg = winreg
+        self._hive = None
+        self._lock = threading.Lock()
+
+    def list_subkeys(self, key_path):
+        key = self._open_key(key_path)
+        if key is None:
+            return list()
+
+        subkeys = list()
+        try:
+            index = 0
+            while True:
+                try:
+                    subkeys.append(self._winreg.EnumKey(key, index))
+                except OSError:
+                    break
+                index += 1
+        finally:
+            self._winreg.CloseKey(key)
+
+        return subkeys
+
+    def read_values(self, key_path, value_names):
+        key = self._open_key(key_path)
+        if key is None:
+            return dict()
+
+        values = dict()
+        try:
+            for value_name in value_names:
+                try:
+                    values[value_name] = self._winreg.QueryValueEx(key, value_name)[0]
+                except OSError:
+                    continue
+        finally:
+            self._winreg.CloseKey(key)
+
+        return values
+
+    def close(self):
+        with self._lock:
+            if self._hive is not None:
+                self._winreg.CloseKey(self._hive)
+                self._hive = None
+
+    def _open_key(self, key_path):
+        """
+        Internal function that opens given key of HKEY_LOCAL_MACHINE hive
+        :param key_path: str
+        :return: PyHKEY or None
+        """
+
+        self.calls += 1
+        with self._lock:
+            if self._hive is None:
+                try:
+                    self._hive = self._winreg.ConnectRegistry(None, self._winreg.HKEY_LOCAL_MACHINE)
+                except OSError as exc:
+                    LOGGER.warning('Impossible to connect to Windows registry: {}'.format(exc))
+                    return None
+            hive = self._hive
+
+        try:
+            return self._winreg.OpenKey(hive, key_path)
+        except OSError:
+            return None
+
+
+class FakeRegistryBackend(RegistryBackend):
+    """
+    In-memory registry backend used to test and benchmark registry driven discovery in any platform
+    """
+
+    def __init__(self, keys=None, latency=0.0):
+        """
+        :param keys: dict(str, dict(str, object)), maps key paths with their values
+        :param latency: float, seconds each registry access takes
+        """
+
+        super(FakeRegistryBackend, self).__init__()
+
+        self._latency = latency
+        self._values = dict()
+        self._subkeys = dict()
+        for key_path, values in (keys or dict()).items():
+            self.add_key(key_path, values)
+
+    def add_key(self, key_path, values=None):
+        """
+        Adds a new key (and its parent keys) to the fake registry
+        :param key_path: str
+        :param values: dict(str, object)
+        """
+
+        parts = [p for p in key_path.split('\\') if p]
+        for i in range(len(parts)):
+            parent = _normalize_key('\\'.join(parts[:i]))
+            self._subkeys.setdefault(parent, list())
+            if parts[i] not in self._subkeys[parent]:
+                self._subkeys[parent].append(parts[i])
+            self._values.setdefault(_normalize_key('\\'.join(parts[:i + 1])), dict())
+        self._values[_normalize_key(key_path)].update(values or dict())
+
+    def list_subkeys(self, key_path):
+        self._access()
+        return list(self._subkeys.get(_normalize_key(key_path), list()))
+
+    def read_values(self, key_path, value_names):
+        self._access()
+        key_values = self._values.get(_normalize_key(key_path), dict())
+        return dict((name, key_values[name]) for name in value_names if name in key_values)
+
+    def _access(self):
+        """
+        Internal function that simulates registry access
+        """
+
+        self.calls += 1
+        if self._latency:
+            time.sleep(self._latency)
+
+
+class RegistryReader(object):
+    """
+    Registry reader that memoizes all the reads done through its backend for the process lifetime
+    """
+
+    def __init__(self, backend):
+        super(RegistryReader, self).__init__()
+
+        self._backend = backend
+        self._subkeys = dict()
+        self._values = dict()
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self):
+        """
+        Returns backend used to read registry
+        :return: RegistryBackend
+        """
+
+        return self._backend
+
+    def get_subkeys(self, key_path):
+        """
+        Returns the names of the subkeys of the given key
+        :param key_path: str
+        :return: list(str)
+        """
+
+        cache_key = _normalize_key(key_path)
+        with self._lock:
+            if cache_key in self._subkeys:
+                return list(self._subkeys[cache_key])
+
+        subkeys = self._backend.list_subkeys(key_path)
+        with self._lock:
+            self._subkeys[cache_key] = list(subkeys)
+
+        return list(subkeys)
+
+    def get_values(self, key_path, value_names):
+        """
+        Returns the data of the given values of the given key. All values not read yet are read with a single key
+        access
+        :param key_path: str
+        :param value_names: list(str)
+        :return: dict(str, object)
+        """
+
+        cache_key = _normalize_key(key_path)
+        with self._lock:
+            key_values = self._values.setdefault(cache_key, dict())
+            missing = [name for name in value_names if name not in key_values]
+
+        if missing:
+            values = self._backend.read_values(key_path, missing)
+            with self._lock:
+                for name in missing:
+                    key_values[name] = values.get(name, None)
+
+        return dict((name, key_values[name]) for name in value_names if key_values.get(name) is not None)
+
+    def get_value(self, key_path, value_name):
+        """
+        Returns the data of the given value of the given key
+        :param key_path: str
+        :param value_name: str
+        :return: object or None
+        """
+
+        return self.get_values(key_path, [value_name]).get(value_name, None)
+
+    def read_batch(self, reads):
+        """
+        Reads multiple values at once. Reads of the same key are grouped so each key is accessed only once
+        :param reads: list(tuple(str, str)), list of (key_path, value_name)
+        :return: dict(tuple(str, str), object)
+        """
+
+        keys = dict()
+        for key_path, value_name in reads:
+            keys.setdefault(key_path, list()).append(value_name)
+
+        result = dict()
+        for key_path, value_names in keys.items():
+            for value_name, value in self.get_values(key_path, value_names).items():
+                result[(key_path, value_name)] = value
+
+        return result
+
+    def clear_cache(self):
+        """
+        Clears all memoized reads
+        """
+
+        with self._lock:
+            self._subkeys.clear()
+            self._values.clear()
+
+
+_READER = None
+_READER_LOCK = threading.Lock()
+
+
+def get_reader():
+    """
+    Returns registry reader shared by all DCCs discovery backends
+    :return: RegistryReader
+    """
+
+    global _READER
+    with _READER_LOCK:
+        if _READER is None:
+            _READER = RegistryReader(get_default_backend())
+
+    return _READER
+
+
+def set_backend(backend):
+    """
+    Sets the backend used by the shared registry reader. Memoized reads are discarded
+    :param backend: RegistryBackend or None, if None, default backend of current platform is used
+    :return: RegistryReader
+    """
+
+    global _READER
+    with _READER_LOCK:
+        if _READER is not None:
+            _READER.backend.close()
+        _READER = RegistryReader(backend or get_default_backend())
+
+    return _READER
+
+
+def get_default_backend():
+    """
+    Returns registry backend of current platform
+    :return: RegistryBackend
+    """
+
+    try:
+        import _winreg as winreg
+    except ImportError:
+        try:
+            import winreg
+        except ImportError:
+            return NullRegistryBackend()
+
+    return WindowsRegistryBackend(winreg)
+
+
+def _normalize_key(key_path):
+    """
+    Internal function that returns a normalized version of the given key path. Registry keys are case insensitive
+    :param key_path: str
+    :return: str
+    """
+
+    return '\\'.join(p for p in key_path.replace('/', '\\').split('\\') if p).lower()
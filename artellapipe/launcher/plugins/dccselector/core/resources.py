@@ -0,0 +1,320 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains caches used to reuse decoded resources (icons and pixmaps) across the launcher and the
+resources manifest used to locate plugin icons without hitting the file system
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import json
+import struct
+import logging
+import argparse
+import threading
+from collections import OrderedDict
+
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
+
+DEFAULT_CACHE_SIZE = 128
+MANIFEST_VERSION = 1
+MANIFEST_FILE_NAME = 'resources_manifest.json'
+ICON_EXTENSIONS = ('.png',)
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+class LRUCache(object):
+    """
+    Thread safe least recently used cache. Keeps track of hits and misses so its efficiency can be checked
+    """
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        super(LRUCache, self).__init__()
+
+        self._max_size = max_size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    @property
+    def max_size(self):
+        """
+        Returns the maximum number of items stored by the cache
+        :return: int
+        """
+
+        return self._max_size
+
+    def get(self, key, loader=None):
+        """
+        Returns the cached item of the given key. If the item is not cached and a loader is given, the item is
+        loaded and cached
+        :param key: object, hashable key
+        :param loader: callable or None, function that returns the item of the key
+        :return: object or None
+        """
+
+        with self._lock:
+            if key in self._items:
+                self.hits += 1
+                item = self._items.pop(key)
+                self._items[key] = item
+                return item
+            self.misses += 1
+
+        if loader is None:
+            return None
+
+        item = loader()
+        if item is not None:
+            self.set(key, item)
+
+        return item
+
+    def set(self, key, item):
+        """
+        Stores given item. If the cache is full, least recently used items are discarded
+        :param key: object, hashable key
+        :param item: object
+        """
+
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = item
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all cached items and resets hit and miss counters
+        """
+
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        """
+        Returns cache usage statistics
+        :return: dict
+        """
+
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._items),
+                'hit_rate': self.hits / total if total else 0.0
+            }
+
+
+class ResourcesManifest(object):
+    """
+    Maps plugin icons themes and names with their paths and sizes. Manifest is generated when the package is built
+    and shipped with it, so icons can be located with dictionary lookups:
+        {
+            "version": 1,
+            "icons": {
+                "color": {"maya": {"path": "icons/color/maya.png", "size": [64, 64]}}
+            }
+        }
+    Paths are relative to the resources folder
+    """
+
+    def __init__(self, icons=None, resources_path=None):
+        super(ResourcesManifest, self).__init__()
+
+        self._icons = icons or dict()
+        self._resources_path = resources_path
+
+    @classmethod
+    def load(cls, resources_path, manifest_path=None):
+        """
+        Loads the manifest of the given resources folder. If the manifest file does not exist or is not valid, the
+        manifest is built scanning the resources folder
+        :param resources_path: str
+        :param manifest_path: str or None, if None, manifest located next to resources folder is used
+        :return: ResourcesManifest
+        """
+
+        manifest_path = manifest_path or get_manifest_path(resources_path)
+        try:
+            with open(manifest_path, 'r') as fh:
+                manifest_data = json.load(fh)
+            if manifest_data.get('version') == MANIFEST_VERSION:
+                return cls(icons=manifest_data.get('icons', None), resources_path=resources_path)
+        except (IOError, OSError, ValueError, AttributeError) as exc:
+            LOGGER.debug('Impossible to read resources manifest "{}": {}'.format(manifest_path, exc))
+
+        LOGGER.warning('Resources manifest not found. Scanning resources folder: {}'.format(resources_path))
+
+        return cls(icons=build_manifest(resources_path)['icons'], resources_path=resources_path)
+
+    @property
+    def resources_path(self):
+        """
+        Returns the resources folder the manifest belongs to
+        :return: str or None
+        """
+
+        return self._resources_path
+
+    def has_icon(self, icon_name, theme=''):
+        """
+        Returns whether the given icon is shipped with the plugin
+        :param icon_name: str
+        :param theme: str
+        :return: bool
+        """
+
+        return icon_name in self._icons.get(theme or '', dict())
+
+    def get_icon_path(self, icon_name, theme=''):
+        """
+        Returns the absolute path of the given icon
+        :param icon_name: str
+        :param theme: str
+        :return: str or None
+        """
+
+        icon_data = self._icons.get(theme or '', dict()).get(icon_name, None)
+        if not icon_data:
+            return None
+
+        return os.path.normpath(os.path.join(self._resources_path or '', icon_data['path']))
+
+    def get_icon_size(self, icon_name, theme=''):
+        """
+        Returns the size of the given icon
+        :param icon_name: str
+        :param theme: str
+        :return: tuple(int, int) or None
+        """
+
+        icon_data = self._icons.get(theme or '', dict()).get(icon_name, None)
+        if not icon_data or not icon_data.get('size'):
+            return None
+
+        return tuple(icon_data['size'])
+
+
+def get_manifest_path(resources_path):
+    """
+    Returns the path of the manifest of the given resources folder. Manifest is stored next to the folder
+    :param resources_path: str
+    :return: str
+    """
+
+    return os.path.join(os.path.dirname(os.path.abspath(resources_path)), MANIFEST_FILE_NAME)
+
+
+def get_image_size(image_path):
+    """
+    Returns the size of the given PNG image reading its header
+    :param image_path: str
+    :return: tuple(int, int) or None
+    """
+
+    try:
+        with open(image_path, 'rb') as fh:
+            header = fh.read(24)
+    except (IOError, OSError):
+        return None
+
+    if len(header) < 24 or not header.startswith(PNG_SIGNATURE) or header[12:16] != b'IHDR':
+        return None
+
+    return struct.unpack('>II', header[16:24])
+
+
+def build_manifest(resources_path):
+    """
+    Scans the icons folder of the given resources folder and returns its manifest data
+    :param resources_path: str
+    :return: dict
+    """
+
+    icons = dict()
+    icons_path = os.path.join(resources_path, 'icons')
+    for root, _, files in os.walk(icons_path):
+        theme = os.path.relpath(root, icons_path).replace('\\', '/')
+        theme = '' if theme == '.' else theme
+        for file_name in sorted(files):
+            icon_name, extension = os.path.splitext(file_name)
+            if extension.lower() not in ICON_EXTENSIONS:
+                continue
+            icon_path = os.path.join(root, file_name)
+            icon_size = get_image_size(icon_path)
+            icons.setdefault(theme, dict())[icon_name] = {
+                'path': os.path.relpath(icon_path, resources_path).replace('\\', '/'),
+                'size': list(icon_size) if icon_size else None
+            }
+
+    return {'version': MANIFEST_VERSION, 'icons': icons}
+
+
+def write_manifest(resources_path, manifest_path=None):
+    """
+    Generates the manifest of the given resources folder and writes it into disk
+    :param resources_path: str
+    :param manifest_path: str or None, if None, manifest is stored next to resources folder
+    :return: str, path where manifest was written
+    """
+
+    manifest_path = manifest_path or get_manifest_path(resources_path)
+    with open(manifest_path, 'w') as fh:
+        json.dump(build_manifest(resources_path), fh, indent=4, sort_keys=True)
+        fh.write('\n')
+
+    return manifest_path
+
+
+_MANIFEST = None
+
+
+def get_manifest():
+    """
+    Returns the manifest of the plugin resources. It is loaded the first time is requested
+    :return: ResourcesManifest
+    """
+
+    global _MANIFEST
+    if _MANIFEST is None:
+        _MANIFEST = ResourcesManifest.load(get_resources_path())
+
+    return _MANIFEST
+
+
+def get_resources_path():
+    """
+    Returns the path of the plugin resources folder
+    :return: str
+    """
+
+    return os.path.normpath(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resources'))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Generates artellapipe-launcher-plugins-dccselector resources manifest')
+    parser.add_argument('--resources', default=get_resources_path(), help='Resources folder')
+    parser.add_argument('--output', default=None, help='Manifest path. Stored next to resources folder by default')
+    args = parser.parse_args()
+    print('Resources manifest written: {}'.format(write_manifest(args.resources, args.output)))
@@ -0,0 +1,204 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the index used to search DCCs by name, version and department
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import re
+import threading
+
+NAME_TOKEN = 'name'
+VERSION_TOKEN = 'version'
+DEPARTMENT_TOKEN = 'department'
+WORD_SEPARATORS = ' _-.'
+EXACT_SCORE = 200
+PREFIX_SCORE = 100
+SUBSTRING_SCORE = 60
+
+
+class SearchResult(object):
+    def __init__(self, name, version=None, score=0):
+        super(SearchResult, self).__init__()
+
+        self.name = name
+        self.version = version
+        self.score = score
+
+    def __str__(self):
+        msg = super(SearchResult, self).__str__()
+
+        msg += '\tName: {}\n'.format(self.name)
+        msg += '\tVersion: {}\n'.format(self.version)
+        msg += '\tScore: {}\n'.format(self.score)
+
+        return msg
+
+
+def fuzzy_score(term, token):
+    """
+    Returns how well the given search term matches the given token. Exact, prefix and substring matches score
+    higher than fuzzy (subsequence) matches. Fuzzy matches score higher when matched characters are contiguous or
+    located at the start of words
+    :param term: str, lower case search term
+    :param token: str, lower case token
+    :return: int or None, None if term does not match token
+    """
+
+    if term == token:
+        return EXACT_SCORE
+    position = token.find(term)
+    if position == 0:
+        return PREFIX_SCORE + len(term)
+    elif position > 0:
+        if token[position - 1] in WORD_SEPARATORS:
+            return PREFIX_SCORE + len(term) - 1
+        return SUBSTRING_SCORE + len(term) - position
+
+    score = 0
+    start = 0
+    previous = -2
+    for character in term:
+        index = token.find(character, start)
+        if index < 0:
+            return None
+        score += 5 if index == previous + 1 else 1
+        if index == 0 or token[index - 1] in WORD_SEPARATORS:
+            score += 3
+        previous = index
+        start = index + 1
+
+    return score
+
+
+class SearchIndex(object):
+    """
+    Index of DCCs tokens (name, versions and departments). Index is updated when DCCs change, not when searching.
+    Searches are incremental: when a query extends the previous one, only the previous matches are checked again
+    """
+
+    def __init__(self):
+        super(SearchIndex, self).__init__()
+
+        self._entries = dict()
+        self._order = list()
+        self._generation = 0
+        self._last_query = None
+        self._last_generation = None
+        self._last_candidates = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def update(self, name, versions=None, departments=None):
+        """
+        Adds or updates the tokens of the given DCC
+        :param name: str
+        :param versions: list(str)
+        :param departments: list(str)
+        """
+
+        tokens = [(NAME_TOKEN, name, name.lower())]
+        words = [word for word in re.split('[{}]+'.format(re.escape(WORD_SEPARATORS)), name.lower()) if word]
+        if len(words) > 1:
+            tokens.extend((NAME_TOKEN, name, word) for word in words)
+        tokens.extend((VERSION_TOKEN, str(version), str(version).lower()) for version in versions or list())
+        tokens.extend((DEPARTMENT_TOKEN, department, department.lower()) for department in departments or list())
+
+        with self._lock:
+            if self._entries.get(name) == tokens:
+                return
+            if name not in self._entries:
+                self._order.append(name)
+            self._entries[name] = tokens
+            self._generation += 1
+
+    def remove(self, name):
+        """
+        Removes the given DCC from the index
+        :param name: str
+        """
+
+        with self._lock:
+            if self._entries.pop(name, None) is not None:
+                self._order.remove(name)
+                self._generation += 1
+
+    def clear(self):
+        """
+        Removes all DCCs from the index
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._order = list()
+            self._generation += 1
+
+    def search(self, query):
+        """
+        Returns the DCCs that match the given query, ranked by score. Query is split in terms and all of them must
+        match a token of the DCC. If a term matches a version, that version is returned with the result
+        :param query: str
+        :return: list(SearchResult)
+        """
+
+        terms = query.lower().split()
+        with self._lock:
+            if not terms:
+                self._last_query = None
+                return [SearchResult(name) for name in self._order]
+
+            candidates = self._order
+            extends_last_query = self._last_query is not None and query.lower().startswith(self._last_query)
+            if extends_last_query and self._last_generation == self._generation:
+                candidates = self._last_candidates
+
+            results = list()
+            for name in candidates:
+                result = self._match(name, self._entries[name], terms)
+                if result is not None:
+                    results.append(result)
+
+            self._last_query = query.lower()
+            self._last_generation = self._generation
+            self._last_candidates = [result.name for result in results]
+
+        # Python sort is stable, so DCCs with the same score keep the order they were added with
+        results.sort(key=lambda r: -r.score)
+
+        return results
+
+    def _match(self, name, tokens, terms):
+        """
+        Internal function that matches the given terms against the tokens of a DCC
+        :param name: str
+        :param tokens: list(tuple(str, str, str))
+        :param terms: list(str)
+        :return: SearchResult or None
+        """
+
+        total_score = 0
+        version = None
+        for term in terms:
+            best_score = None
+            best_token = None
+            for token in tokens:
+                score = fuzzy_score(term, token[2])
+                if score is not None and (best_score is None or score > best_score):
+                    best_score = score
+                    best_token = token
+            if best_score is None:
+                return None
+            total_score += best_score
+            if best_token[0] == VERSION_TOKEN:
+                version = best_token[1]
+
+        return SearchResult(name, version=version, score=total_score)
@@ -0,0 +1,162 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the index of project splash images and the disk cache of their scaled and composited versions
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import hashlib
+import logging
+
+from artellapipe.launcher.plugins.dccselector.core import cache
+
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
+
+SPLASH_SIZE = (800, 270)
+SPLASH_PREFIX = 'splash'
+
+
+def get_splash_cache_dir():
+    """
+    Returns folder where scaled splash images are stored. It is located next to the discovery cache
+    :return: str
+    """
+
+    return os.path.join(os.path.dirname(cache.get_cache_path()), 'artellapipe-launcher-plugins-dccselector-splash')
+
+
+class SplashIndex(cache.JsonCache):
+    """
+    Stores the splash images of each splash folder. Folders are only listed again when their modification time
+    changes (a splash image is added or removed)
+    """
+
+    DATA_KEY = 'splash'
+
+    def __init__(self, cache_path=None):
+        super(SplashIndex, self).__init__(
+            cache_path=cache_path or os.path.join(get_splash_cache_dir(), 'index.json'))
+
+    def get_splash_files(self, splash_dir):
+        """
+        Returns the paths of the splash images located in the given folder
+        :param splash_dir: str
+        :return: list(str)
+        """
+
+        try:
+            dir_mtime = os.stat(splash_dir).st_mtime
+        except OSError:
+            return list()
+
+        with self._lock:
+            entry = self._load().get(splash_dir, None)
+            if entry and entry.get('mtime') == dir_mtime:
+                return list(entry.get('files') or list())
+
+        try:
+            file_names = sorted(os.listdir(splash_dir))
+        except OSError:
+            return list()
+        splash_files = [os.path.join(splash_dir, file_name) for file_name in file_names if
+                        file_name.startswith(SPLASH_PREFIX) and os.path.isfile(os.path.join(splash_dir, file_name))]
+
+        with self._lock:
+            self._load()[splash_dir] = {'mtime': dir_mtime, 'files': splash_files}
+            self._dirty = True
+
+        return splash_files
+
+
+def get_scaled_splash_path(source_path, size=SPLASH_SIZE, cache_dir=None):
+    """
+    Returns the path where the scaled version of the given splash image is cached. Path depends on the source path,
+    its modification time and the size, so cached images are not used anymore once the source image changes
+    :param source_path: str
+    :param size: tuple(int, int)
+    :param cache_dir: str or None, if None, default splash cache folder is used
+    :return: str or None, None if source image does not exist
+    """
+
+    try:
+        source_mtime = os.stat(source_path).st_mtime
+    except OSError:
+        return None
+
+    return os.path.join(cache_dir or get_splash_cache_dir(), '{}_{}x{}_{}.png'.format(
+        _get_path_hash(source_path), size[0], size[1], int(source_mtime)))
+
+
+def get_composited_splash_path(source_path, project_name, dcc_name, size=SPLASH_SIZE, cache_dir=None,
+                               icon_paths=None):
+    """
+    Returns the path where the splash of the given project and DCC, composited over the given splash image, is
+    cached. Path depends on the source image, the icons painted over it and their modification times, so cached
+    splash is not used anymore once the source image or any of the icons change
+    :param source_path: str
+    :param project_name: str
+    :param dcc_name: str
+    :param size: tuple(int, int)
+    :param cache_dir: str or None, if None, default splash cache folder is used
+    :param icon_paths: list(str) or None, paths of the icons painted over the splash image
+    :return: str or None, None if source image does not exist
+    """
+
+    scaled_path = get_scaled_splash_path(source_path, size=size, cache_dir=cache_dir)
+    if not scaled_path:
+        return None
+
+    scaled_dir, scaled_name = os.path.split(scaled_path)
+    path_hash, size_name, mtime_name = os.path.splitext(scaled_name)[0].split('_')
+    icon_names = list()
+    for icon_path in icon_paths or list():
+        try:
+            icon_mtime = os.stat(icon_path).st_mtime
+        except OSError:
+            icon_mtime = None
+        icon_names.append('{}:{}'.format(icon_path, icon_mtime))
+    composited_name = '{}|{}|{}|{}'.format(path_hash, project_name, dcc_name, '|'.join(icon_paths or list()))
+    composited_hash = hashlib.md5(composited_name.encode('utf-8')).hexdigest()
+    icons_hash = hashlib.md5('|'.join(icon_names).encode('utf-8')).hexdigest()[:8]
+
+    # Modification times are stored at the end of the name, so outdated versions are found by clean_scaled_splash
+    return os.path.join(scaled_dir, '{}_{}_{}-{}.png'.format(composited_hash, size_name, mtime_name, icons_hash))
+
+
+def clean_scaled_splash(scaled_path):
+    """
+    Removes the outdated cached versions (same source image and size) of the given scaled or composited splash image
+    :param scaled_path: str
+    """
+
+    cache_dir, scaled_name = os.path.split(scaled_path)
+    prefix = '{}_'.format(scaled_name.rsplit('_', 1)[0])
+    try:
+        file_names = os.listdir(cache_dir)
+    except OSError:
+        return
+
+    for file_name in file_names:
+        if file_name.startswith(prefix) and file_name != scaled_name:
+            try:
+                os.remove(os.path.join(cache_dir, file_name))
+            except OSError as exc:
+                LOGGER.debug('Impossible to remove outdated splash image "{}": {}'.format(file_name, exc))
+
+
+def _get_path_hash(file_path):
+    """
+    Internal function that returns a hash of the given path, used to name cached files
+    :param file_path: str
+    :return: str
+    """
+
+    return hashlib.md5(os.path.normcase(os.path.abspath(file_path)).encode('utf-8')).hexdigest()
@@ -0,0 +1,304 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains watcher used to detect DCCs installed or uninstalled while the launcher is opened
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import time
+import errno
+import struct
+import select
+import logging
+import platform
+import threading
+
+from artellapipe.launcher.plugins.dccselector.core import cache
+
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
+
+DEFAULT_POLL_INTERVAL = 30.0
+DEFAULT_SETTLE_TIME = 10.0
+
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_ONLYDIR = 0x01000000
+WATCH_MASK = IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class PollingBackend(object):
+    """
+    Detects install roots changes comparing their modification time periodically
+    """
+
+    name = 'polling'
+
+    def __init__(self, roots, interval=DEFAULT_POLL_INTERVAL):
+        super(PollingBackend, self).__init__()
+
+        self._interval = interval
+        self._fingerprints = dict((root, cache.fingerprint_roots([root])) for root in roots)
+
+    def wait(self, timeout, stop_event):
+        """
+        Waits until install roots change, the given timeout expires or watcher is stopped
+        :param timeout: float
+        :param stop_event: threading.Event
+        :return: list(str), changed roots
+        """
+
+        stop_event.wait(min(timeout, self._interval))
+
+        return self.poll()
+
+    def poll(self):
+        """
+        Returns the roots whose fingerprint changed since last poll
+        :return: list(str)
+        """
+
+        changed = list()
+        for root, fingerprint in self._fingerprints.items():
+            new_fingerprint = cache.fingerprint_roots([root])
+            if new_fingerprint != fingerprint:
+                self._fingerprints[root] = new_fingerprint
+                changed.append(root)
+
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifyBackend(object):
+    """
+    Detects install roots changes using Linux inotify. Roots that cannot be watched (because they do not exist yet)
+    are polled
+    """
+
+    name = 'inotify'
+
+    def __init__(self, roots, interval=DEFAULT_POLL_INTERVAL):
+        super(InotifyBackend, self).__init__()
+
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        self._watches = dict()
+        unwatched_roots = list()
+        for root in roots:
+            wd = self._libc.inotify_add_watch(self._fd, root.encode('utf-8'), WATCH_MASK | IN_ONLYDIR)
+            if wd < 0:
+                unwatched_roots.append(root)
+            else:
+                self._watches[wd] = root
+        self._polling = PollingBackend(unwatched_roots, interval=interval)
+        self._interval = interval
+
+    def wait(self, timeout, stop_event):
+        """
+        Waits until install roots change, the given timeout expires or watcher is stopped
+        :param timeout: float
+        :param stop_event: threading.Event
+        :return: list(str), changed roots
+        """
+
+        end_time = time.time() + min(timeout, self._interval)
+        changed = list()
+        while not changed and not stop_event.is_set():
+            remaining = end_time - time.time()
+            if remaining <= 0:
+                break
+            try:
+                readable, _, _ = select.select([self._fd], [], [], min(remaining, 0.5))
+            except (OSError, select.error) as exc:
+                if exc.args and exc.args[0] == errno.EINTR:
+                    continue
+                raise
+            if readable:
+                changed.extend(self._read_events())
+
+        for root in self._polling.poll():
+            if root not in changed:
+                changed.append(root)
+
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _read_events(self):
+        """
+        Internal function that reads pending inotify events and returns the roots they belong to
+        :return: list(str)
+        """
+
+        changed = list()
+        try:
+            data = os.read(self._fd, 65536)
+        except OSError as exc:
+            if exc.errno == errno.EAGAIN:
+                return changed
+            raise
+
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, _, _, name_length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size + name_length
+            root = self._watches.get(wd, None)
+            if root and root not in changed:
+                changed.append(root)
+
+        return changed
+
+
+class InstallRootsWatcher(object):
+    """
+    Watches the install roots of the DCCs and calls the given callback with the name of each DCC whose install roots
+    changed. Changes are notified once the install roots stop changing for a while (settle time), so installers
+    have time to finish
+    """
+
+    def __init__(self, callback, interval=DEFAULT_POLL_INTERVAL, settle_time=DEFAULT_SETTLE_TIME, use_inotify=True):
+        super(InstallRootsWatcher, self).__init__()
+
+        self._callback = callback
+        self._interval = interval
+        self._settle_time = settle_time
+        self._use_inotify = use_inotify
+        self._roots = dict()
+        self._backend = None
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    @property
+    def backend_name(self):
+        """
+        Returns the name of the backend used to detect changes
+        :return: str or None
+        """
+
+        return self._backend.name if self._backend else None
+
+    def watch(self, dcc_name, roots):
+        """
+        Adds the install roots of the given DCC to the watcher. Must be called before starting the watcher
+        :param dcc_name: str
+        :param roots: list(str)
+        """
+
+        for root in roots:
+            dcc_names = self._roots.setdefault(os.path.normpath(root), list())
+            if dcc_name not in dcc_names:
+                dcc_names.append(dcc_name)
+
+    def is_running(self):
+        """
+        Returns whether watcher is running or not
+        :return: bool
+        """
+
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """
+        Starts watching install roots in a background thread
+        """
+
+        if self.is_running() or not self._roots:
+            return
+
+        self._stop_event.clear()
+        self._backend = self._create_backend()
+        LOGGER.debug('Watching DCCs install roots using {} backend: {}'.format(
+            self._backend.name, list(self._roots.keys())))
+        self._thread = threading.Thread(target=self._run, name='DCCSelectorWatcher')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops watching install roots
+        """
+
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+
+    def _create_backend(self):
+        """
+        Internal function that creates the backend used to detect install roots changes
+        :return: InotifyBackend or PollingBackend
+        """
+
+        roots = list(self._roots.keys())
+        if self._use_inotify and platform.system().lower() == 'linux':
+            try:
+                return InotifyBackend(roots, interval=self._interval)
+            except (OSError, AttributeError) as exc:
+                LOGGER.debug('inotify is not available, polling DCCs install roots: {}'.format(exc))
+
+        return PollingBackend(roots, interval=self._interval)
+
+    def _run(self):
+        """
+        Internal function that waits for install roots changes and notifies them once they settle
+        """
+
+        changed_roots = dict()
+        while not self._stop_event.is_set():
+            timeout = self._interval
+            if changed_roots:
+                timeout = max(0.0, min(changed_roots.values()) + self._settle_time - time.time())
+            try:
+                roots = self._backend.wait(timeout, self._stop_event)
+            except Exception as exc:
+                LOGGER.warning('Error while watching DCCs install roots: {}'.format(exc))
+                return
+
+            now = time.time()
+            for root in roots:
+                changed_roots[root] = now
+
+            settled_roots = [root for root, t in changed_roots.items() if now - t >= self._settle_time]
+            dcc_names = list()
+            for root in settled_roots:
+                changed_roots.pop(root)
+                for dcc_name in self._roots.get(root, list()):
+                    if dcc_name not in dcc_names:
+                        dcc_names.append(dcc_name)
+
+            for dcc_name in dcc_names:
+                if self._stop_event.is_set():
+                    return
+                try:
+                    self._callback(dcc_name)
+                except Exception as exc:
+                    LOGGER.warning('Error while updating {} installations: {}'.format(dcc_name, exc))
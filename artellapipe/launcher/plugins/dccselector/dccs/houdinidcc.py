@@ -13,70 +13,36 @@ __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
 import os
-import platform
 import subprocess
 import logging
 
 from tpDcc.libs.qt.core import qtutils
 
-LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
-
-
-DEFAULT_DCC = 'houdini.exe'
-
-
-def get_executables_from_installation_path(installation_path):
-    """
-    Returns Houdini executable from its installation path
-    :param installation_path: str
-    """
-
-    if os.path.exists(installation_path):
-        bin_path = os.path.join(installation_path, 'bin')
-
-        if not os.path.exists(bin_path):
-            return None
-        houdini_files = os.listdir(bin_path)
-        if DEFAULT_DCC in houdini_files:
-            return os.path.join(bin_path, DEFAULT_DCC)
+from artellapipe.launcher.plugins.dccselector.core import descriptors
 
-    return None
-
-
-def get_installation_paths(houdini_versions):
-    """
-    Returns the installation folder of Houdini
-    :return:
-    """
-
-    versions = dict()
-    locations = dict()
-
-    if platform.system().lower() == 'windows':
-        try:
-            from _winreg import ConnectRegistry, OpenKey, QueryValueEx, HKEY_LOCAL_MACHINE
-            for houdini_version in houdini_versions:
-                a_reg = ConnectRegistry(None, HKEY_LOCAL_MACHINE)
-                a_key = OpenKey(a_reg, r"SOFTWARE\Side Effects Software\Houdini {}".format(houdini_version))
-                value = QueryValueEx(a_key, 'InstallPath')
-                houdini_location = value[0]
-                locations['{}'.format(houdini_version)] = houdini_location
-        except Exception:
-            pass
-
-    if not locations:
-        LOGGER.warning('Houdini installations not found in your computer. Maya cannot be launched!')
-        return None
-
-    for houdini_version, houdini_location in locations.items():
-        houdini_executable = get_executables_from_installation_path(houdini_location)
-        if houdini_executable is None or not os.path.isfile(houdini_executable):
-            LOGGER.warning('Houdini {} installation path: {} is not valid!'.format(houdini_version, houdini_location))
-            continue
+LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
 
-        versions['{}'.format(houdini_version)] = houdini_executable
 
-    return versions
+DESCRIPTOR = descriptors.DccDescriptor(
+    name='Houdini',
+    search_roots={
+        'windows': ['C:/Program Files/Side Effects Software'],
+        'linux': ['/opt']
+    },
+    folder_patterns={
+        'windows': r'^Houdini (?P<version>\d+\.\d+(\.\d+)?)$',
+        'linux': r'^hfs(?P<version>\d+\.\d+(\.\d+)?)$'
+    },
+    executables={
+        'windows': ['bin/houdini.exe'],
+        'linux': ['bin/houdini']
+    },
+    registry_lookups=[
+        descriptors.RegistryLookup(
+            r'SOFTWARE\Side Effects Software', r'^Houdini (?P<version>\d+\.\d+(\.\d+)?)$',
+            value_name='InstallPath')
+    ]
+)
 
 
 def launch(exec_, setup_path):
@@ -100,8 +66,10 @@ def launch(exec_, setup_path):
     for k, v in os.environ.items():
         curr_env[k] = str(v)
 
-    curr_env['HOUDINI_PATH'] = '{};&'.format(setup_path)
+    # & is Houdini default path, it must be appended with the separator of the current OS
+    curr_env['HOUDINI_PATH'] = '{}{}&'.format(setup_path, os.pathsep)
 
-    hou_cmd = '"{}" waitforui "{}"'.format(exec_, script_file)
+    # Arguments are passed as a list, so they are not parsed by a shell in any OS
+    hou_cmd = [exec_, 'waitforui', script_file]
 
     subprocess.Popen(hou_cmd, close_fds=True, env=curr_env)
@@ -12,27 +12,18 @@ __license__ = "MIT"
 __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
-import os
-import platform
-
-
-DEFAULT_DCC = 'photoshop.exe'
-
-
-def get_executables_from_installation_path(installation_path):
-    """
-    Returns Maya executable from its installation path
-    :param installation_path: str
-    """
-
-    return None
-
-
-def get_installation_paths(photoshop_versions):
-    """
-    Returns the installation paths folder where Photoshop is located in the user computer
-    :param photoshop_versions: list(str)
-    :return: str
-    """
-
-    return {'2018': 'C://Program Files//Adobe//Adobe Photoshop CC 2018//Photoshop.exe'}
+from artellapipe.launcher.plugins.dccselector.core import descriptors
+
+
+DESCRIPTOR = descriptors.DccDescriptor(
+    name='Photoshop',
+    search_roots={
+        'windows': ['C:/Program Files/Adobe']
+    },
+    folder_patterns={
+        'windows': r'^Adobe Photoshop (CC )?(?P<version>\d{4})$'
+    },
+    executables={
+        'windows': ['Photoshop.exe']
+    }
+)
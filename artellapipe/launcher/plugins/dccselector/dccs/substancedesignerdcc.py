@@ -12,29 +12,18 @@ __license__ = "MIT"
 __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
-import os
-import platform
-
-
-DEFAULT_DCC = 'painter.exe'
-
-
-def get_executables_from_installation_path(installation_path):
-    """
-    Returns Substance Designer executable from its installation path
-    :param installation_path: str
-    """
-
-    return None
-
-
-def get_installation_paths(designer_versions):
-    """
-    Returns the installation folder of Substance Designer
-    :param designer_versions: list(str)
-    :return:
-    """
-
-    versions = dict()
-
-    return {'4R8': 'C://Program Files//Pixologic//ZBrush 4R8//ZBrush.exe'}
+from artellapipe.launcher.plugins.dccselector.core import descriptors
+
+
+DESCRIPTOR = descriptors.DccDescriptor(
+    name='Substance Designer',
+    search_roots={
+        'windows': ['C:/Program Files/Allegorithmic']
+    },
+    folder_patterns={
+        'windows': r'^Substance Designer( (?P<version>[\w.]+))?$'
+    },
+    executables={
+        'windows': ['Substance Designer.exe', 'designer.exe']
+    }
+)
@@ -12,29 +12,18 @@ __license__ = "MIT"
 __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
-import os
-import platform
-
-
-DEFAULT_DCC = 'painter.exe'
-
-
-def get_executables_from_installation_path(installation_path):
-    """
-    Returns Substance Painter executable from its installation path
-    :param installation_path: str
-    """
-
-    return None
-
-
-def get_installation_paths(painter_versions):
-    """
-    Returns the installation folder of Substance Painter
-    :param painter_versions: list(str)
-    :return:
-    """
-
-    versions = dict()
-
-    return {'4R8': 'C://Program Files//Pixologic//ZBrush 4R8//ZBrush.exe'}
+from artellapipe.launcher.plugins.dccselector.core import descriptors
+
+
+DESCRIPTOR = descriptors.DccDescriptor(
+    name='Substance Painter',
+    search_roots={
+        'windows': ['C:/Program Files/Allegorithmic']
+    },
+    folder_patterns={
+        'windows': r'^Substance Painter( (?P<version>[\w.]+))?$'
+    },
+    executables={
+        'windows': ['Substance Painter.exe', 'painter.exe']
+    }
+)
@@ -14,31 +14,58 @@ __email__ = "tpovedatd@gmail.com"
 
 import os
 import sys
-import time
 import random
 import logging
-import argparse
+import threading
 import importlib
 from distutils import util
 
 from Qt.QtCore import *
 from Qt.QtWidgets import *
+from Qt.QtGui import *
 
 from tpDcc.libs.python import path as path_utils
 
 import tpDcc
-from tpDcc.libs.qt.core import base, qtutils
-from tpDcc.libs.qt.widgets import grid
+from tpDcc.libs.qt.core import qtutils
 
 from artellapipe.utils import exceptions
 from artellapipe.launcher.core import defines, plugin
+from artellapipe.launcher.plugins.dccselector import dccs
+from artellapipe.launcher.plugins.dccselector.core import cache, discovery, descriptors, environment, manifest, registry
+from artellapipe.launcher.plugins.dccselector.core import launch, links, modules, resources, search, splash, watcher
 
 LOGGER = logging.getLogger('artellapipe-launcher-plugins-dccselector')
 
+DCC_DISCOVERY_TIMEOUT_ATTRIBUTE_NAME = 'discovery_timeout'
+DEFAULT_DEPARTMENT = 'All'
+LAST_DEPARTMENT_SETTING = 'last_department'
+DCC_ITEM_WIDTH = 105
+DCC_ITEM_TITLE_HEIGHT = 20
+DCC_ITEM_ICON_SIZE = 100
+DCC_ITEM_VERSION_HEIGHT = 22
+DCC_ITEM_SPACING = 5
+SPLASH_ICON_SIZE = 48
+SPLASH_BADGE_SIZE = 52
+SPLASH_ICON_THEME = 'color'
+
+# Splash widgets are styled by object name with a single stylesheet applied to the splash, so Qt polishes them with
+# the stylesheet of their top level widget instead of parsing a stylesheet per widget. Selector widgets have no
+# stylesheet: DCC items are painted by DccDelegate, which handles their hover state
+STYLESHEET = """
+QLabel#dccSplashText {
+    background-color: rgba(0, 0, 0, 180);
+    color: white;
+}
+"""
+
+# Decoded icons and pixmaps are shared by all the DCC selectors and splash screens of the process
+ICONS_CACHE = resources.LRUCache(max_size=resources.DEFAULT_CACHE_SIZE)
+
 
 class DccData(object):
     def __init__(self, name, icon, enabled, default_version, supported_versions,
-                 installation_paths, departments, plugins, launch_fn=None):
+                 installation_paths, departments, plugins, launch_fn=None, discovery_timeout=None):
         super(DccData, self).__init__()
 
         self.name = name
@@ -50,6 +77,7 @@ class DccData(object):
         self.departments = departments
         self.plugins = plugins
         self.launch_fn = launch_fn
+        self.discovery_timeout = discovery_timeout
 
     def __str__(self):
         msg = super(DccData, self).__str__()
@@ -63,92 +91,563 @@ class DccData(object):
         msg += '\tDepartments: {}\n'.format(self.departments)
         msg += '\tPlugins: {}\n'.format(self.plugins)
         msg += '\tLaunch Function: {}\n'.format(self.launch_fn)
+        msg += '\tDiscovery Timeout: {}\n'.format(self.discovery_timeout)
 
         return msg
 
 
-class DCCButton(base.BaseWidget, object):
+def get_icon(icon_name, theme=''):
+    """
+    Returns the icon with the given name. Icons shipped with the plugin are loaded from the path stored in the
+    resources manifest. Icons are only loaded once per process
+    :param icon_name: str
+    :param theme: str
+    :return: QIcon
+    """
 
-    clicked = Signal(str, str)
+    def _load_icon():
+        icon_path = resources.get_manifest().get_icon_path(icon_name, theme=theme)
+        if icon_path:
+            return QIcon(icon_path)
+        return tpDcc.ResourcesMgr().icon(icon_name, theme=theme)
 
-    def __init__(self, dcc, parent=None):
-        self._dcc = dcc
-        super(DCCButton, self).__init__(parent=parent)
+    return ICONS_CACHE.get(('icon', theme, icon_name, None), _load_icon)
 
-    @property
-    def name(self):
+
+def get_icon_path(icon_name, theme=''):
+    """
+    Returns the path of the icon with the given name. Icons shipped with the plugin are retrieved from the resources
+    manifest, other icons are resolved by the resources manager
+    :param icon_name: str
+    :param theme: str
+    :return: str or None
+    """
+
+    icon_path = resources.get_manifest().get_icon_path(icon_name, theme=theme)
+    if icon_path:
+        return icon_path
+
+    return tpDcc.ResourcesMgr().get('icons', theme, '{}.png'.format(icon_name)) or None
+
+
+def get_pixmap(icon_name, size, theme=''):
+    """
+    Returns a pixmap of the icon with the given name with the given size. Pixmaps are only rendered once per process
+    :param icon_name: str
+    :param size: int
+    :param theme: str
+    :return: QPixmap
+    """
+
+    def _load_pixmap():
+        icon = get_icon(icon_name, theme=theme)
+        return icon.pixmap(icon.actualSize(QSize(size, size)))
+
+    return ICONS_CACHE.get(('pixmap', theme, icon_name, size), _load_pixmap)
+
+
+def get_dcc_icon_name(dcc_data):
+    """
+    Returns the theme and the name of the icon of the given DCC
+    :param dcc_data: DccData
+    :return: tuple(str, str)
+    """
+
+    dcc_name = dcc_data.name.lower().replace(' ', '_')
+    dcc_icon = dcc_data.icon or ''
+    icon_split = dcc_icon.split('/')
+    if len(icon_split) == 1 and icon_split[0]:
+        return '', icon_split[0]
+    elif len(icon_split) > 1:
+        return icon_split[0], icon_split[1]
+
+    return 'color', dcc_name
+
+
+def get_dcc_icon_key(dcc_data):
+    """
+    Returns the key used to store the icon of the given DCC in icons cache
+    :param dcc_data: DccData
+    :return: tuple
+    """
+
+    theme, icon_name = get_dcc_icon_name(dcc_data)
+
+    return 'dcc_icon', theme, icon_name, None
+
+
+def get_dcc_pixmap_key(dcc_data, size):
+    """
+    Returns the key used to store the pixmap of the given DCC with the given size in icons cache
+    :param dcc_data: DccData
+    :param size: int
+    :return: tuple
+    """
+
+    theme, icon_name = get_dcc_icon_name(dcc_data)
+
+    return 'dcc_pixmap', theme, icon_name, size
+
+
+def get_dcc_icon(dcc_data):
+    """
+    Returns the icon of the given DCC. If DCC icon is not found, Artella icon is returned
+    :param dcc_data: DccData
+    :return: QIcon
+    """
+
+    theme, icon_name = get_dcc_icon_name(dcc_data)
+
+    def _load_dcc_icon():
+        # Icons shipped with the plugin are checked with a manifest lookup. Only icons provided by other resources
+        # (projects) need to be resolved by the resources manager
+        if not resources.get_manifest().has_icon(icon_name, theme=theme):
+            icon_path = tpDcc.ResourcesMgr().get('icons', theme, '{}.png'.format(icon_name))
+            if not icon_path or not os.path.isfile(icon_path):
+                return get_icon('artella')
+        return get_icon(icon_name, theme=theme)
+
+    return ICONS_CACHE.get(get_dcc_icon_key(dcc_data), _load_dcc_icon)
+
+
+def get_dcc_pixmap(dcc_data, size):
+    """
+    Returns a pixmap of the icon of the given DCC with the given size
+    :param dcc_data: DccData
+    :param size: int
+    :return: QPixmap
+    """
+
+    def _load_pixmap():
+        icon = get_dcc_icon(dcc_data)
+        return icon.pixmap(icon.actualSize(QSize(size, size)))
+
+    return ICONS_CACHE.get(get_dcc_pixmap_key(dcc_data, size), _load_pixmap)
+
+
+def decode_image(image_path, size):
+    """
+    Decodes the given image directly with the given size, so it does not need to be scaled when painted. Returns
+    a QImage, so it can be called from any thread
+    :param image_path: str
+    :param size: int
+    :return: QImage or None
+    """
+
+    image_reader = QImageReader(image_path)
+    image_size = image_reader.size()
+    if image_size.isValid():
+        image_reader.setScaledSize(image_size.scaled(QSize(size, size), Qt.KeepAspectRatio))
+    image = image_reader.read()
+    if image.isNull():
+        LOGGER.warning('Impossible to decode image "{}": {}'.format(image_path, image_reader.errorString()))
+        return None
+
+    return image
+
+
+class IconDecodeTask(QRunnable, object):
+    """
+    Task that decodes a DCC icon in a thread of the icons decode pool
+    """
+
+    def __init__(self, dcc_name, icon_path, size, callback):
         """
-        Returns the name of the DCC
-        :return: str
+        :param dcc_name: str
+        :param icon_path: str
+        :param size: int
+        :param callback: callable, called with DCC name, size and decoded QImage once the icon is decoded
         """
 
-        return self._name
+        super(IconDecodeTask, self).__init__()
 
-    def ui(self):
-        super(DCCButton, self).ui()
-
-        dcc_name = self._dcc.name.lower().replace(' ', '_')
-        dcc_icon = self._dcc.icon
-        icon_split = dcc_icon.split('/')
-        if len(icon_split) == 1:
-            theme = ''
-            icon_name = icon_split[0]
-        elif len(icon_split) > 1:
-            theme = icon_split[0]
-            icon_name = icon_split[1]
+        self._dcc_name = dcc_name
+        self._icon_path = icon_path
+        self._size = size
+        self._callback = callback
+
+    def run(self):
+        try:
+            image = decode_image(self._icon_path, self._size)
+        except Exception as exc:
+            LOGGER.warning('Impossible to decode icon "{}": {}'.format(self._icon_path, exc))
+            return
+        if image is not None:
+            self._callback(self._dcc_name, self._size, image)
+
+
+class DccsModel(QAbstractListModel, object):
+    """
+    Model that stores all the DCCs shown by the selector. Each DCC is stored only once, no matter in how many
+    departments it is shown
+    """
+
+    NameRole = Qt.UserRole + 1
+    DepartmentsRole = Qt.UserRole + 2
+    VersionsRole = Qt.UserRole + 3
+    VersionRole = Qt.UserRole + 4
+    DiscoveringRole = Qt.UserRole + 5
+    VisibleRole = Qt.UserRole + 6
+    SearchRankRole = Qt.UserRole + 7
+
+    # Qt enums are slow to look up in some Qt bindings and data and flags are called for each row every time
+    # proxies filter or sort, so Qt roles and flags are only looked up once
+    DisplayRole = Qt.DisplayRole
+    DecorationRole = Qt.DecorationRole
+    NoItemFlags = Qt.NoItemFlags
+    ItemFlags = Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def __init__(self, parent=None):
+        super(DccsModel, self).__init__(parent)
+
+        self._dccs = list()
+        self._rows = dict()
+        self._versions = dict()
+        self._discovering = set()
+        self._search_ranks = None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return len(self._dccs)
+
+    def flags(self, index):
+        if not index.isValid():
+            return self.NoItemFlags
+
+        dcc_data = self._dccs[index.row()]
+        if dcc_data.name in self._discovering:
+            return self.NoItemFlags
+
+        return self.ItemFlags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._dccs):
+            return None
+
+        dcc_data = self._dccs[index.row()]
+        if role == self.DisplayRole:
+            return dcc_data.name.title()
+        elif role == self.DecorationRole:
+            return get_dcc_icon(dcc_data)
+        elif role == self.NameRole:
+            return dcc_data.name
+        elif role == self.DepartmentsRole:
+            return dcc_data.departments
+        elif role == self.VersionsRole:
+            return self.get_versions(dcc_data)
+        elif role == self.VersionRole:
+            return self.get_version(dcc_data)
+        elif role == self.DiscoveringRole:
+            return dcc_data.name in self._discovering
+        elif role == self.VisibleRole:
+            if self._search_ranks is not None and dcc_data.name not in self._search_ranks:
+                return False
+            return dcc_data.name in self._discovering or bool(dcc_data.installation_paths)
+        elif role == self.SearchRankRole:
+            if self._search_ranks is None:
+                return index.row()
+            return self._search_ranks.get(dcc_data.name, len(self._dccs) + index.row())
+
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role not in (Qt.EditRole, self.VersionRole):
+            return False
+
+        dcc_data = self._dccs[index.row()]
+        if value not in self.get_versions(dcc_data):
+            return False
+
+        self._versions[dcc_data.name] = value
+        self.dataChanged.emit(index, index)
+
+        return True
+
+    def get_dcc(self, dcc_name):
+        """
+        Returns data of the DCC with the given name
+        :param dcc_name: str
+        :return: DccData or None
+        """
+
+        row = self._rows.get(dcc_name, None)
+
+        return self._dccs[row] if row is not None else None
+
+    def set_version(self, dcc_name, version):
+        """
+        Selects the given version of the given DCC
+        :param dcc_name: str
+        :param version: str
+        :return: bool, True if the version was selected
+        """
+
+        row = self._rows.get(dcc_name, None)
+        if row is None:
+            return False
+
+        return self.setData(self.index(row, 0), version, self.VersionRole)
+
+    def set_search_results(self, search_results):
+        """
+        Sets the results of the current search. Only DCCs that match the search are visible, ranked by score
+        :param search_results: list(search.SearchResult) or None, if None, search is cleared and all DCCs are visible
+        """
+
+        if search_results is None:
+            self._search_ranks = None
         else:
-            theme = 'color'
-            icon_name = dcc_name
+            self._search_ranks = dict((result.name, rank) for rank, result in enumerate(search_results))
 
-        icon_path = tpDcc.ResourcesMgr().get('icons', theme, '{}.png'.format(icon_name))
-        if not os.path.isfile(icon_path):
-            icon_path = tpDcc.ResourcesMgr().get('icons', theme, '{}.png'.format(icon_name))
-            if not os.path.isfile(icon_path):
-                dcc_icon = tpDcc.ResourcesMgr().icon('artella')
+        if self._dccs:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._dccs) - 1, 0))
+
+    def add_dcc(self, dcc_data, discovering=False):
+        """
+        Adds given DCC to the model. If the DCC is already added, its data is updated
+        :param dcc_data: DccData
+        :param discovering: bool, whether DCC discovery is still running or not
+        """
+
+        self.add_dccs([dcc_data], discovering=[dcc_data.name] if discovering else None)
+
+    def add_dccs(self, dccs_data, discovering=None):
+        """
+        Adds given DCCs to the model. All new DCCs are inserted at once, so views and proxies are only updated once.
+        DCCs that are already added (for example, when DCCs are loaded again) are replaced by the given data
+        :param dccs_data: list(DccData)
+        :param discovering: list(str) or None, names of the DCCs whose discovery is still running
+        """
+
+        discovering = set(discovering or list())
+        new_dccs = list()
+        new_rows = dict()
+        updated_rows = list()
+        for dcc_data in dccs_data:
+            row = self._rows.get(dcc_data.name, None)
+            if row is not None:
+                self._dccs[row] = dcc_data
+                updated_rows.append(row)
+            elif dcc_data.name in new_rows:
+                new_dccs[new_rows[dcc_data.name]] = dcc_data
+            else:
+                new_rows[dcc_data.name] = len(new_dccs)
+                new_dccs.append(dcc_data)
+            if dcc_data.name in discovering:
+                self._discovering.add(dcc_data.name)
             else:
-                dcc_icon = tpDcc.ResourcesMgr().icon(icon_name, theme=theme)
+                self._discovering.discard(dcc_data.name)
+
+        if updated_rows:
+            self.dataChanged.emit(self.index(min(updated_rows), 0), self.index(max(updated_rows), 0))
+
+        if not new_dccs:
+            return
+
+        first_row = len(self._dccs)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(new_dccs) - 1)
+        for row, dcc_data in enumerate(new_dccs, first_row):
+            self._dccs.append(dcc_data)
+            self._rows[dcc_data.name] = row
+        self.endInsertRows()
+
+    def update_dcc(self, dcc_name, discovering=False):
+        """
+        Notifies the views that the data of the given DCC changed
+        :param dcc_name: str
+        :param discovering: bool, whether DCC discovery is still running or not
+        """
+
+        row = self._rows.get(dcc_name, None)
+        if row is None:
+            return
+
+        if discovering:
+            self._discovering.add(dcc_name)
         else:
-            dcc_icon = tpDcc.ResourcesMgr().icon(icon_name, theme=theme)
-
-        self._title = QPushButton(self._dcc.name.title())
-        self._title.setStyleSheet(
-            """
-            border-top-left-radius: 10px;
-            border-top-right-radius: 10px;
-            """
-        )
-        self._title.setFixedHeight(20)
+            self._discovering.discard(dcc_name)
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+
+    def update_icon(self, dcc_name):
+        """
+        Notifies the views that the icon of the given DCC changed
+        :param dcc_name: str
+        """
+
+        row = self._rows.get(dcc_name, None)
+        if row is None:
+            return
+
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+
+    def get_versions(self, dcc_data):
+        """
+        Returns the versions of the given DCC that can be selected: installed supported versions or, if no supported
+        version is installed, all supported versions
+        :param dcc_data: DccData
+        :return: list(str)
+        """
+
+        installation_paths = dcc_data.installation_paths or dict()
+        versions = [v for v in dcc_data.supported_versions if v in installation_paths]
 
-        self.main_layout.addWidget(self._title)
-        self._dcc_btn = QPushButton()
-        self._dcc_btn.setFixedSize(QSize(100, 100))
-        self._dcc_btn.setIconSize(QSize(110, 110))
-        self._dcc_btn.setIcon(dcc_icon)
-        self._dcc_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        self.main_layout.addWidget(self._dcc_btn)
+        return versions or list(dcc_data.supported_versions)
+
+    def get_version(self, dcc_data):
+        """
+        Returns the selected version of the given DCC. If no version has been selected, the default one is returned
+        :param dcc_data: DccData
+        :return: str or None
+        """
 
-        self._version_combo = QComboBox()
-        self.main_layout.addWidget(self._version_combo)
-        for version in self._dcc.supported_versions:
-            self._version_combo.addItem(str(version))
+        versions = self.get_versions(dcc_data)
+        for version in (self._versions.get(dcc_data.name, None), dcc_data.default_version):
+            if version in versions:
+                return version
 
-        default_version = self._dcc.default_version
-        index = self._version_combo.findText(default_version, Qt.MatchFixedString)
-        if index > -1:
-            self._version_combo.setCurrentIndex(index)
+        return versions[0] if versions else dcc_data.default_version
 
-        self.setMaximumWidth(105)
 
-    def setup_signals(self):
-        self._dcc_btn.clicked.connect(self._on_button_clicked)
-        self._title.clicked.connect(self._on_button_clicked)
+class DepartmentProxyModel(QSortFilterProxyModel, object):
+    """
+    Proxy model that shows the visible DCCs of a department, sorted by search rank
+    """
 
-    def _on_button_clicked(self):
-        dcc_name = self._dcc.name
-        dcc_version = self._version_combo.currentText()
-        if not dcc_version:
-            dcc_version = self._dcc.default_version
-        self.clicked.emit(dcc_name, dcc_version)
+    def __init__(self, department_name, parent=None):
+        super(DepartmentProxyModel, self).__init__(parent)
+
+        self._department_name = department_name
+        self.setDynamicSortFilter(True)
+        self.setSortRole(DccsModel.SearchRankRole)
+        self.sort(0)
+
+    @property
+    def department_name(self):
+        """
+        Returns the name of the department filtered by this proxy
+        :return: str
+        """
+
+        return self._department_name
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        if not index.data(DccsModel.VisibleRole):
+            return False
+        if self._department_name == DEFAULT_DEPARTMENT:
+            return True
+
+        return self._department_name in (index.data(DccsModel.DepartmentsRole) or list())
+
+
+class DccDelegate(QStyledItemDelegate, object):
+    """
+    Delegate that paints DCCs as buttons with their title, icon and version selector. Clicking the version
+    selector opens a combo box editor, clicking anywhere else launches the DCC
+    """
+
+    clicked = Signal(str, str)
+
+    def sizeHint(self, option, index):
+        return QSize(
+            DCC_ITEM_WIDTH, DCC_ITEM_TITLE_HEIGHT + DCC_ITEM_ICON_SIZE + DCC_ITEM_VERSION_HEIGHT + DCC_ITEM_SPACING)
+
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        title_rect, icon_rect, version_rect = self._get_rects(option.rect)
+        discovering = index.data(DccsModel.DiscoveringRole)
+        state = QStyle.State_None if discovering else QStyle.State_Enabled
+        if not discovering and option.state & QStyle.State_MouseOver:
+            state |= QStyle.State_MouseOver
+
+        painter.save()
+        try:
+            title_option = QStyleOptionButton()
+            title_option.rect = title_rect
+            title_option.text = index.data(Qt.DisplayRole)
+            title_option.state = state | QStyle.State_Raised
+            title_option.palette = option.palette
+            style.drawControl(QStyle.CE_PushButton, title_option, painter, widget)
+
+            icon_option = QStyleOptionButton()
+            icon_option.rect = icon_rect
+            icon_option.icon = index.data(Qt.DecorationRole)
+            icon_option.iconSize = QSize(DCC_ITEM_ICON_SIZE, DCC_ITEM_ICON_SIZE)
+            icon_option.state = state | QStyle.State_Raised
+            icon_option.palette = option.palette
+            style.drawControl(QStyle.CE_PushButton, icon_option, painter, widget)
+
+            version_option = QStyleOptionComboBox()
+            version_option.rect = version_rect
+            version_option.currentText = 'Searching ...' if discovering else (index.data(DccsModel.VersionRole) or '')
+            version_option.state = state
+            version_option.palette = option.palette
+            style.drawComplexControl(QStyle.CC_ComboBox, version_option, painter, widget)
+            style.drawControl(QStyle.CE_ComboBoxLabel, version_option, painter, widget)
+        finally:
+            painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return super(DccDelegate, self).editorEvent(event, model, option, index)
+        if index.data(DccsModel.DiscoveringRole):
+            return True
+
+        _, _, version_rect = self._get_rects(option.rect)
+        if version_rect.contains(event.pos()) and option.widget:
+            option.widget.edit(index)
+        else:
+            self.clicked.emit(index.data(DccsModel.NameRole), index.data(DccsModel.VersionRole) or '')
+
+        return True
+
+    def createEditor(self, parent, option, index):
+        version_combo = QComboBox(parent)
+        version_combo.addItems([str(v) for v in index.data(DccsModel.VersionsRole) or list()])
+        version_combo.activated.connect(lambda: self._on_version_activated(version_combo))
+        QTimer.singleShot(0, version_combo.showPopup)
+
+        return version_combo
+
+    def setEditorData(self, editor, index):
+        version_index = editor.findText(index.data(DccsModel.VersionRole) or '', Qt.MatchFixedString)
+        if version_index > -1:
+            editor.setCurrentIndex(version_index)
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), DccsModel.VersionRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        _, _, version_rect = self._get_rects(option.rect)
+        editor.setGeometry(version_rect)
+
+    def _get_rects(self, rect):
+        """
+        Internal function that returns the rects of the title, icon and version selector of a DCC item
+        :param rect: QRect
+        :return: tuple(QRect, QRect, QRect)
+        """
+
+        left = rect.left() + (rect.width() - DCC_ITEM_WIDTH) // 2
+        title_rect = QRect(left, rect.top(), DCC_ITEM_WIDTH, DCC_ITEM_TITLE_HEIGHT)
+        icon_rect = QRect(left, title_rect.bottom() + 1, DCC_ITEM_WIDTH, DCC_ITEM_ICON_SIZE)
+        version_rect = QRect(left, icon_rect.bottom() + 1, DCC_ITEM_WIDTH, DCC_ITEM_VERSION_HEIGHT)
+
+        return title_rect, icon_rect, version_rect
+
+    def _on_version_activated(self, version_combo):
+        """
+        Internal callback function that is called when a version is selected in the version editor
+        :param version_combo: QComboBox
+        """
+
+        self.commitData.emit(version_combo)
+        self.closeEditor.emit(version_combo, QAbstractItemDelegate.NoHint)
 
 
 class DCCSelector(plugin.ArtellaLauncherPlugin, object):
@@ -156,16 +655,50 @@ class DCCSelector(plugin.ArtellaLauncherPlugin, object):
     LABEL = 'DCC Launcher'
     ICON = 'launcher'
     dccSelected = Signal(str, str)
+    dccInstallationPathsUpdated = Signal(str)
+    dccDiscovered = Signal(str, object)
+    dccInstallRootsChanged = Signal(str)
+    dccIconDecoded = Signal(str, int, object)
 
     COLUMNS_COUNT = 4
+    USE_DISCOVERY_CACHE = True
+    USE_NEGATIVE_CACHE = True
+    DISCOVERY_TIMEOUT = discovery.DEFAULT_TIMEOUT
+    STREAMING_DISCOVERY = True
+    WATCH_INSTALL_ROOTS = False
+    WATCH_POLL_INTERVAL = watcher.DEFAULT_POLL_INTERVAL
+    DECODE_ICONS_IN_BACKGROUND = True
+    MIN_SPLASH_DISPLAY_TIME = 0.0
 
     def __init__(self, project, launcher, parent=None):
 
         self._dccs = dict()
         self._splash = None
+        self._launch_state_machine = None
+        self._launch_plans = dict()
+        self._launch_inputs = None
+        self._launch_inputs_key = None
+        self._link_index = None
+        self._splash_index = None
         self._departments = dict()
+        self._department_tabs = dict()
+        self._search_index = search.SearchIndex()
+        self._search_results = None
         self._selected_dcc = None
         self._selected_version = None
+        self._discovery_cache = cache.DiscoveryCache() if self.USE_DISCOVERY_CACHE else None
+        self._negative_cache = cache.NegativeCache() if self.USE_NEGATIVE_CACHE else None
+        self._discovery_engines = list()
+        self._discovery_lock = threading.Lock()
+        self._pending_discovery = set()
+        self._dccs_to_discover = list()
+        self._manifest_paths = dict()
+        self._dcc_modules = dict()
+        self._install_roots_watcher = None
+        self._dccs_model = None
+        self._search_line = None
+        self._dcc_delegate = None
+        self._icons_decode_pool = None
 
         self._config = tpDcc.ConfigsMgr().get_config(
             config_name='artellapipe-launcher-plugins-dccselector',
@@ -218,27 +751,62 @@ class DCCSelector(plugin.ArtellaLauncherPlugin, object):
     def ui(self):
         super(DCCSelector, self).ui()
 
+        self._dccs_model = DccsModel(parent=self)
+        self._dcc_delegate = DccDelegate(parent=self)
+        self._dcc_delegate.clicked.connect(self._on_dcc_selected)
+        # Icons are decoded in the icons decode pool threads, so they are queued to the GUI thread
+        self.dccIconDecoded.connect(self._on_dcc_icon_decoded, Qt.QueuedConnection)
+        if self.DECODE_ICONS_IN_BACKGROUND:
+            self._start_icon_decoding()
+
+        self._search_line = QLineEdit()
+        self._search_line.setObjectName('dccSearch')
+        self._search_line.setPlaceholderText('Search DCCs ...')
+        self._search_line.setClearButtonEnabled(True)
+        self._search_line.textChanged.connect(self._on_search_text_changed)
+        self._search_line.returnPressed.connect(self._on_search_return_pressed)
+        self.main_layout.addWidget(self._search_line)
+
         self._departments_tab = QTabWidget()
+        self._departments_tab.setObjectName('dccDepartmentsTab')
         self.main_layout.addWidget(self._departments_tab)
-        self.add_department('All')
+        self.add_department(DEFAULT_DEPARTMENT)
 
         LOGGER.debug('DCCs found: {}'.format(self._dccs))
 
-        if self._dccs:
-            for dcc_name, dcc_data in self._dccs.items():
-                LOGGER.debug('DCC: {} | {}'.format(dcc_name, dcc_data))
-                if not dcc_data.enabled:
-                    continue
-                if not dcc_data.installation_paths:
-                    LOGGER.warning('No installed versions found for DCC: {}'.format(dcc_name))
-                    continue
-                dcc_departments = ['All']
-                dcc_departments.extend(dcc_data.departments)
-                for department in dcc_departments:
-                    self.add_department(department)
-                    dcc_btn = DCCButton(dcc=dcc_data)
-                    dcc_btn.clicked.connect(self._on_dcc_selected)
-                    self.add_dcc_to_department(department, dcc_btn)
+        # Discovery results are emitted from discovery threads, so they are queued to the GUI thread
+        self.dccDiscovered.connect(self._on_dcc_discovered, Qt.QueuedConnection)
+        self.dccInstallationPathsUpdated.connect(self._on_dcc_installation_paths_updated)
+        self.dccInstallRootsChanged.connect(self._on_install_roots_changed, Qt.QueuedConnection)
+
+        dccs_to_add = list()
+        for dcc_name, dcc_data in self._dccs.items():
+            LOGGER.debug('DCC: {} | {}'.format(dcc_name, dcc_data))
+            if not dcc_data.enabled:
+                continue
+            discovering = dcc_name in self._pending_discovery
+            if not dcc_data.installation_paths and not discovering:
+                LOGGER.warning('No installed versions found for DCC: {}'.format(dcc_name))
+                continue
+            dccs_to_add.append(dcc_data)
+        self._add_dccs(dccs_to_add)
+
+        # Department views are built when their tab is shown for first time. Only the current tab (the last used
+        # one or All) is built now
+        last_department = self._get_settings().value(LAST_DEPARTMENT_SETTING, None)
+        last_department_tab = self._department_tabs.get(last_department, None)
+        if last_department_tab is not None:
+            self._departments_tab.setCurrentWidget(last_department_tab)
+        self._build_department(self._get_current_department() or DEFAULT_DEPARTMENT)
+        self._departments_tab.currentChanged.connect(self._on_department_tab_changed)
+
+        # Discovery starts once its signals are connected
+        self._start_pending_discovery()
+        if self.WATCH_INSTALL_ROOTS:
+            self.start_watching_install_roots()
+
+        # Launch plans are built once the UI is shown, so clicking a DCC only spawns it
+        QTimer.singleShot(0, self._build_launch_plans)
 
     def init_config(self):
 
@@ -254,34 +822,40 @@ class DCCSelector(plugin.ArtellaLauncherPlugin, object):
         return [dcc_name for dcc_name, dcc_data in self._dccs.items() if dcc_data.enabled]
 
     def add_department(self, department_name):
-        if department_name not in self._departments:
-            department_widget = grid.GridWidget()
-            department_widget.setColumnCount(self.COLUMNS_COUNT)
-            department_widget.setShowGrid(False)
-            department_widget.horizontalHeader().hide()
-            department_widget.verticalHeader().hide()
-            department_widget.resizeRowsToContents()
-            department_widget.resizeColumnsToContents()
-            department_widget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-            department_widget.setFocusPolicy(Qt.NoFocus)
-            department_widget.setSelectionMode(QAbstractItemView.NoSelection)
-            department_widget.setStyleSheet('QTableWidget::item:hover{background-color: transparent;}')
-
-            self._departments[department_name] = department_widget
-            self._departments_tab.addTab(department_widget, department_name.title())
-            return department_widget
+        """
+        Adds a new department tab. Department view is not built until the tab is shown
+        :param department_name: str
+        :return: QWidget or None, tab widget of the department or None if the department already exists
+        """
 
-        return None
+        if department_name in self._department_tabs:
+            return None
+
+        department_tab = QWidget()
+        department_layout = QVBoxLayout()
+        department_layout.setContentsMargins(0, 0, 0, 0)
+        department_layout.setSpacing(0)
+        department_tab.setLayout(department_layout)
 
-    def load_dccs(self, dccs_dict):
+        self._department_tabs[department_name] = department_tab
+        self._departments_tab.addTab(department_tab, department_name.title())
+
+        return department_tab
+
+    def load_dccs(self, dccs_dict, manifest_path=None):
         """
         Loads DCCs from given configuration file
         :param config_file: str
+        :param manifest_path: str or None, path of the studio installation manifest. DCC versions defined in the
+            manifest are not probed. If None, default manifest path is used
         """
 
         if not dccs_dict:
             return
 
+        installation_manifest = manifest.InstallationManifest.load(manifest_path)
+        self.invalidate_launch_plans()
+
         for dcc_name, dcc_data in dccs_dict.items():
             dcc_icon = dcc_data.get(defines.LAUNCHER_DCC_ICON_ATTRIBUTE_NAME, None)
             dcc_enabled = dcc_data.get(defines.LAUNCHER_DCC_ENABLED_ATTRIBUTE_NAME, False)
@@ -293,8 +867,11 @@ class DCCSelector(plugin.ArtellaLauncherPlugin, object):
             supported_versions = dcc_data.get(defines.LAUNCHER_DCC_SUPPORTED_VERSIONS_ATTRIBUTE_NAME, list())
             if supported_versions:
                 supported_versions = [str(v) for v in supported_versions]
-            departments = dcc_data.get(defines.LAUNCHER_DCC_DEPARTMENTS_ATTRIBUTE_NAME, list())
+            departments = list(dcc_data.get(defines.LAUNCHER_DCC_DEPARTMENTS_ATTRIBUTE_NAME, None) or list())
             plugins = dcc_data.get(defines.LAUNCHER_DCC_PLUGINS_ATTRIBUTE_NAME, list())
+            discovery_timeout = dcc_data.get(DCC_DISCOVERY_TIMEOUT_ATTRIBUTE_NAME, None)
+            if discovery_timeout is not None:
+                discovery_timeout = float(discovery_timeout)
             self._dccs[dcc_name] = DccData(
                 name=dcc_name,
                 icon=dcc_icon,
@@ -303,119 +880,768 @@ class DCCSelector(plugin.ArtellaLauncherPlugin, object):
                 supported_versions=supported_versions,
                 installation_paths=list(),
                 departments=departments,
-                plugins=plugins
+                plugins=plugins,
+                discovery_timeout=discovery_timeout
             )
 
         if not self._dccs:
             LOGGER.warning('No DCCs enabled!')
             return
 
+        dccs_to_probe = list()
+        dccs_to_revalidate = list()
+        dccs_search_paths = list(dccs.__path__)
         for dcc_name, dcc_data in self._dccs.items():
             if dcc_data.enabled and not dcc_data.supported_versions:
                 LOGGER.warning('{0} DCC enabled but no supported versions found in launcher settings. '
                                '{0} DCC has been disabled!'.format(dcc_name.title()))
 
+            # Disabled DCCs cannot be launched, so their modules are never imported
+            if not dcc_data.enabled:
+                continue
+
+            dcc_module_name = 'artellapipe.launcher.plugins.dccselector.dccs.{}dcc'.format(
+                dcc_name.lower().replace(' ', ''))
+            if self._negative_cache is not None and self._negative_cache.is_module_missing(
+                    dcc_module_name, search_paths=dccs_search_paths):
+                LOGGER.debug('DCC Python module {} not found in a previous session. Skipping ...'.format(
+                    dcc_module_name))
+                continue
             try:
-                dcc_module = importlib.import_module(
-                    'artellapipe.launcher.plugins.dccselector.dccs.{}dcc'.format(dcc_name.lower().replace(' ', '')))
+                dcc_module = importlib.import_module(dcc_module_name)
             except ImportError:
                 LOGGER.warning('DCC Python module {}dcc not found!'.format(dcc_name.lower().replace(' ', '')))
-                continue
-
-            if not dcc_data.enabled:
+                if self._negative_cache is not None:
+                    self._negative_cache.set_module_missing(dcc_module_name, search_paths=dccs_search_paths)
                 continue
 
             fn_name = 'get_installation_paths'
             fn_launch = 'launch'
-            if not hasattr(dcc_module, fn_name):
+            if not hasattr(dcc_module, 'DESCRIPTOR') and not hasattr(dcc_module, fn_name):
                 continue
 
-            dcc_installation_paths = getattr(dcc_module, fn_name)(dcc_data.supported_versions)
-            dcc_data.installation_paths = dcc_installation_paths
-
+            # DCCs that cannot be launched are never probed
             if hasattr(dcc_module, fn_launch):
                 dcc_data.launch_fn = getattr(dcc_module, fn_launch)
             else:
                 LOGGER.warning('DCC {} has not launch function implemented. Disabling it ...'.format(dcc_data.name))
                 dcc_data.enabled = False
+                continue
+            self._dcc_modules[dcc_name] = dcc_module
+
+            manifest_paths = installation_manifest.get_installation_paths(dcc_name, dcc_data.supported_versions)
+            self._manifest_paths[dcc_name] = manifest_paths
+            dcc_data.installation_paths = dict(manifest_paths)
+            versions_to_probe = self._get_versions_to_probe(dcc_data)
+            if versions_to_probe:
+                dcc_installation_paths = cache.get_cached_installation_paths(
+                    self._discovery_cache, dcc_name, dcc_module, dcc_data.supported_versions)
+                if dcc_installation_paths is None:
+                    dccs_to_probe.append((dcc_data, dcc_module))
+                else:
+                    dcc_data.installation_paths = self._merge_manifest_paths(dcc_name, dcc_installation_paths)
+                    dccs_to_revalidate.append((dcc_data, dcc_module))
+
+        # Background discovery is not started until the UI is created: DCCs are loaded before the widget is
+        # initialized and before discovery signals are connected
+        if self.STREAMING_DISCOVERY:
+            self._pending_discovery.update(dcc_data.name for dcc_data, _ in dccs_to_probe)
+            self._dccs_to_discover.extend(dccs_to_probe + dccs_to_revalidate)
+        else:
+            # Probed paths are stored in DCCs data, UI is created with them so no signal is emitted
+            list(self.iter_discovered_dccs(dccs_to_probe))
+            self._save_caches()
+            self._dccs_to_discover.extend(dccs_to_revalidate)
+        if self._negative_cache is not None:
+            self._negative_cache.save()
+
+        if self._dccs_model is not None:
+            # Reloaded DCCs replace the data stored in the model, so views do not show the previous DCCs data
+            reloaded_dccs = [self._dccs[dcc_name] for dcc_name in dccs_dict if dcc_name in self._dccs]
+            self._add_dccs([dcc_data for dcc_data in reloaded_dccs if dcc_data.enabled and (
+                dcc_data.installation_paths or dcc_data.name in self._pending_discovery)])
+            self._start_pending_discovery()
+
+    def start_watching_install_roots(self):
+        """
+        Starts watching the install roots of the enabled DCCs. When a DCC is installed or uninstalled while the
+        launcher is opened, only that DCC is probed again and the selector is updated
+        """
+
+        self.stop_watching_install_roots()
+
+        # Watcher runs in its own thread, changes are handled in the GUI thread
+        self._install_roots_watcher = watcher.InstallRootsWatcher(
+            self.dccInstallRootsChanged.emit, interval=self.WATCH_POLL_INTERVAL)
+        for dcc_name, dcc_module in self._dcc_modules.items():
+            if self._dccs[dcc_name].enabled:
+                self._install_roots_watcher.watch(dcc_name, cache.get_install_roots(dcc_module))
+        self._install_roots_watcher.start()
+
+    def stop_watching_install_roots(self):
+        """
+        Stops watching the install roots of the DCCs
+        """
+
+        if self._install_roots_watcher is not None:
+            self._install_roots_watcher.stop()
+            self._install_roots_watcher = None
+
+    def iter_discovered_dccs(self, dccs_to_probe):
+        """
+        Probes the installation paths of the given DCCs concurrently and yields the data of each DCC as soon as its
+        probe finishes and its installation paths changed. DCCs data is updated, so it must be called from the GUI
+        thread. Versions that were not found installed recently are not probed again until their install roots
+        change
+        :param dccs_to_probe: list(tuple(DccData, module))
+        :return: generator(DccData)
+        """
+
+        for dcc_name, installation_paths in self.iter_discovery_results(dccs_to_probe):
+            if self._apply_discovery_result(dcc_name, installation_paths):
+                yield self._dccs[dcc_name]
+
+    def iter_discovery_results(self, dccs_to_probe):
+        """
+        Probes the installation paths of the given DCCs concurrently and yields the name of each DCC and its
+        installation paths as soon as its probe finishes. DCCs data is not modified, so it can be called from any
+        thread
+        :param dccs_to_probe: list(tuple(DccData, module))
+        :return: generator(tuple(str, dict(str, str) or None)), installation paths are None if the probe failed
+        """
+
+        if not dccs_to_probe:
+            return
+
+        # All probes share the same snapshot, so install roots shared by multiple DCCs are only listed once
+        snapshot = descriptors.FileSystemSnapshot()
+        discovery_engine = discovery.DiscoveryEngine(timeout=self.DISCOVERY_TIMEOUT)
+        probed_versions = dict()
+        dcc_modules = dict()
+        for dcc_data, dcc_module in dccs_to_probe:
+            probed_versions[dcc_data.name] = self._get_versions_to_probe(dcc_data)
+            dcc_modules[dcc_data.name] = dcc_module
+            discovery_engine.submit(
+                dcc_data.name, cache.update_installation_paths,
+                args=(self._discovery_cache, dcc_data.name, dcc_module, dcc_data.supported_versions),
+                kwargs={'snapshot': snapshot, 'versions_to_probe': probed_versions[dcc_data.name]},
+                timeout=dcc_data.discovery_timeout)
+
+        with self._discovery_lock:
+            self._discovery_engines.append(discovery_engine)
+        try:
+            for result in discovery_engine.iter_results():
+                if not result.ok:
+                    yield result.name, None
+                    continue
+                if self._negative_cache is not None:
+                    self._negative_cache.update_versions(
+                        result.name, probed_versions[result.name], list((result.value or dict()).keys()),
+                        install_roots=cache.get_install_roots(dcc_modules[result.name]))
+                yield result.name, self._merge_manifest_paths(result.name, result.value)
+        finally:
+            with self._discovery_lock:
+                self._discovery_engines.remove(discovery_engine)
+
+    def cancel_discovery(self):
+        """
+        Cancels DCCs discovery probes that are still running
+        """
+
+        with self._discovery_lock:
+            discovery_engines = list(self._discovery_engines)
+        for discovery_engine in discovery_engines:
+            discovery_engine.cancel()
+
+    def get_launch_plan(self, dcc_name, version):
+        """
+        Returns the launch plan of the given DCC version. Plan is built if it is not available yet or if the launch
+        inputs shared by all DCCs changed since it was built. Otherwise, the plan built previously is returned
+        :param dcc_name: str
+        :param version: str
+        :return: LaunchPlan
+        """
+
+        self._update_launch_inputs()
+
+        launch_plan = self._launch_plans.get((dcc_name, version), None)
+        if launch_plan is None:
+            launch_plan = self._build_launch_plan(dcc_name, version)
+            self._launch_plans[(dcc_name, version)] = launch_plan
+
+        return launch_plan
+
+    def invalidate_launch_plans(self, dcc_name=None):
+        """
+        Removes the launch plans of the given DCC. Plans are built again next time they are needed
+        :param dcc_name: str or None, if None, launch plans of all DCCs and the paths shared by them are removed
+        """
+
+        if dcc_name is None:
+            self._launch_plans.clear()
+            self._launch_inputs = None
+            return
+
+        for plan_key in list(self._launch_plans.keys()):
+            if plan_key[0] == dcc_name:
+                self._launch_plans.pop(plan_key, None)
+
+    def add_dcc_to_department(self, department_name, dcc_data):
+        """
+        Shows given DCC in the given department. DCC is stored only once in the DCCs model, departments views filter
+        the DCCs they show
+        :param department_name: str
+        :param dcc_data: DccData
+        """
+
+        self.add_dccs_to_department(department_name, [dcc_data])
+
+    def add_dccs_to_department(self, department_name, dccs_data):
+        """
+        Shows given DCCs in the given department. All DCCs are added to the DCCs model at once, so department views
+        are laid out only once no matter how many DCCs are added
+        :param department_name: str
+        :param dccs_data: list(DccData)
+        """
+
+        self.add_department(department_name)
+        if department_name != DEFAULT_DEPARTMENT:
+            for dcc_data in dccs_data:
+                if department_name not in dcc_data.departments:
+                    dcc_data.departments.append(department_name)
+
+        discovering = [dcc_data.name for dcc_data in dccs_data if dcc_data.name in self._pending_discovery]
+        self._dccs_model.add_dccs(dccs_data, discovering=discovering)
+        self._update_search_index(dccs_data)
+
+    def _get_settings(self):
+        """
+        Internal function that returns settings where DCC selector UI state is stored
+        :return: QSettings
+        """
+
+        return QSettings('artellapipe', 'artellapipe-launcher-plugins-dccselector')
+
+    def _get_current_department(self):
+        """
+        Internal function that returns the name of the department whose tab is shown
+        :return: str or None
+        """
+
+        current_tab = self._departments_tab.currentWidget()
+        for department_name, department_tab in self._department_tabs.items():
+            if department_tab is current_tab:
+                return department_name
+
+        return None
+
+    def _build_department(self, department_name):
+        """
+        Internal function that builds the view of the given department. If the department view is already built,
+        it is returned
+        :param department_name: str
+        :return: QListView
+        """
+
+        if department_name in self._departments:
+            return self._departments[department_name]
+
+        if department_name not in self._department_tabs:
+            self.add_department(department_name)
+
+        department_proxy = DepartmentProxyModel(department_name, parent=self)
+        department_proxy.setSourceModel(self._dccs_model)
+
+        department_view = QListView()
+        department_view.setObjectName('dccDepartmentView')
+        department_view.setViewMode(QListView.IconMode)
+        department_view.setResizeMode(QListView.Adjust)
+        department_view.setMovement(QListView.Static)
+        department_view.setUniformItemSizes(True)
+        department_view.setSpacing(DCC_ITEM_SPACING)
+        department_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        department_view.setFocusPolicy(Qt.NoFocus)
+        department_view.setSelectionMode(QAbstractItemView.NoSelection)
+        department_view.setMouseTracking(True)
+        department_view.setMinimumWidth(self.COLUMNS_COUNT * (DCC_ITEM_WIDTH + DCC_ITEM_SPACING * 2))
+        department_view.setItemDelegate(self._dcc_delegate)
+        department_view.setModel(department_proxy)
+
+        self._departments[department_name] = department_view
+        self._department_tabs[department_name].layout().addWidget(department_view)
+
+        return department_view
+
+    def _add_dccs(self, dccs_data):
+        """
+        Internal function that shows the given DCCs in All department and in all their departments
+        :param dccs_data: list(DccData)
+        """
+
+        # Department tabs are created in the same order DCCs define them. DCCs are already tagged with their
+        # departments, so adding them to All department is enough to show them in all their departments
+        for dcc_data in dccs_data:
+            for department in dcc_data.departments:
+                self.add_department(department)
+        self.add_dccs_to_department(DEFAULT_DEPARTMENT, dccs_data)
+
+    def _update_search_index(self, dccs_data):
+        """
+        Internal function that updates the tokens of the given DCCs in search index. If a search is active, it is
+        applied again, so DCCs whose versions changed are shown or hidden
+        :param dccs_data: list(DccData)
+        """
+
+        for dcc_data in dccs_data:
+            self._search_index.update(dcc_data.name, self._dccs_model.get_versions(dcc_data), dcc_data.departments)
+
+        search_text = self._search_line.text() if self._search_line is not None else ''
+        if search_text.strip():
+            self._on_search_text_changed(search_text)
+
+    def _get_versions_to_probe(self, dcc_data):
+        """
+        Internal function that returns the supported versions of the given DCC that are not defined in the
+        studio installation manifest and that were not found installed recently (negative cache)
+        :param dcc_data: DccData
+        :return: list(str)
+        """
+
+        manifest_paths = self._manifest_paths.get(dcc_data.name, None) or dict()
+        missing_versions = list()
+        if self._negative_cache is not None:
+            dcc_module = self._dcc_modules.get(dcc_data.name, None)
+            missing_versions = self._negative_cache.get_missing_versions(
+                dcc_data.name, install_roots=cache.get_install_roots(dcc_module) if dcc_module else None)
+
+        return [v for v in dcc_data.supported_versions if v not in manifest_paths and v not in missing_versions]
+
+    def _merge_manifest_paths(self, dcc_name, installation_paths):
+        """
+        Internal function that merges the given probed installation paths with the ones defined in the studio
+        installation manifest. Manifest paths have priority
+        :param dcc_name: str
+        :param installation_paths: dict(str, str)
+        :return: dict(str, str)
+        """
+
+        merged_paths = dict(installation_paths or dict())
+        merged_paths.update(self._manifest_paths.get(dcc_name, None) or dict())
+
+        return merged_paths
+
+    def _start_pending_discovery(self):
+        """
+        Internal function that starts the background discovery of the DCCs queued by load_dccs
+        """
+
+        dccs_to_discover = self._dccs_to_discover
+        self._dccs_to_discover = list()
+        self._start_background_discovery(dccs_to_discover)
+
+    def _start_background_discovery(self, dccs_to_probe):
+        """
+        Internal function that probes the given DCCs in a background thread. Used to revalidate DCCs whose
+        installation paths were retrieved from discovery cache and, in streaming mode, to probe all DCCs without
+        blocking launcher UI creation
+        :param dccs_to_probe: list(tuple(DccData, module))
+        """
+
+        if not dccs_to_probe:
+            return
+
+        discovery_thread = threading.Thread(
+            target=self._discover_dccs, args=(dccs_to_probe,), name='DCCSelectorDiscovery')
+        discovery_thread.daemon = True
+        discovery_thread.start()
+
+    def _discover_dccs(self, dccs_to_probe):
+        """
+        Internal function that probes the given DCCs in a discovery thread and stores the results in discovery
+        cache. Results are only emitted, DCCs data is updated in the GUI thread. Negatively cached versions are
+        skipped: they are revalidated when their install roots fingerprint changes, when their entries expire or
+        when the install roots watcher detects a change
+        :param dccs_to_probe: list(tuple(DccData, module))
+        """
+
+        discovered = set()
+        try:
+            for dcc_name, installation_paths in self.iter_discovery_results(dccs_to_probe):
+                discovered.add(dcc_name)
+                self.dccDiscovered.emit(dcc_name, installation_paths)
+        finally:
+            # Caches are saved first, so they are written even if the UI is not available anymore
+            self._save_caches()
+            for dcc_data, _ in dccs_to_probe:
+                if dcc_data.name not in discovered:
+                    self.dccDiscovered.emit(dcc_data.name, None)
+
+    def _apply_discovery_result(self, dcc_name, installation_paths):
+        """
+        Internal function that stores the probed installation paths of the given DCC and finishes its discovery
+        :param dcc_name: str
+        :param installation_paths: dict(str, str) or None, None if the probe failed
+        :return: bool, True if installation paths changed or DCC was waiting its discovery; False otherwise
+        """
+
+        dcc_data = self._dccs.get(dcc_name, None)
+        if not dcc_data:
+            return False
 
-    def add_dcc_to_department(self, department_name, dcc_button):
-        if department_name not in self._departments:
-            department_widget = self.add_department(department_name)
+        was_pending = dcc_name in self._pending_discovery
+        self._pending_discovery.discard(dcc_name)
+        changed = installation_paths is not None and installation_paths != dcc_data.installation_paths
+        if changed:
+            dcc_data.installation_paths = installation_paths
+
+        return changed or was_pending
+
+    def _start_icon_decoding(self):
+        """
+        Internal function that decodes the icons of the enabled DCCs concurrently in the icons decode pool. Icons are
+        decoded with the exact sizes used by DCC items and splash, so they are not scaled when painted. Decoded
+        images are sent to the GUI thread, where they are converted to pixmaps. Decoding has no timeout and it does
+        not share threads with DCCs discovery
+        """
+
+        icons_manifest = resources.get_manifest()
+        icons_to_decode = list()
+        for dcc_data in self._dccs.values():
+            if not dcc_data.enabled:
+                continue
+            theme, icon_name = get_dcc_icon_name(dcc_data)
+            icon_path = icons_manifest.get_icon_path(icon_name, theme=theme)
+            if not icon_path:
+                continue
+            for size in (DCC_ITEM_ICON_SIZE, SPLASH_ICON_SIZE):
+                if get_dcc_pixmap_key(dcc_data, size) not in ICONS_CACHE:
+                    icons_to_decode.append((dcc_data.name, icon_path, size))
+
+        if not icons_to_decode:
+            return
+
+        if self._icons_decode_pool is None:
+            self._icons_decode_pool = QThreadPool(self)
+            self._icons_decode_pool.setObjectName('DCCSelectorIconsDecodePool')
+        for dcc_name, icon_path, size in icons_to_decode:
+            self._icons_decode_pool.start(IconDecodeTask(dcc_name, icon_path, size, self.dccIconDecoded.emit))
+
+    def _save_caches(self):
+        """
+        Internal function that writes discovery and negative caches into disk
+        """
+
+        for discovery_cache in (self._discovery_cache, self._negative_cache):
+            if discovery_cache is not None:
+                discovery_cache.save()
+
+    def _get_launch_inputs_key(self):
+        """
+        Internal function that returns a key that changes when the launch data shared by all DCCs may have changed:
+        project, launcher installation path and paths and, in development mode, the modification time of the
+        folders that contain link files (a link file is added, removed or replaced). Only a few stat calls are done
+        :return: tuple
+        """
+
+        launcher_install_path = self.launcher.install_path
+        launcher_paths = tuple(self.launcher.paths_to_register or list())
+        links_mtimes = list()
+        if self.launcher.dev:
+            for p in launcher_paths:
+                try:
+                    links_mtimes.append(os.stat(p).st_mtime)
+                except OSError:
+                    links_mtimes.append(None)
+
+        return (
+            self.project.get_clean_name(), self.project.id_path, tuple(self.project.modules_to_register),
+            launcher_install_path, bool(launcher_install_path and os.path.isdir(launcher_install_path)),
+            launcher_paths, bool(self.launcher.dev), tuple(links_mtimes))
+
+    def _update_launch_inputs(self):
+        """
+        Internal function that collects the launch data shared by all DCCs: launcher installation path, project
+        modules and folders, launcher paths and development link files. Data is only collected again if its key
+        changed; if collected data changed since launch plans were built, all launch plans are removed
+        :return: dict
+        """
+
+        launch_inputs_key = self._get_launch_inputs_key()
+        if self._launch_inputs is not None and launch_inputs_key == self._launch_inputs_key:
+            return self._launch_inputs
+
+        launcher_install_path = self.launcher.install_path
+        install_path = None
+        error = None
+        if not launcher_install_path or not os.path.isdir(launcher_install_path):
+            error = 'Current installation path does not exists: {}. Aborting DCC launch ...'.format(
+                launcher_install_path)
         else:
-            department_widget = self._departments[department_name]
+            install_path = path_utils.clean_path(os.path.abspath(launcher_install_path))
+            id_path = path_utils.clean_path(self.project.id_path)
+            if id_path in install_path:
+                error = 'Folder {} is not a valid installation folder. ' \
+                        'Install tools in a folder that is not inside Artella Project folder please!'.format(
+                            install_path)
+
+        # We force the addition of bootstrap and external module. Modules are located without importing them, so
+        # project code is not executed inside the launcher
+        module_paths = list()
+        for mod_name in self.project.modules_to_register:
+            mod_path = modules.get_module_path('{}.{}'.format(self.project.get_clean_name(), mod_name))
+            if mod_path:
+                module_paths.append((mod_name, mod_path))
+
+        # In development mode, link files point to the folders of modules that are not installed
+        launcher_paths = list()
+        for p in self.launcher.paths_to_register:
+            link_paths = list()
+            if self.launcher.dev:
+                if self._link_index is None:
+                    self._link_index = links.LinkIndex()
+                link_paths = self._link_index.get_link_paths(p)
+            launcher_paths.append((p, link_paths))
+        if self._link_index is not None:
+            self._link_index.save()
+
+        launch_inputs = {
+            'launcher_install_path': launcher_install_path,
+            'install_path': install_path,
+            'error': error,
+            'module_paths': module_paths,
+            'project_paths': list(self.project.get_folders_to_register(full_path=False) or list()),
+            'launcher_paths': launcher_paths
+        }
+        if launch_inputs != self._launch_inputs:
+            if self._launch_inputs is not None:
+                LOGGER.debug('Launch inputs changed. Launch plans will be built again')
+            self._launch_plans.clear()
+            self._launch_inputs = launch_inputs
+        self._launch_inputs_key = launch_inputs_key
+
+        return self._launch_inputs
+
+    def _build_launch_plan(self, dcc_name, version):
+        """
+        Internal function that builds the launch plan of the given DCC version
+        :param dcc_name: str
+        :param version: str
+        :return: LaunchPlan
+        """
 
-        row, col = department_widget.first_empty_cell()
-        department_widget.addWidget(row, col, dcc_button)
-        department_widget.resizeRowsToContents()
+        dcc_data = self._dccs[dcc_name]
+        launch_inputs = self._launch_inputs or self._update_launch_inputs()
+        install_path = launch_inputs['install_path']
+
+        bootstrap_path = None
+        folders_to_register = list()
+        for mod_name, mod_path in launch_inputs['module_paths']:
+            if mod_name == 'bootstrap':
+                mod_path = os.path.join(mod_path, dcc_name.lower())
+                if os.path.isdir(mod_path):
+                    bootstrap_path = mod_path
+            if os.path.isdir(mod_path):
+                if mod_path not in folders_to_register:
+                    folders_to_register.append(mod_path)
+                else:
+                    LOGGER.warning('Impossible to register Bootstrap Path for Project "{}" and DCC "{}"'.format(
+                        self.project.get_clean_name(), dcc_name))
+
+        for p in launch_inputs['project_paths']:
+            if p not in folders_to_register:
+                folders_to_register.append(p)
+
+        for p, link_paths in launch_inputs['launcher_paths']:
+            if p not in folders_to_register:
+                folders_to_register.append(p)
+                folders_to_register.extend(link_paths)
+
+        python_paths = list()
+        if folders_to_register and install_path:
+            python_paths = environment.PathList([install_path] + folders_to_register, base_path=install_path)
+
+        installation_path = dcc_data.installation_paths.get(version, None)
+
+        return launch.LaunchPlan(
+            dcc_name=dcc_name,
+            version=version,
+            exec_=os.path.abspath(installation_path) if installation_path else None,
+            install_path=install_path,
+            bootstrap_path=bootstrap_path,
+            folders_to_register=tuple(folders_to_register),
+            python_paths=tuple(python_paths),
+            launch_fn=dcc_data.launch_fn,
+            error=launch_inputs['error']
+        )
 
-    def _get_splash_pixmap(self):
+    def _build_launch_plans(self, dcc_names=None):
         """
-        Returns pixmap to be used as splash background
-        :return: Pixmap
+        Internal function that builds the launch plans of all installed versions of the given DCCs, so launching a
+        DCC does not need to compute them
+        :param dcc_names: list(str) or None, if None, plans of all enabled DCCs are built
+        """
+
+        try:
+            self._update_launch_inputs()
+        except Exception as exc:
+            LOGGER.warning('Impossible to collect launch inputs: {}'.format(exc))
+            return
+
+        for dcc_name in dcc_names or list(self._dccs.keys()):
+            dcc_data = self._dccs.get(dcc_name, None)
+            if not dcc_data or not dcc_data.enabled or not dcc_data.launch_fn:
+                continue
+            for version in dcc_data.installation_paths or dict():
+                if (dcc_name, version) in self._launch_plans:
+                    continue
+                try:
+                    self._launch_plans[(dcc_name, version)] = self._build_launch_plan(dcc_name, version)
+                except Exception as exc:
+                    LOGGER.warning('Impossible to build launch plan for {} {}: {}'.format(dcc_name, version, exc))
+                    continue
+
+    def _get_splash_source_path(self):
+        """
+        Returns a random project splash image. Project splash images are indexed once, so the splash folder is only
+        listed when its contents change
+        :return: str or None
         """
 
         splash_path = tpDcc.ResourcesMgr().get('images', 'splash.png', key='project')
-        splash_dir = os.path.dirname(splash_path)
-        splash_files = [f for f in os.listdir(splash_dir) if
-                        f.startswith('splash') and os.path.isfile(os.path.join(splash_dir, f))]
-        if splash_files or not os.path.isfile(splash_path):
-            splash_index = random.randint(0, len(splash_files) - 1)
-            splash_name, splash_extension = os.path.splitext(splash_files[splash_index])
-            splash_pixmap = tpDcc.ResourcesMgr().pixmap(
-                splash_name, extension=splash_extension[1:], key='project')
-        else:
-            splash_pixmap = tpDcc.ResourcesMgr().pixmap('splash')
+        if self._splash_index is None:
+            self._splash_index = splash.SplashIndex()
+        splash_files = self._splash_index.get_splash_files(os.path.dirname(splash_path))
+        self._splash_index.save()
+
+        return random.choice(splash_files) if splash_files else None
+
+    def _get_splash_pixmap(self, source_path=None):
+        """
+        Returns pixmap to be used as splash background. Scaled versions of the project splash images are cached in
+        disk, so only a small image is loaded
+        :param source_path: str or None, project splash image. If None, default splash image is used
+        :return: Pixmap
+        """
+
+        if not source_path:
+            return tpDcc.ResourcesMgr().pixmap('splash').scaled(QSize(*splash.SPLASH_SIZE))
 
-        return splash_pixmap.scaled(QSize(800, 270))
+        scaled_path = splash.get_scaled_splash_path(source_path)
+        if scaled_path and os.path.isfile(scaled_path):
+            splash_pixmap = QPixmap(scaled_path)
+            if not splash_pixmap.isNull():
+                return splash_pixmap
+
+        splash_pixmap = QPixmap(source_path).scaled(QSize(*splash.SPLASH_SIZE))
+        self._save_splash_pixmap(splash_pixmap, scaled_path)
+
+        return splash_pixmap
+
+    def _get_composited_splash_pixmap(self, dcc_name):
+        """
+        Returns the splash of the given DCC: splash background with Artella and DCC badges already painted.
+        Composited splash images are cached in memory and in disk per project and DCC
+        :param dcc_name: str
+        :return: QPixmap
+        """
+
+        source_path = self._get_splash_source_path()
+        project_name = self.project.get_clean_name()
+        composited_path = None
+        if source_path:
+            # Painted icons are part of the cached splash path, so changing them invalidates the cached splash
+            dcc_icon_theme, dcc_icon_name = get_dcc_icon_name(self._dccs[dcc_name])
+            icon_paths = [
+                get_icon_path('artella', theme=SPLASH_ICON_THEME), get_icon_path(dcc_icon_name, theme=dcc_icon_theme)]
+            composited_path = splash.get_composited_splash_path(
+                source_path, project_name, dcc_name, icon_paths=[p for p in icon_paths if p])
+
+        def _load_composited_pixmap():
+            if composited_path and os.path.isfile(composited_path):
+                cached_pixmap = QPixmap(composited_path)
+                if not cached_pixmap.isNull():
+                    return cached_pixmap
+
+            splash_pixmap = QPixmap(self._get_splash_pixmap(source_path))
+            badge_offset = (SPLASH_BADGE_SIZE - SPLASH_ICON_SIZE) // 2
+            badge_x = splash_pixmap.width() - SPLASH_BADGE_SIZE + badge_offset
+            painter = QPainter(splash_pixmap)
+            try:
+                painter.drawPixmap(
+                    badge_x, badge_offset, get_pixmap('artella', SPLASH_ICON_SIZE, theme=SPLASH_ICON_THEME))
+                painter.drawPixmap(
+                    badge_x, SPLASH_BADGE_SIZE + badge_offset, get_dcc_pixmap(self._dccs[dcc_name], SPLASH_ICON_SIZE))
+            finally:
+                painter.end()
+            self._save_splash_pixmap(splash_pixmap, composited_path)
+
+            return splash_pixmap
+
+        return ICONS_CACHE.get(('splash', project_name, dcc_name, composited_path), _load_composited_pixmap)
+
+    def _save_splash_pixmap(self, splash_pixmap, splash_path):
+        """
+        Internal function that stores given splash pixmap in splash disk cache and removes its outdated versions
+        :param splash_pixmap: QPixmap
+        :param splash_path: str or None
+        """
+
+        if not splash_path or splash_pixmap.isNull():
+            return
+
+        try:
+            splash_dir = os.path.dirname(splash_path)
+            if not os.path.isdir(splash_dir):
+                os.makedirs(splash_dir)
+        except OSError as exc:
+            LOGGER.warning('Impossible to create splash cache folder: {}'.format(exc))
+            return
+
+        if splash_pixmap.save(splash_path):
+            splash.clean_scaled_splash(splash_path)
 
     def _setup_splash(self, dcc_name):
         """
-        Internal function that is used to setup launch splash depending on the selected DCC
+        Internal function that is used to setup launch splash depending on the selected DCC. Splash screen is only
+        created once, next launches only update its composited image and reset its progress
         :param dcc_name: str
         """
 
-        splash_pixmap = self._get_splash_pixmap()
-
-        self._splash = QSplashScreen(splash_pixmap)
-        # self._splash.setFixedSize(QSize(800, 270))
-        self._splash.setWindowFlags(Qt.FramelessWindowHint)
-        self._splash.setEnabled(True)
-
-        self.main_layout = QVBoxLayout()
-        self.main_layout.setContentsMargins(5, 2, 5, 2)
-        self.main_layout.setSpacing(2)
-        self.main_layout.setAlignment(Qt.AlignBottom)
-
-        self._splash.setLayout(self.main_layout)
-        self.progress_bar = self.project.get_progress_bar()
-        self.main_layout.addWidget(self.progress_bar)
-        self.progress_bar.setMaximum(6)
-        self.progress_bar.setTextVisible(False)
-
-        self._progress_text = QLabel('Loading {} Tools ...'.format(self.project.name.title()))
-        self._progress_text.setAlignment(Qt.AlignCenter)
-        self._progress_text.setStyleSheet("QLabel { background-color : rgba(0, 0, 0, 180); color : white; }")
-        font = self._progress_text.font()
-        font.setPointSize(10)
-        self._progress_text.setFont(font)
-        self.main_layout.addWidget(self._progress_text)
-
-        self.main_layout.addItem(QSpacerItem(0, 20))
-
-        artella_icon = tpDcc.ResourcesMgr().icon('artella')
-        artella_lbl = QLabel()
-        artella_lbl.setFixedSize(QSize(52, 52))
-        artella_lbl.setParent(self._splash)
-        artella_lbl.move(self._splash.width() - artella_lbl.width(), 0)
-        artella_lbl.setPixmap(artella_icon.pixmap(artella_icon.actualSize(QSize(48, 48))))
-
-        dcc_icon = tpDcc.ResourcesMgr().icon(dcc_name.lower())
-        dcc_lbl = QLabel()
-        dcc_lbl.setFixedSize(QSize(52, 52))
-        dcc_lbl.setParent(self._splash)
-        dcc_lbl.move(self._splash.width() - dcc_lbl.width(), 52)
-        dcc_lbl.setPixmap(dcc_icon.pixmap(dcc_icon.actualSize(QSize(48, 48))))
+        splash_pixmap = self._get_composited_splash_pixmap(dcc_name)
+
+        if self._splash is None:
+            self._splash = QSplashScreen(splash_pixmap)
+            self._splash.setWindowFlags(Qt.FramelessWindowHint)
+            self._splash.setEnabled(True)
+            self._splash.setStyleSheet(STYLESHEET)
+
+            splash_layout = QVBoxLayout()
+            splash_layout.setContentsMargins(5, 2, 5, 2)
+            splash_layout.setSpacing(2)
+            splash_layout.setAlignment(Qt.AlignBottom)
+            self._splash.setLayout(splash_layout)
+
+            self.progress_bar = self.project.get_progress_bar()
+            splash_layout.addWidget(self.progress_bar)
+            self.progress_bar.setMaximum(6)
+            self.progress_bar.setTextVisible(False)
+
+            self._progress_text = QLabel()
+            self._progress_text.setAlignment(Qt.AlignCenter)
+            self._progress_text.setObjectName('dccSplashText')
+            font = self._progress_text.font()
+            font.setPointSize(10)
+            self._progress_text.setFont(font)
+            splash_layout.addWidget(self._progress_text)
+
+            splash_layout.addItem(QSpacerItem(0, 20))
+        else:
+            self._splash.setPixmap(splash_pixmap)
+
+        self.progress_bar.setValue(0)
+        self._progress_text.setText('Loading {} Tools ...'.format(self.project.name.title()))
+
+        LOGGER.debug('Icons cache stats: {}'.format(ICONS_CACHE.get_stats()))
 
         self._splash.show()
         self._splash.raise_()
@@ -428,181 +1654,230 @@ class DCCSelector(plugin.ArtellaLauncherPlugin, object):
 
         self._progress_text.setText(msg)
         LOGGER.info('> {}'.format(msg))
-        QApplication.instance().processEvents()
 
-    def _on_dcc_selected(self, selected_dcc, selected_version):
+    def _on_dcc_discovered(self, dcc_name, installation_paths):
         """
-        Internal callback function that is called when the user selects a DCC to launch in DCCSelector window
-        :param selected_dcc: str
+        Internal callback function that is called in the GUI thread each time the probe of a DCC finishes in a
+        discovery thread
+        :param dcc_name: str
+        :param installation_paths: dict(str, str) or None, None if the probe failed
         """
 
-        self._selected_dcc = selected_dcc
-        self._selected_version = selected_version
-        self.dccSelected.emit(self._selected_dcc, self._selected_version)
+        if self._apply_discovery_result(dcc_name, installation_paths):
+            self.dccInstallationPathsUpdated.emit(dcc_name)
 
-        try:
-            if not selected_dcc:
-                qtutils.show_warning(
-                    None, 'DCC installations not found',
-                    '{} Launcher cannot found any DCC installed in your computer.'.format(self.name))
-                sys.exit()
-
-            if selected_dcc not in self._dccs:
-                qtutils.show_warning(
-                    None, '{} not found in your computer'.format(selected_dcc.title()),
-                    '{} Launcher cannot launch {} because no version is installed in your computer.'.format(
-                        self.name, selected_dcc.title()))
-                sys.exit()
-
-            installation_paths = self._dccs[selected_dcc].installation_paths
-            if not installation_paths:
-                return
-
-            if selected_version not in installation_paths:
-                qtutils.show_warning(
-                    None, '{} {} installation path not found'.format(selected_dcc.title(), selected_version),
-                    '{} Launcher cannot launch {} {} because it is not installed in your computer.'.format(
-                        self.name, selected_dcc.title(), selected_version))
-                return
-
-            installation_path = installation_paths[selected_version]
-
-            self._setup_splash(selected_dcc)
-
-            self._progress_text.setText('Creating {} Launcher Configuration ...'.format(self.project.name.title()))
-            LOGGER.info('> Creating {} Launcher Configuration ...'.format(self.project.name.title()))
-            QApplication.instance().processEvents()
-
-            parser = argparse.ArgumentParser(
-                description='{} Launcher allows to setup a custom initialization for DCCs. '
-                            'This allows to setup specific paths in an easy way.'.format(self.project.name.title())
-            )
-            parser.add_argument(
-                '-e', '--edit',
-                action='store_true',
-                help='Edit configuration file'
-            )
+    def _on_dcc_installation_paths_updated(self, dcc_name):
+        """
+        Internal callback function that is called each time the discovery of a DCC finishes
+        :param dcc_name: str
+        """
 
-            exec_ = os.path.abspath(installation_path)
+        dcc_data = self._dccs.get(dcc_name, None)
+        if not dcc_data:
+            return
 
-            self.progress_bar.setValue(1)
-            QApplication.instance().processEvents()
-            time.sleep(1)
+        discovering = dcc_name in self._pending_discovery
+        if not discovering and not dcc_data.installation_paths:
+            LOGGER.warning('No installed versions found for DCC: {}'.format(dcc_name))
 
-            install_path = self.launcher.install_path
-            if not install_path or not os.path.isdir(install_path):
-                msg = 'Current installation path does not exists: {}. Aborting DCC launch ...'.format(install_path)
-                self._set_text(msg)
-                LOGGER.error(msg)
-                sys.exit()
+        self.invalidate_launch_plans(dcc_name)
+        if not discovering:
+            self._build_launch_plans([dcc_name])
 
-            install_path = path_utils.clean_path(os.path.abspath(install_path))
-            id_path = path_utils.clean_path(self.project.id_path)
-            if id_path in install_path:
-                qtutils.show_warning(
-                    None, 'Installation folder is not valid!',
-                    'Folder {} is not a valid installation folder. '
-                    'Install tools in a folder that is not inside Artella Project folder please!'.format(install_path))
-                sys.exit()
+        if self._dccs_model.get_dcc(dcc_name) is None:
+            if dcc_data.enabled and dcc_data.installation_paths:
+                self._add_dccs([dcc_data])
+            return
 
-            self.progress_bar.setValue(4)
-            self._set_text('Setting {} environment variables ...'.format(selected_dcc.title()))
+        self._dccs_model.update_dcc(dcc_name, discovering=discovering)
+        self._update_search_index([dcc_data])
 
-            bootstrap_path = None
+    def _on_search_text_changed(self, text):
+        """
+        Internal callback function that is called each time search text changes. Only the DCCs that match the
+        search are shown. If a version is searched, that version is selected
+        :param text: str
+        """
 
-            # We force the addition of bootstrap and external module
-            folders_to_register = list()
-            mods_to_register = self.project.modules_to_register
-            for mod_name in mods_to_register:
-                try:
-                    imported_mod = importlib.import_module(
-                        '{}.{}'.format(self.project.get_clean_name(), mod_name))
-                    if imported_mod:
-                        mod_path = os.path.dirname(imported_mod.__file__)
-                        if mod_name == 'bootstrap':
-                            mod_path = os.path.join(mod_path, self._selected_dcc.lower())
-                            if os.path.isdir(mod_path):
-                                bootstrap_path = mod_path
-
-                        if os.path.isdir(mod_path):
-                            if mod_path not in folders_to_register:
-                                folders_to_register.append(mod_path)
-                            else:
-                                LOGGER.warning(
-                                    'Impossible to register Bootstrap Path for Project "{}" and DCC "{}"'.format(
-                                        self.project.get_clean_name(), self._selected_dcc))
-                except ImportError:
-                    continue
+        if not text.strip():
+            self._search_results = None
+            self._dccs_model.set_search_results(None)
+            return
 
-            project_folders_to_register = self.project.get_folders_to_register(full_path=False)
-            if project_folders_to_register:
-                for p in project_folders_to_register:
-                    if p not in folders_to_register:
-                        folders_to_register.append(p)
-
-            for p in self.launcher.paths_to_register:
-                if p not in folders_to_register:
-                    folders_to_register.append(p)
-                    if self.launcher.dev:
-                        for f_name in os.listdir(p):
-                            f_path = path_utils.clean_path(os.path.join(p, f_name))
-                            if f_path.endswith('-link') and os.path.isfile(f_path):
-                                with open(f_path, 'r') as f:
-                                    mod_path = str(path_utils.clean_path(f.readline()))
-                                    if mod_path and os.path.isdir(mod_path):
-                                        folders_to_register.append(mod_path)
-
-            if folders_to_register:
-
-                LOGGER.info("Registering following paths: \n")
-                for f in folders_to_register:
-                    LOGGER.info(f)
-
-                if os.environ.get('PYTHONPATH'):
-                    os.environ['PYTHONPATH'] = os.environ['PYTHONPATH'] + ';' + self.launcher.install_path
-                    for p in folders_to_register:
-                        p = path_utils.clean_path(os.path.join(install_path, p))
-                        LOGGER.debug('Adding path to PYTHONPATH: {}'.format(p))
-                        os.environ['PYTHONPATH'] = os.environ['PYTHONPATH'] + ';' + p
-                else:
-                    os.environ['PYTHONPATH'] = self.launcher.install_path
-                    for p in folders_to_register:
-                        p = path_utils.clean_path(os.path.join(install_path, p))
-                        LOGGER.debug('Adding path to PYTHONPATH: {}'.format(p))
-                        os.environ['PYTHONPATH'] = os.environ['PYTHONPATH'] + ';' + p
+        self._search_results = self._search_index.search(text)
+        for search_result in self._search_results:
+            if search_result.version:
+                self._dccs_model.set_version(search_result.name, search_result.version)
+        self._dccs_model.set_search_results(self._search_results)
 
-            self.progress_bar.setValue(5)
-            self._set_text('Launching DCC: {} ...'.format(selected_dcc))
+    def _on_search_return_pressed(self):
+        """
+        Internal callback function that is called when Enter is pressed in the search box. Launches the best
+        matching DCC that can be launched
+        """
 
-        #     os.environ[self.project.get_clean_name()+'_show'] = 'show'
+        for search_result in self._search_results or list():
+            dcc_data = self._dccs_model.get_dcc(search_result.name)
+            if not dcc_data or not dcc_data.installation_paths or dcc_data.name in self._pending_discovery:
+                continue
+            self._on_dcc_selected(dcc_data.name, self._dccs_model.get_version(dcc_data))
+            return
 
-            time.sleep(1)
+    def _on_dcc_icon_decoded(self, dcc_name, size, image):
+        """
+        Internal callback function that is called in the GUI thread each time a DCC icon is decoded
+        :param dcc_name: str
+        :param size: int
+        :param image: QImage
+        """
 
-            # # We need to import this here because this path maybe is not available until we update Artella paths
-            # try:
-            #     import spigot
-            # except ImportError:
-            #     LOGGER.error('Impossible to import Artella Python modules! Maybe Artella is not installed properly.')
+        dcc_data = self._dccs.get(dcc_name, None)
+        if not dcc_data:
+            return
 
-            launch_fn = self._dccs[selected_dcc].launch_fn
-            if not launch_fn:
-                LOGGER.error('Selected DCC: {} has no launch function!'.format(selected_dcc.name))
-                return
-        except Exception as e:
-            self._splash.close()
-            raise exceptions.ArtellaPipeException(self.project, msg=e)
+        pixmap = QPixmap.fromImage(image)
+        ICONS_CACHE.set(get_dcc_pixmap_key(dcc_data, size), pixmap)
+        if size == DCC_ITEM_ICON_SIZE:
+            ICONS_CACHE.set(get_dcc_icon_key(dcc_data), QIcon(pixmap))
+            if self._dccs_model is not None:
+                self._dccs_model.update_icon(dcc_name)
 
-        self._splash.close()
+    def _on_department_tab_changed(self, index):
+        """
+        Internal callback function that is called when a department tab is shown. Builds department view the first
+        time its tab is shown and stores it as the last used department
+        :param index: int
+        """
+
+        department_name = self._get_current_department()
+        if not department_name:
+            return
+
+        self._build_department(department_name)
+        self._get_settings().setValue(LAST_DEPARTMENT_SETTING, department_name)
+
+    def _on_install_roots_changed(self, dcc_name):
+        """
+        Internal callback function that is called in the GUI thread when the install roots watcher detects that the
+        install roots of a DCC changed
+        :param dcc_name: str
+        """
+
+        dcc_data = self._dccs.get(dcc_name, None)
+        dcc_module = self._dcc_modules.get(dcc_name, None)
+        if not dcc_data or not dcc_module:
+            return
+
+        LOGGER.info('{} install roots changed. Updating installed versions ...'.format(dcc_name))
+        registry.get_reader().clear_cache()
+        self.invalidate_launch_plans(dcc_name)
+        if self._negative_cache is not None:
+            self._negative_cache.clear(dcc_name)
+        self._start_background_discovery([(dcc_data, dcc_module)])
+
+    def _on_dcc_selected(self, selected_dcc, selected_version):
+        """
+        Internal callback function that is called when the user selects a DCC to launch in DCCSelector window
+        :param selected_dcc: str
+        """
+
+        if self._launch_state_machine and self._launch_state_machine.state == launch.RUNNING_STATE:
+            LOGGER.warning('A DCC is already being launched. Wait until it finishes please!')
+            return
+
+        self._selected_dcc = selected_dcc
+        self._selected_version = selected_version
+        self.dccSelected.emit(self._selected_dcc, self._selected_version)
+
+        if not selected_dcc:
+            qtutils.show_warning(
+                None, 'DCC installations not found',
+                '{} Launcher cannot found any DCC installed in your computer.'.format(self.name))
+            sys.exit()
+
+        if selected_dcc not in self._dccs:
+            qtutils.show_warning(
+                None, '{} not found in your computer'.format(selected_dcc.title()),
+                '{} Launcher cannot launch {} because no version is installed in your computer.'.format(
+                    self.name, selected_dcc.title()))
+            sys.exit()
+
+        installation_paths = self._dccs[selected_dcc].installation_paths
+        if not installation_paths:
+            return
+
+        if selected_version not in installation_paths:
+            qtutils.show_warning(
+                None, '{} {} installation path not found'.format(selected_dcc.title(), selected_version),
+                '{} Launcher cannot launch {} {} because it is not installed in your computer.'.format(
+                    self.name, selected_dcc.title(), selected_version))
+            return
+
+        self._setup_splash(selected_dcc)
+
+        phases = launch.get_launch_phases(
+            selected_dcc, selected_version, self.get_launch_plan, check_launch_plan=self._check_bootstrap_path)
+        self._launch_state_machine = launch.LaunchStateMachine(
+            phases, scheduler=self._schedule_launch, min_display_time=self.MIN_SPLASH_DISPLAY_TIME,
+            on_progress=self._on_launch_progress, on_finished=self._on_launch_finished,
+            on_failed=self._on_launch_failed)
+        self._launch_state_machine.start()
+
+    def _schedule_launch(self, delay, fn):
+        """
+        Internal function used by launch state machine to run its steps. Steps are run by Qt event loop, so the UI
+        is repainted between them without processing events manually
+        :param delay: float, seconds to wait before calling the function
+        :param fn: callable
+        """
+
+        QTimer.singleShot(int(delay * 1000), fn)
+
+    def _on_launch_progress(self, value, msg):
+        """
+        Internal callback function that is called when a launch phase starts
+        :param value: int
+        :param msg: str
+        """
 
-        time.sleep(1)
+        self.progress_bar.setValue(value)
+        self._set_text(msg)
 
-        if not bootstrap_path or not os.path.isdir(bootstrap_path):
+    def _check_bootstrap_path(self, launch_plan):
+        """
+        Internal function that warns the user if the bootstrap folder of the given launch plan does not exist. DCC
+        is launched anyway, but project tools will not be loaded
+        :param launch_plan: LaunchPlan
+        """
+
+        if not launch_plan.bootstrap_path or not os.path.isdir(launch_plan.bootstrap_path):
             QMessageBox.warning(
                 None, 'Bootstrap Directory not found!',
                 'Bootstrap folder for Project "{}" and DCC "{}" not found. Tools will not load. '
-                'Please contact TD!'.format(self.project.get_clean_name, self._selected_dcc))
+                'Please contact TD!'.format(self.project.get_clean_name(), launch_plan.dcc_name))
 
-        launch_fn(exec_=exec_, setup_path=bootstrap_path)
+    def _on_launch_finished(self, context):
+        """
+        Internal callback function that is called when all launch phases are done and the DCC was spawned
+        :param context: dict
+        """
+
+        self._splash.close()
 
         # self.launcher.close()
         # QApplication.instance().quit()
+
+    def _on_launch_failed(self, exc):
+        """
+        Internal callback function that is called when a launch phase fails
+        :param exc: Exception
+        """
+
+        self._splash.close()
+        if isinstance(exc, launch.LaunchError):
+            LOGGER.error(exc)
+            qtutils.show_warning(
+                None, 'Impossible to launch {}'.format((self._selected_dcc or '').title()), str(exc))
+            sys.exit()
+
+        raise exceptions.ArtellaPipeException(self.project, msg=exc)
@@ -109,8 +109,13 @@ def get_dccs_path():
 
 def register_resources():
     """
-    Registers artellapipe-launcher resources
+    Registers artellapipe-launcher resources and loads the plugin resources manifest
     """
 
+    from artellapipe.launcher.plugins.dccselector.core import resources
+
     resources_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources')
     tp.ResourcesMgr().register_resource(resources_path, 'launcher')
+
+    # Icons shipped with the plugin are located using the resources manifest generated at build time
+    resources.get_manifest()
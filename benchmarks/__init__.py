@@ -0,0 +1,7 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for artellapipe-launcher-plugins-dccselector. Run them from repository root:
+    python -m benchmarks.<benchmark_module>
+"""
@@ -0,0 +1,107 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that compares adding DCCs to department views one by one and in bulk. Requires Qt, views are rendered
+offscreen
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from Qt.QtWidgets import QApplication, QListView
+
+from artellapipe.launcher.plugins.dccselector import dccselector
+
+DCCS_COUNT = 300
+DEPARTMENTS_COUNT = 6
+REPEATS = 9
+
+
+def build_dccs():
+    dccs_data = list()
+    departments = ['department{}'.format(i) for i in range(DEPARTMENTS_COUNT)]
+    for i in range(DCCS_COUNT):
+        dccs_data.append(dccselector.DccData(
+            name='dcc{}'.format(i),
+            icon='color/artella',
+            enabled=True,
+            default_version='2020',
+            supported_versions=['2019', '2020'],
+            installation_paths={'2020': 'dcc.exe'},
+            departments=[departments[i % DEPARTMENTS_COUNT]],
+            plugins=list()
+        ))
+
+    return dccs_data, departments
+
+
+def build_views(departments):
+    dccs_model = dccselector.DccsModel()
+    delegate = dccselector.DccDelegate()
+    views = list()
+    for department in [dccselector.DEFAULT_DEPARTMENT] + departments:
+        proxy = dccselector.DepartmentProxyModel(department)
+        proxy.setSourceModel(dccs_model)
+        view = QListView()
+        view.setViewMode(QListView.IconMode)
+        view.setResizeMode(QListView.Adjust)
+        view.setUniformItemSizes(True)
+        view.setItemDelegate(delegate)
+        view.setModel(proxy)
+        view.show()
+        views.append((view, proxy))
+
+    return dccs_model, delegate, views
+
+
+def insert(app, bulk):
+    dccs_data, departments = build_dccs()
+    dccs_model, delegate, views = build_views(departments)
+    start = time.time()
+    if bulk:
+        dccs_model.add_dccs(dccs_data)
+    else:
+        for dcc_data in dccs_data:
+            dccs_model.add_dcc(dcc_data)
+    insert_elapsed = time.time() - start
+    app.processEvents()
+    elapsed = time.time() - start
+    for view, _ in views:
+        view.close()
+
+    return insert_elapsed, elapsed
+
+
+def median(values):
+    return sorted(values)[len(values) // 2]
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    insert(app, bulk=True)
+
+    # Both variants are measured alternately, so warm up and system noise affect them the same way
+    timings = {True: list(), False: list()}
+    for _ in range(REPEATS):
+        timings[False].append(insert(app, bulk=False))
+        timings[True].append(insert(app, bulk=True))
+    print('DCCs: {} | Departments: {}'.format(DCCS_COUNT, DEPARTMENTS_COUNT + 1))
+    for label, index in (('Insertion', 0), ('Insertion and repaint', 1)):
+        one_by_one = median([timing[index] for timing in timings[False]])
+        bulk = median([timing[index] for timing in timings[True]])
+        print('{} | One by one: {:.2f} ms | Bulk: {:.2f} ms | Speedup: {:.1f}x'.format(
+            label, one_by_one * 1000, bulk * 1000, one_by_one / bulk if bulk else float('inf')))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that compares cold and warm DCCs discovery using the persistent discovery cache
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import time
+import shutil
+import tempfile
+
+from artellapipe.launcher.plugins.dccselector.core import cache
+
+DCCS_COUNT = 7
+VERSIONS_COUNT = 12
+PROBE_LATENCY = 0.005
+
+
+class FakeDccModule(object):
+    """
+    Mimics a dccs module that probes an install root folder. PROBE_LATENCY simulates registry access latency
+    """
+
+    def __init__(self, install_root):
+        self._install_root = install_root
+
+    def get_install_roots(self):
+        return [self._install_root]
+
+    def get_installation_paths(self, versions):
+        found = dict()
+        for version in versions:
+            time.sleep(PROBE_LATENCY)
+            bin_path = os.path.join(self._install_root, 'DCC{}'.format(version), 'bin')
+            if os.path.exists(bin_path) and 'dcc.exe' in os.listdir(bin_path):
+                found[version] = os.path.join(bin_path, 'dcc.exe')
+        return found
+
+
+def build_tree(root):
+    dcc_modules = dict()
+    versions = [str(2010 + i) for i in range(VERSIONS_COUNT)]
+    for i in range(DCCS_COUNT):
+        install_root = os.path.join(root, 'dcc{}'.format(i))
+        for version in versions[::2]:
+            bin_path = os.path.join(install_root, 'DCC{}'.format(version), 'bin')
+            os.makedirs(bin_path)
+            open(os.path.join(bin_path, 'dcc.exe'), 'w').close()
+        dcc_modules['dcc{}'.format(i)] = FakeDccModule(install_root)
+
+    return dcc_modules, versions
+
+
+def discover(cache_path, dcc_modules, versions):
+    discovery_cache = cache.DiscoveryCache(cache_path)
+    start = time.time()
+    for dcc_name, dcc_module in dcc_modules.items():
+        cache.resolve_installation_paths(discovery_cache, dcc_name, dcc_module, versions)
+    discovery_cache.save()
+
+    return time.time() - start
+
+
+def main():
+    root = tempfile.mkdtemp()
+    try:
+        dcc_modules, versions = build_tree(os.path.join(root, 'installs'))
+        cache_path = os.path.join(root, 'discovery.json')
+        cold = discover(cache_path, dcc_modules, versions)
+        warm = discover(cache_path, dcc_modules, versions)
+        print('DCCs: {} | Supported versions: {}'.format(DCCS_COUNT, VERSIONS_COUNT))
+        print('Cold start: {:.2f} ms'.format(cold * 1000))
+        print('Warm start: {:.2f} ms'.format(warm * 1000))
+        print('Speedup: {:.1f}x'.format(cold / warm if warm else float('inf')))
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that compares building PYTHONPATH by repeated concatenation (writing the environment on each path) with
+the ordered, de-duplicated path list that writes the environment once
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import time
+
+from artellapipe.launcher.plugins.dccselector.core import environment
+
+INSTALL_PATH = os.path.normpath('/studio/tools/install')
+FOLDERS_COUNT = 5000
+DUPLICATES_RATIO = 4
+LAUNCHES = 3
+
+
+def build_folders():
+    return ['folder{}'.format(i % (FOLDERS_COUNT // DUPLICATES_RATIO)) for i in range(FOLDERS_COUNT)]
+
+
+def concatenate(folders):
+    for _ in range(LAUNCHES):
+        folders_to_register = list()
+        for p in folders:
+            if p not in folders_to_register:
+                folders_to_register.append(p)
+        if os.environ.get('PYTHONPATH'):
+            os.environ['PYTHONPATH'] = os.environ['PYTHONPATH'] + ';' + INSTALL_PATH
+        else:
+            os.environ['PYTHONPATH'] = INSTALL_PATH
+        for p in folders_to_register:
+            os.environ['PYTHONPATH'] = os.environ['PYTHONPATH'] + ';' + os.path.normpath(os.path.join(INSTALL_PATH, p))
+
+    return len(os.environ['PYTHONPATH'])
+
+
+def path_list(folders):
+    for _ in range(LAUNCHES):
+        environment.set_paths(environment.PathList([INSTALL_PATH] + folders, base_path=INSTALL_PATH))
+
+    return len(os.environ['PYTHONPATH'])
+
+
+def main():
+    folders = build_folders()
+    python_path = os.environ.pop('PYTHONPATH', None)
+    try:
+        start = time.time()
+        concatenate_length = concatenate(folders)
+        concatenate_time = time.time() - start
+        os.environ.pop('PYTHONPATH', None)
+
+        start = time.time()
+        path_list_length = path_list(folders)
+        path_list_time = time.time() - start
+    finally:
+        if python_path is None:
+            os.environ.pop('PYTHONPATH', None)
+        else:
+            os.environ['PYTHONPATH'] = python_path
+
+    print('Registered folders: {} | Launches: {}'.format(FOLDERS_COUNT, LAUNCHES))
+    print('Concatenation: {:.2f} ms | PYTHONPATH length: {}'.format(concatenate_time * 1000, concatenate_length))
+    print('Path list: {:.2f} ms | PYTHONPATH length: {}'.format(path_list_time * 1000, path_list_length))
+    print('Speedup: {:.1f}x'.format(concatenate_time / path_list_time if path_list_time else float('inf')))
+
+
+if __name__ == '__main__':
+    main()
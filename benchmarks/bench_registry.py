@@ -0,0 +1,73 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that compares per-version registry probing with the shared, memoized registry reader
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import time
+import logging
+
+from artellapipe.launcher.plugins.dccselector.core import registry, descriptors
+from artellapipe.launcher.plugins.dccselector.dccs import mayadcc
+
+REGISTRY_KEY = r'SOFTWARE\Autodesk\Maya'
+REGISTRY_LATENCY = 0.002
+SUPPORTED_VERSIONS = [str(v) for v in range(2010, 2030)]
+INSTALLED_VERSIONS = ['2018', '2019', '2020']
+DISCOVERIES = 5
+
+
+def build_backend():
+    keys = dict()
+    for version in INSTALLED_VERSIONS:
+        keys[r'{}\{}\Setup\InstallPath'.format(REGISTRY_KEY, version)] = {
+            'MAYA_INSTALL_LOCATION': 'C:/Program Files/Autodesk/Maya{}'.format(version)}
+
+    return registry.FakeRegistryBackend(keys, latency=REGISTRY_LATENCY)
+
+
+def per_version_probe(backend):
+    locations = dict()
+    for version in SUPPORTED_VERSIONS:
+        values = backend.read_values(
+            r'{}\{}\Setup\InstallPath'.format(REGISTRY_KEY, version), ['MAYA_INSTALL_LOCATION'])
+        if values:
+            locations[version] = values['MAYA_INSTALL_LOCATION']
+
+    return locations
+
+
+def main():
+    logging.getLogger('artellapipe-launcher-plugins-dccselector').setLevel(logging.ERROR)
+
+    backend = build_backend()
+    start = time.time()
+    for _ in range(DISCOVERIES):
+        per_version_probe(backend)
+    per_version_time = time.time() - start
+    per_version_calls = backend.calls
+
+    backend = build_backend()
+    registry.set_backend(backend)
+    start = time.time()
+    for _ in range(DISCOVERIES):
+        descriptors.discover(mayadcc.DESCRIPTOR, SUPPORTED_VERSIONS, search_roots=list(), system='windows')
+    reader_time = time.time() - start
+    registry.set_backend(None)
+
+    print('Supported versions: {} | Installed versions: {} | Discoveries: {}'.format(
+        len(SUPPORTED_VERSIONS), len(INSTALLED_VERSIONS), DISCOVERIES))
+    print('Per version probe: {:.2f} ms ({} registry accesses)'.format(per_version_time * 1000, per_version_calls))
+    print('Shared reader: {:.2f} ms ({} registry accesses)'.format(reader_time * 1000, backend.calls))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that measures the polish time of the DCC selector widgets with and without a stylesheet applied to the
+selector. Widgets are the ones the selector builds (search line, departments tabs and department views painted by
+DccDelegate). Requires Qt, widgets are rendered offscreen
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from Qt.QtCore import Qt
+from Qt.QtWidgets import QApplication, QWidget, QVBoxLayout, QLineEdit, QTabWidget, QListView, QAbstractItemView
+
+from artellapipe.launcher.plugins.dccselector import dccselector
+
+DCCS_COUNT = 300
+DEPARTMENTS_COUNT = 6
+REPEATS = 9
+
+
+def build_dccs():
+    dccs_data = list()
+    departments = ['department{}'.format(i) for i in range(DEPARTMENTS_COUNT)]
+    for i in range(DCCS_COUNT):
+        dccs_data.append(dccselector.DccData(
+            name='dcc{}'.format(i),
+            icon='color/artella',
+            enabled=True,
+            default_version='2020',
+            supported_versions=['2019', '2020'],
+            installation_paths={'2020': 'dcc.exe'},
+            departments=[departments[i % DEPARTMENTS_COUNT]],
+            plugins=list()
+        ))
+
+    return dccs_data, departments
+
+
+def build_selector(dccs_data, departments, stylesheet):
+    selector = QWidget()
+    main_layout = QVBoxLayout(selector)
+    main_layout.setContentsMargins(0, 0, 0, 0)
+    main_layout.setSpacing(0)
+    if stylesheet:
+        selector.setStyleSheet(stylesheet)
+
+    dccs_model = dccselector.DccsModel(parent=selector)
+    delegate = dccselector.DccDelegate(parent=selector)
+
+    search_line = QLineEdit()
+    search_line.setObjectName('dccSearch')
+    search_line.setClearButtonEnabled(True)
+    main_layout.addWidget(search_line)
+
+    departments_tab = QTabWidget()
+    departments_tab.setObjectName('dccDepartmentsTab')
+    main_layout.addWidget(departments_tab)
+    for department in [dccselector.DEFAULT_DEPARTMENT] + departments:
+        proxy = dccselector.DepartmentProxyModel(department, parent=selector)
+        proxy.setSourceModel(dccs_model)
+        view = QListView()
+        view.setObjectName('dccDepartmentView')
+        view.setViewMode(QListView.IconMode)
+        view.setResizeMode(QListView.Adjust)
+        view.setMovement(QListView.Static)
+        view.setUniformItemSizes(True)
+        view.setSpacing(dccselector.DCC_ITEM_SPACING)
+        view.setSelectionMode(QAbstractItemView.NoSelection)
+        view.setFocusPolicy(Qt.NoFocus)
+        view.setMouseTracking(True)
+        view.setItemDelegate(delegate)
+        view.setModel(proxy)
+        departments_tab.addTab(view, department.title())
+    dccs_model.add_dccs(dccs_data)
+
+    return selector, departments_tab
+
+
+def measure(app, stylesheet):
+    dccs_data, departments = build_dccs()
+    start = time.time()
+    selector, departments_tab = build_selector(dccs_data, departments, stylesheet)
+    selector.resize(480, 640)
+    selector.show()
+    app.processEvents()
+    for i in range(departments_tab.count()):
+        departments_tab.setCurrentIndex(i)
+        app.processEvents()
+    elapsed = time.time() - start
+    selector.close()
+    selector.deleteLater()
+    app.processEvents()
+
+    return elapsed
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    measure(app, None)
+
+    # Both variants are measured alternately, so warm up and system noise affect them the same way
+    timings = {True: list(), False: list()}
+    for _ in range(REPEATS):
+        timings[True].append(measure(app, dccselector.STYLESHEET))
+        timings[False].append(measure(app, None))
+    with_stylesheet = sorted(timings[True])[REPEATS // 2]
+    without_stylesheet = sorted(timings[False])[REPEATS // 2]
+    print('DCCs: {} | Departments: {}'.format(DCCS_COUNT, DEPARTMENTS_COUNT + 1))
+    print('Selector stylesheet: {:.2f} ms'.format(with_stylesheet * 1000))
+    print('No selector stylesheet: {:.2f} ms'.format(without_stylesheet * 1000))
+    print('Speedup: {:.2f}x'.format(with_stylesheet / without_stylesheet if without_stylesheet else float('inf')))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,25 @@
+import os
+import runpy
+
 from setuptools import setup
 
 import versioneer
-setup(version=versioneer.get_version(), cmdclass=versioneer.get_cmdclass())
+
+RESOURCES_MODULE = os.path.join('artellapipe', 'launcher', 'plugins', 'dccselector', 'core', 'resources.py')
+
+cmdclass = versioneer.get_cmdclass()
+
+
+class BuildPy(cmdclass['build_py']):
+    """
+    Generates the resources manifest shipped with the package before building it
+    """
+
+    def run(self):
+        resources = runpy.run_path(RESOURCES_MODULE)
+        resources['write_manifest'](resources['get_resources_path']())
+        cmdclass['build_py'].run(self)
+
+
+cmdclass['build_py'] = BuildPy
+setup(version=versioneer.get_version(), cmdclass=cmdclass)
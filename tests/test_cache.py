@@ -0,0 +1,102 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector discovery cache
+"""
+
+import os
+
+from artellapipe.launcher.plugins.dccselector.core import cache
+
+
+class FakeDccModule(object):
+    def __init__(self, install_root):
+        self.install_root = install_root
+        self.probes = 0
+
+    def get_install_roots(self):
+        return [self.install_root]
+
+    def get_installation_paths(self, versions):
+        self.probes += 1
+        return {v: os.path.join(self.install_root, v) for v in versions}
+
+
+def test_warm_discovery_uses_cache(tmpdir):
+    cache_path = str(tmpdir.join('cache.json'))
+    dcc_module = FakeDccModule(str(tmpdir.mkdir('maya')))
+
+    cold_cache = cache.DiscoveryCache(cache_path)
+    paths, from_cache = cache.resolve_installation_paths(cold_cache, 'maya', dcc_module, ['2019', '2020'])
+    assert not from_cache
+    assert cold_cache.save()
+
+    warm_cache = cache.DiscoveryCache(cache_path)
+    cached_paths, from_cache = cache.resolve_installation_paths(warm_cache, 'maya', dcc_module, ['2019', '2020'])
+    assert from_cache
+    assert cached_paths == paths
+    assert dcc_module.probes == 1
+
+
+def test_cache_invalidated_by_versions_and_roots(tmpdir):
+    install_root = tmpdir.mkdir('maya')
+    discovery_cache = cache.DiscoveryCache(str(tmpdir.join('cache.json')))
+    discovery_cache.set('maya', ['2019'], [str(install_root)], {'2019': 'maya.exe'})
+
+    assert discovery_cache.get('maya', ['2019'], [str(install_root)]) == {'2019': 'maya.exe'}
+    assert discovery_cache.get('maya', ['2019', '2020'], [str(install_root)]) is None
+
+    install_root.mkdir('Maya2020')
+    os.utime(str(install_root), (0, 0))
+    assert discovery_cache.get('maya', ['2019'], [str(install_root)]) is None
+
+
+def test_negative_cache_expires(tmpdir):
+    cache_path = str(tmpdir.join('negative.json'))
+    negative_cache = cache.NegativeCache(cache_path)
+    negative_cache.set_module_missing('mydcc')
+    negative_cache.update_versions('maya', ['2019', '2020'], ['2020'])
+    assert negative_cache.save()
+
+    warm_cache = cache.NegativeCache(cache_path)
+    assert warm_cache.is_module_missing('mydcc')
+    assert warm_cache.get_missing_versions('maya') == ['2019']
+
+    warm_cache.update_versions('maya', ['2019'], ['2019'])
+    assert warm_cache.get_missing_versions('maya') == []
+
+    expired_cache = cache.NegativeCache(cache_path, ttl=0)
+    assert not expired_cache.is_module_missing('mydcc')
+
+
+def test_negative_versions_invalidated_by_roots(tmpdir):
+    install_root = tmpdir.mkdir('maya')
+    negative_cache = cache.NegativeCache(str(tmpdir.join('negative.json')))
+    negative_cache.update_versions('maya', ['2019', '2020'], ['2020'], install_roots=[str(install_root)])
+    assert negative_cache.get_missing_versions('maya', install_roots=[str(install_root)]) == ['2019']
+
+    install_root.mkdir('Maya2019')
+    os.utime(str(install_root), (0, 0))
+    assert negative_cache.get_missing_versions('maya', install_roots=[str(install_root)]) == []
+
+
+def test_cache_keyed_by_supported_versions(tmpdir):
+    dcc_module = FakeDccModule(str(tmpdir.mkdir('maya')))
+    discovery_cache = cache.DiscoveryCache(str(tmpdir.join('cache.json')))
+    paths = cache.update_installation_paths(
+        discovery_cache, 'maya', dcc_module, ['2019', '2020'], versions_to_probe=['2020'])
+
+    assert list(paths.keys()) == ['2020']
+    assert cache.get_cached_installation_paths(discovery_cache, 'maya', dcc_module, ['2019', '2020']) == paths
+
+
+def test_missing_module_invalidated_by_search_paths(tmpdir):
+    dccs_dir = tmpdir.mkdir('dccs')
+    negative_cache = cache.NegativeCache(str(tmpdir.join('negative.json')))
+    negative_cache.set_module_missing('nukedcc', search_paths=[str(dccs_dir)])
+    assert negative_cache.is_module_missing('nukedcc', search_paths=[str(dccs_dir)])
+
+    dccs_dir.join('nukedcc.py').write('')
+    os.utime(str(dccs_dir), (0, 0))
+    assert not negative_cache.is_module_missing('nukedcc', search_paths=[str(dccs_dir)])
@@ -0,0 +1,32 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector DCC launch functions
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip('tpDcc.libs.qt.core.qtutils')
+
+from artellapipe.launcher.plugins.dccselector.dccs import houdinidcc
+
+
+def test_houdini_launch_passes_arguments_list(tmpdir, monkeypatch):
+    setup_path = str(tmpdir.mkdir('houdini'))
+    script_file = os.path.join(setup_path, 'userSetup.py')
+    open(script_file, 'w').close()
+    launched = list()
+
+    def _popen(cmd, **kwargs):
+        launched.append((cmd, kwargs))
+
+    monkeypatch.setattr(houdinidcc.subprocess, 'Popen', _popen)
+    houdinidcc.launch('/opt/hfs18.0.460/bin/houdini', setup_path)
+
+    cmd, kwargs = launched[0]
+    assert cmd == ['/opt/hfs18.0.460/bin/houdini', 'waitforui', script_file]
+    assert not kwargs.get('shell', False)
+    assert kwargs['env']['HOUDINI_PATH'] == '{}{}&'.format(setup_path, os.pathsep)
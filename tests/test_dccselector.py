@@ -0,0 +1,44 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector DCCs model
+"""
+
+import pytest
+
+pytest.importorskip('tpDcc.libs.qt.core.qtutils')
+
+from artellapipe.launcher.plugins.dccselector import dccselector
+
+
+def _get_dcc_data(installation_paths, departments=None):
+    return dccselector.DccData(
+        name='maya', icon='color/maya', enabled=True, default_version='2020', supported_versions=['2019', '2020'],
+        installation_paths=installation_paths, departments=departments or list(), plugins=list())
+
+
+def test_add_dccs_replaces_reloaded_dccs():
+    dccs_model = dccselector.DccsModel()
+    changed_rows = list()
+    dccs_model.dataChanged.connect(lambda top_left, bottom_right, *args: changed_rows.append(top_left.row()))
+
+    dccs_model.add_dccs([_get_dcc_data({'2019': 'maya2019'})])
+    reloaded_dcc_data = _get_dcc_data({'2020': 'maya2020'}, departments=['animation'])
+    dccs_model.add_dccs([reloaded_dcc_data])
+
+    index = dccs_model.index(0, 0)
+    assert dccs_model.rowCount() == 1
+    assert changed_rows == [0]
+    assert dccs_model.get_dcc('maya') is reloaded_dcc_data
+    assert index.data(dccs_model.DepartmentsRole) == ['animation']
+    assert index.data(dccs_model.VersionsRole) == ['2020']
+
+
+def test_add_dccs_inserts_duplicated_dccs_once():
+    dccs_model = dccselector.DccsModel()
+    reloaded_dcc_data = _get_dcc_data({'2020': 'maya2020'})
+    dccs_model.add_dccs([_get_dcc_data({'2019': 'maya2019'}), reloaded_dcc_data])
+
+    assert dccs_model.rowCount() == 1
+    assert dccs_model.get_dcc('maya') is reloaded_dcc_data
@@ -0,0 +1,75 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector DCC descriptors engine
+"""
+
+import os
+
+from artellapipe.launcher.plugins.dccselector.core import descriptors, installs, registry
+from artellapipe.launcher.plugins.dccselector.dccs import mayadcc, nukedcc
+from artellapipe.launcher.plugins.dccselector.dccs import substancedesignerdcc, substancepainterdcc
+
+
+def _create_file(*paths):
+    file_path = os.path.join(*paths)
+    if not os.path.isdir(os.path.dirname(file_path)):
+        os.makedirs(os.path.dirname(file_path))
+    open(file_path, 'w').close()
+    return file_path
+
+
+def test_find_version():
+    index = {'17.5.391': 'a', '18.0.416': 'b', '18.0.499': 'c'}
+    assert installs.find_version(index, '18.0') == 'c'
+    assert installs.find_version(index, '17.5.391') == 'a'
+    assert installs.find_version(index, '19.0') is None
+
+
+def test_linux_discovery(tmpdir):
+    root = str(tmpdir)
+    maya_exec = _create_file(root, 'maya2020', 'bin', 'maya')
+    os.makedirs(os.path.join(root, 'maya2019', 'bin'))
+    nuke_exec = _create_file(root, 'Nuke12.1v2', 'Nuke12.1')
+
+    maya_paths = descriptors.discover(
+        mayadcc.DESCRIPTOR, ['2018', '2019', '2020'], search_roots=[root], system='linux')
+    assert maya_paths == {'2020': maya_exec}
+
+    nuke_paths = descriptors.discover(nukedcc.DESCRIPTOR, ['11.3v4', '12.1v2'], search_roots=[root], system='linux')
+    assert nuke_paths == {'12.1v2': nuke_exec}
+
+
+def test_windows_registry_discovery(tmpdir):
+    maya_exec = _create_file(str(tmpdir), 'Maya2020', 'bin', 'maya.exe')
+    registry.set_backend(registry.FakeRegistryBackend({
+        r'SOFTWARE\Autodesk\Maya\2020\Setup\InstallPath': {
+            'MAYA_INSTALL_LOCATION': os.path.dirname(os.path.dirname(maya_exec))}}))
+    try:
+        maya_paths = descriptors.discover(
+            mayadcc.DESCRIPTOR, ['2019', '2020'], search_roots=list(), system='windows')
+    finally:
+        registry.set_backend(None)
+
+    assert maya_paths == {'2020': maya_exec}
+
+
+def test_shared_roots_are_listed_once(tmpdir):
+    root = str(tmpdir)
+    painter_exec = _create_file(root, 'Substance Painter', 'Substance Painter.exe')
+    designer_exec = _create_file(root, 'Substance Designer 2019.1', 'Substance Designer.exe')
+    painter = descriptors.DccDescriptor(
+        'Substance Painter', search_roots={'linux': [root]},
+        folder_patterns={'linux': substancepainterdcc.DESCRIPTOR.get_folder_pattern('windows').pattern},
+        executables={'linux': substancepainterdcc.DESCRIPTOR.get_executables('windows')})
+    designer = descriptors.DccDescriptor(
+        'Substance Designer', search_roots={'linux': [root]},
+        folder_patterns={'linux': substancedesignerdcc.DESCRIPTOR.get_folder_pattern('windows').pattern},
+        executables={'linux': substancedesignerdcc.DESCRIPTOR.get_executables('windows')})
+
+    snapshot = descriptors.FileSystemSnapshot()
+    found = descriptors.discover_all([(painter, ['2019']), (designer, ['2019'])], snapshot=snapshot, system='linux')
+
+    assert found == {'Substance Painter': {'2019': painter_exec}, 'Substance Designer': {'2019': designer_exec}}
+    assert snapshot.listings == 1
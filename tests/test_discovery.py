@@ -0,0 +1,51 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector discovery engine
+"""
+
+import time
+import threading
+
+from artellapipe.launcher.plugins.dccselector.core import discovery
+
+
+def test_probes_run_concurrently():
+    engine = discovery.DiscoveryEngine(timeout=5.0)
+    for i in range(5):
+        engine.submit('dcc{}'.format(i), time.sleep, args=(0.2,))
+
+    start = time.time()
+    results = engine.run()
+    assert time.time() - start < 0.6
+    assert all(result.ok for result in results.values())
+
+
+def test_hung_probe_times_out():
+    hang = threading.Event()
+    engine = discovery.DiscoveryEngine(timeout=5.0, max_workers=1)
+    engine.submit('hung', hang.wait, timeout=0.1)
+    engine.submit('maya', lambda: {'2020': 'maya.exe'})
+
+    start = time.time()
+    results = engine.run()
+    hang.set()
+
+    assert time.time() - start < 1.0
+    assert results['hung'].timed_out
+    assert results['maya'].value == {'2020': 'maya.exe'}
+
+
+def test_failed_probe_and_cancel():
+    def _fail():
+        raise RuntimeError('registry not available')
+
+    engine = discovery.DiscoveryEngine()
+    engine.submit('broken', _fail)
+    assert isinstance(engine.run()['broken'].error, RuntimeError)
+
+    engine = discovery.DiscoveryEngine()
+    engine.submit('maya', time.sleep, args=(1.0,))
+    engine.cancel()
+    assert engine.run()['maya'].cancelled
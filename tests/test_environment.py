@@ -0,0 +1,33 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector environment paths
+"""
+
+import os
+
+from artellapipe.launcher.plugins.dccselector.core import environment
+
+
+def test_path_list_keeps_order_without_duplicates():
+    path_list = environment.PathList(['bootstrap', 'tools', 'bootstrap/', 'libs', 'tools'], base_path='/install')
+
+    assert list(path_list) == [os.path.normpath(p) for p in ['/install/bootstrap', '/install/tools', '/install/libs']]
+    assert 'tools' in path_list
+    assert path_list.to_string() == os.pathsep.join(path_list)
+
+
+def test_set_paths_does_not_grow_across_launches(monkeypatch):
+    monkeypatch.setenv('PYTHONPATH', os.pathsep.join(['/site', '/studio']))
+    monkeypatch.setattr(environment, '_BASE_PATHS', dict())
+
+    def _join(paths):
+        return os.pathsep.join(os.path.normpath(p) for p in paths)
+
+    environment.set_paths(['/install', '/install/bootstrap/maya', '/studio'])
+    value = environment.set_paths(['/install', '/install/bootstrap/maya', '/studio'])
+
+    assert value == _join(['/site', '/studio', '/install', '/install/bootstrap/maya'])
+    assert environment.set_paths(['/install']) == _join(['/site', '/studio', '/install'])
+    assert os.environ['PYTHONPATH'] == _join(['/site', '/studio', '/install'])
@@ -0,0 +1,133 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector launch state machine
+"""
+
+import os
+import time
+
+import pytest
+
+from artellapipe.launcher.plugins.dccselector.core import environment, launch
+
+
+def test_launch_does_not_sleep(monkeypatch):
+    def _sleep(seconds):
+        raise AssertionError('Launch slept {} seconds'.format(seconds))
+
+    monkeypatch.setattr(time, 'sleep', _sleep)
+
+    delays = list()
+    progress = list()
+    finished = list()
+
+    def _scheduler(delay, fn):
+        delays.append(delay)
+        fn()
+
+    def _set_executable(context):
+        context['exec_'] = 'maya.exe'
+
+    phases = [
+        launch.LaunchPhase('configuration', _set_executable, progress=1, message='Configuration'),
+        launch.LaunchPhase('environment', lambda context: None, progress=4, message='Environment'),
+        launch.LaunchPhase('launch', lambda context: None, progress=5, message='Launch')
+    ]
+    state_machine = launch.LaunchStateMachine(
+        phases, scheduler=_scheduler, min_display_time=2.0,
+        on_progress=lambda value, msg: progress.append(value), on_finished=finished.append)
+
+    start = time.time()
+    state_machine.start()
+    elapsed = time.time() - start
+
+    assert state_machine.state == launch.FINISHED_STATE
+    assert finished == [{'exec_': 'maya.exe'}]
+    assert progress == [1, 4, 5]
+    assert elapsed < 0.5
+    assert delays[:-1] == [0.0, 0.0, 0.0]
+    assert 1.5 < delays[-1] <= 2.0
+
+
+def test_launch_stops_on_failed_phase():
+    failures = list()
+
+    def _fail(context):
+        raise RuntimeError('Installation path does not exist')
+
+    phases = [
+        launch.LaunchPhase('configuration', _fail),
+        launch.LaunchPhase('launch', lambda context: failures.append('not expected'))
+    ]
+    state_machine = launch.LaunchStateMachine(phases, on_failed=failures.append)
+    state_machine.start()
+
+    assert state_machine.state == launch.FAILED_STATE
+    assert len(failures) == 1 and isinstance(failures[0], RuntimeError)
+
+
+def test_launch_plan_spawn(monkeypatch):
+    monkeypatch.delenv('PYTHONPATH', raising=False)
+    monkeypatch.setattr(environment, '_BASE_PATHS', dict())
+    launched = list()
+
+    launch_plan = launch.LaunchPlan(
+        dcc_name='maya', version='2020', exec_='maya.exe', install_path='tools', bootstrap_path='bootstrap/maya',
+        folders_to_register=('bootstrap/maya',), python_paths=('tools', 'tools/bootstrap/maya'),
+        launch_fn=lambda exec_, setup_path: launched.append((exec_, setup_path)), error=None)
+
+    with pytest.raises(AttributeError):
+        launch_plan.exec_ = 'nuke.exe'
+
+    launch_plan.apply_environment()
+    launch_plan.spawn()
+
+    assert os.environ['PYTHONPATH'] == os.pathsep.join(
+        [os.path.normpath('tools'), os.path.normpath('tools/bootstrap/maya')])
+    assert launched == [('maya.exe', 'bootstrap/maya')]
+
+
+def test_launch_phases(monkeypatch):
+    monkeypatch.delenv('PYTHONPATH', raising=False)
+    monkeypatch.setattr(environment, '_BASE_PATHS', dict())
+    events = list()
+
+    def _launch(exec_, setup_path):
+        events.append(('spawn', os.environ['PYTHONPATH']))
+        return 'process'
+
+    launch_plan = launch.LaunchPlan(
+        dcc_name='maya', version='2020', exec_='maya.exe', install_path='tools', bootstrap_path='bootstrap/maya',
+        folders_to_register=('bootstrap/maya',), python_paths=('tools',), launch_fn=_launch, error=None)
+
+    def _get_launch_plan(dcc_name, version):
+        events.append(('resolve', dcc_name, version))
+        return launch_plan
+
+    phases = launch.get_launch_phases(
+        'maya', '2020', _get_launch_plan, check_launch_plan=lambda plan: events.append(('check', plan.version)))
+    state_machine = launch.LaunchStateMachine(phases, on_progress=lambda value, msg: events.append(value))
+    state_machine.start()
+
+    assert [phase.name for phase in phases] == ['resolve', 'environment', 'spawn']
+    assert state_machine.state == launch.FINISHED_STATE
+    assert events == [1, ('resolve', 'maya', '2020'), ('check', '2020'), 4, 5, ('spawn', os.path.normpath('tools'))]
+    assert state_machine.context == {'launch_plan': launch_plan, 'process': 'process'}
+
+
+def test_launch_phases_stop_on_plan_error():
+    failures = list()
+    launch_plan = launch.LaunchPlan(
+        dcc_name='maya', version='2020', exec_=None, install_path=None, bootstrap_path=None, folders_to_register=(),
+        python_paths=(), launch_fn=lambda exec_, setup_path: failures.append('not expected'),
+        error='Current installation path does not exists')
+
+    phases = launch.get_launch_phases('maya', '2020', lambda dcc_name, version: launch_plan)
+    state_machine = launch.LaunchStateMachine(phases, on_failed=failures.append)
+    state_machine.start()
+
+    assert state_machine.state == launch.FAILED_STATE
+    assert len(failures) == 1 and isinstance(failures[0], launch.LaunchError)
+    assert 'launch_plan' not in state_machine.context
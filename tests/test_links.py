@@ -0,0 +1,53 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector development link files index
+"""
+
+import os
+
+from artellapipe.launcher.plugins.dccselector.core import links
+
+
+def test_link_files_are_only_read_when_changed(tmpdir, monkeypatch):
+    paths_dir = tmpdir.mkdir('paths')
+    libs_dir = tmpdir.mkdir('libs')
+    tools_dir = tmpdir.mkdir('tools')
+    link_file = paths_dir.join('libs-link')
+    link_file.write('{}\n'.format(libs_dir))
+    paths_dir.join('readme.txt').write('not a link')
+
+    read_paths = list()
+    read_link_file = links.read_link_file
+
+    def _read_link_file(link_path):
+        read_paths.append(link_path)
+        return read_link_file(link_path)
+
+    monkeypatch.setattr(links, 'read_link_file', _read_link_file)
+    index_path = str(tmpdir.join('links.json'))
+
+    link_index = links.LinkIndex(index_path)
+    assert link_index.get_link_paths(str(paths_dir)) == [str(libs_dir)]
+    assert link_index.save()
+
+    link_index = links.LinkIndex(index_path)
+    assert link_index.get_link_paths(str(paths_dir)) == [str(libs_dir)]
+    assert len(read_paths) == 1
+
+    link_file.write('{}\n'.format(tools_dir))
+    link_mtime = os.stat(str(link_file)).st_mtime + 10
+    os.utime(str(link_file), (link_mtime, link_mtime))
+    assert link_index.get_link_paths(str(paths_dir)) == [str(tools_dir)]
+    assert len(read_paths) == 2
+
+    paths_dir.join('missing-link').write(str(tmpdir.join('missing')))
+    dir_mtime = os.stat(str(paths_dir)).st_mtime + 10
+    os.utime(str(paths_dir), (dir_mtime, dir_mtime))
+    assert link_index.get_link_paths(str(paths_dir)) == [str(tools_dir)]
+    assert len(read_paths) == 3
+
+    tmpdir.mkdir('missing')
+    assert link_index.get_link_paths(str(paths_dir)) == [str(tools_dir), str(tmpdir.join('missing'))]
+    assert len(read_paths) == 3
@@ -0,0 +1,28 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector studio installation manifest
+"""
+
+import json
+
+from artellapipe.launcher.plugins.dccselector.core import manifest
+
+
+def test_manifest_entries_are_validated(tmpdir):
+    maya_exec = tmpdir.join('maya.exe')
+    maya_exec.write('')
+    manifest_file = tmpdir.join('dccs_manifest.json')
+    manifest_file.write(json.dumps({'dccs': {'Maya': {'2020': str(maya_exec), '2019': str(tmpdir.join('missing'))}}}))
+
+    installation_manifest = manifest.InstallationManifest.load(str(manifest_file))
+    assert installation_manifest
+    assert installation_manifest.get_installation_paths('maya', ['2018', '2019', '2020']) == {'2020': str(maya_exec)}
+    assert installation_manifest.get_installation_paths('houdini', ['18.0']) == dict()
+
+
+def test_missing_manifest_is_empty(tmpdir, monkeypatch):
+    monkeypatch.setenv(manifest.MANIFEST_PATH_ENV, str(tmpdir.join('missing.json')))
+    assert manifest.get_manifest_path() == str(tmpdir.join('missing.json'))
+    assert not manifest.InstallationManifest.load()
@@ -0,0 +1,43 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector modules location
+"""
+
+import sys
+
+from artellapipe.launcher.plugins.dccselector.core import modules
+
+
+def test_module_path_does_not_import(tmpdir, monkeypatch):
+    package_dir = tmpdir.mkdir('dccselectorproject')
+    package_dir.join('__init__.py').write('raise RuntimeError("project code executed")\n')
+    bootstrap_dir = package_dir.mkdir('bootstrap')
+    bootstrap_dir.join('__init__.py').write('raise RuntimeError("project code executed")\n')
+    package_dir.join('utils.py').write('raise RuntimeError("project code executed")\n')
+    monkeypatch.syspath_prepend(str(tmpdir))
+    modules.clear_cache()
+
+    assert modules.get_module_path('dccselectorproject.bootstrap') == str(bootstrap_dir)
+    assert modules.get_module_path('dccselectorproject.utils') == str(package_dir)
+    assert modules.get_module_path('dccselectorproject.missing') is None
+    assert 'dccselectorproject' not in sys.modules
+
+    bootstrap_dir.remove()
+    assert modules.get_module_path('dccselectorproject.bootstrap') == str(bootstrap_dir)
+    modules.clear_cache()
+    assert modules.get_module_path('dccselectorproject.bootstrap') is None
+
+
+def test_missing_module_path_is_not_cached(tmpdir, monkeypatch):
+    package_dir = tmpdir.mkdir('dccselectormissingproject')
+    package_dir.join('__init__.py').write('')
+    monkeypatch.syspath_prepend(str(tmpdir))
+    modules.clear_cache()
+
+    assert modules.get_module_path('dccselectormissingproject.bootstrap') is None
+
+    bootstrap_dir = package_dir.mkdir('bootstrap')
+    bootstrap_dir.join('__init__.py').write('')
+    assert modules.get_module_path('dccselectormissingproject.bootstrap') == str(bootstrap_dir)
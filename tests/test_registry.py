@@ -0,0 +1,23 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector registry access layer
+"""
+
+from artellapipe.launcher.plugins.dccselector.core import registry
+
+
+def test_reader_memoizes_reads():
+    backend = registry.FakeRegistryBackend({
+        r'SOFTWARE\Autodesk\Maya\2020\Setup\InstallPath': {'MAYA_INSTALL_LOCATION': 'C:/Maya2020'},
+        r'SOFTWARE\Autodesk\Maya\2019\Setup\InstallPath': {'MAYA_INSTALL_LOCATION': 'C:/Maya2019'},
+    })
+    reader = registry.RegistryReader(backend)
+
+    assert sorted(reader.get_subkeys(r'SOFTWARE\Autodesk\Maya')) == ['2019', '2020']
+    assert reader.get_subkeys(r'software\autodesk\maya')
+    assert reader.get_value(r'SOFTWARE\Autodesk\Maya\2020\Setup\InstallPath', 'MAYA_INSTALL_LOCATION') == 'C:/Maya2020'
+    assert reader.get_value(r'SOFTWARE\Autodesk\Maya\2020\Setup\InstallPath', 'MAYA_INSTALL_LOCATION') == 'C:/Maya2020'
+    assert reader.get_value(r'SOFTWARE\Autodesk\Maya\2018\Setup\InstallPath', 'MAYA_INSTALL_LOCATION') is None
+    assert backend.calls == 3
@@ -0,0 +1,40 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector resources cache
+"""
+
+import json
+
+from artellapipe.launcher.plugins.dccselector.core import resources
+
+
+def test_lru_cache_counts_hits_and_evicts():
+    icons_cache = resources.LRUCache(max_size=2)
+    loads = list()
+
+    def _loader(name):
+        return lambda: loads.append(name) or name
+
+    assert icons_cache.get(('', 'maya', 48), _loader('maya')) == 'maya'
+    assert icons_cache.get(('', 'maya', 48), _loader('maya')) == 'maya'
+    icons_cache.get(('', 'nuke', 48), _loader('nuke'))
+    icons_cache.get(('', 'maya', 48), _loader('maya'))
+    icons_cache.get(('', 'houdini', 48), _loader('houdini'))
+
+    assert ('', 'nuke', 48) not in icons_cache
+    assert ('', 'maya', 48) in icons_cache
+    assert loads == ['maya', 'nuke', 'houdini']
+    assert icons_cache.get_stats()['hits'] == 2
+    assert icons_cache.get_stats()['misses'] == 3
+
+
+def test_shipped_manifest_is_up_to_date():
+    resources_path = resources.get_resources_path()
+    manifest = resources.ResourcesManifest.load(resources_path)
+
+    assert manifest.has_icon('maya', theme='color')
+    assert manifest.get_icon_size('maya', theme='color') == (64, 64)
+    with open(resources.get_manifest_path(resources_path), 'r') as fh:
+        assert json.load(fh) == resources.build_manifest(resources_path)
@@ -0,0 +1,37 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector search index
+"""
+
+from artellapipe.launcher.plugins.dccselector.core import search
+
+
+def test_search_ranks_and_selects_versions():
+    search_index = search.SearchIndex()
+    search_index.update('maya', ['2019', '2020'], ['Animation', 'Rigging'])
+    search_index.update('houdini', ['18.0'], ['FX'])
+    search_index.update('substance painter', ['2019'], ['Lookdev'])
+
+    assert [r.name for r in search_index.search('')] == ['maya', 'houdini', 'substance painter']
+    assert [r.name for r in search_index.search('ma')] == ['maya']
+    assert [r.name for r in search_index.search('pnt')] == ['substance painter']
+    assert [r.name for r in search_index.search('fx')] == ['houdini']
+
+    results = search_index.search('maya 2020')
+    assert [(r.name, r.version) for r in results] == [('maya', '2020')]
+
+    results = search_index.search('2019')
+    assert [r.name for r in results] == ['maya', 'substance painter']
+
+
+def test_incremental_search_sees_index_updates():
+    search_index = search.SearchIndex()
+    search_index.update('maya', ['2019'])
+    assert not search_index.search('nu')
+
+    search_index.update('nuke', ['12.0'])
+    assert [r.name for r in search_index.search('nuk')] == ['nuke']
+    search_index.remove('nuke')
+    assert not search_index.search('nuke')
@@ -0,0 +1,63 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector splash cache
+"""
+
+import os
+
+from artellapipe.launcher.plugins.dccselector.core import splash
+
+
+def test_splash_index_and_scaled_paths(tmpdir):
+    splash_dir = tmpdir.mkdir('images')
+    splash_dir.join('splash.png').write('')
+    splash_dir.join('splash2.png').write('')
+    splash_dir.join('logo.png').write('')
+
+    index_path = str(tmpdir.join('index.json'))
+    splash_index = splash.SplashIndex(index_path)
+    splash_files = splash_index.get_splash_files(str(splash_dir))
+    assert [os.path.basename(f) for f in splash_files] == ['splash.png', 'splash2.png']
+    assert splash_index.save()
+    assert splash.SplashIndex(index_path).get_splash_files(str(splash_dir)) == splash_files
+
+    cache_dir = str(tmpdir.mkdir('cache'))
+    scaled_path = splash.get_scaled_splash_path(splash_files[0], cache_dir=cache_dir)
+    open(scaled_path, 'w').close()
+    os.utime(splash_files[0], (0, 0))
+    new_scaled_path = splash.get_scaled_splash_path(splash_files[0], cache_dir=cache_dir)
+    assert new_scaled_path != scaled_path
+    open(new_scaled_path, 'w').close()
+    splash.clean_scaled_splash(new_scaled_path)
+    assert os.listdir(cache_dir) == [os.path.basename(new_scaled_path)]
+
+
+def test_composited_splash_paths(tmpdir):
+    source_path = str(tmpdir.join('splash.png'))
+    open(source_path, 'w').close()
+    cache_dir = str(tmpdir.mkdir('cache'))
+
+    maya_path = splash.get_composited_splash_path(source_path, 'project', 'maya', cache_dir=cache_dir)
+    nuke_path = splash.get_composited_splash_path(source_path, 'project', 'nuke', cache_dir=cache_dir)
+    assert maya_path != nuke_path
+    assert maya_path == splash.get_composited_splash_path(source_path, 'project', 'maya', cache_dir=cache_dir)
+    assert splash.get_composited_splash_path(str(tmpdir.join('missing.png')), 'project', 'maya') is None
+
+
+def test_composited_splash_paths_depend_on_icons(tmpdir):
+    source_path = str(tmpdir.join('splash.png'))
+    open(source_path, 'w').close()
+    icon_path = str(tmpdir.join('maya.png'))
+    open(icon_path, 'w').close()
+    cache_dir = str(tmpdir.mkdir('cache'))
+
+    splash_path = splash.get_composited_splash_path(
+        source_path, 'project', 'maya', cache_dir=cache_dir, icon_paths=[icon_path])
+    os.utime(icon_path, (0, 0))
+    updated_path = splash.get_composited_splash_path(
+        source_path, 'project', 'maya', cache_dir=cache_dir, icon_paths=[icon_path])
+
+    assert updated_path != splash_path
+    assert os.path.basename(updated_path).rsplit('_', 1)[0] == os.path.basename(splash_path).rsplit('_', 1)[0]
@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher-plugins-dccselector install roots watcher
+"""
+
+import os
+import time
+import platform
+import threading
+
+import pytest
+
+from artellapipe.launcher.plugins.dccselector.core import watcher
+
+
+@pytest.mark.parametrize('use_inotify', [True, False])
+def test_watcher_notifies_changed_dcc(tmpdir, use_inotify):
+    maya_root = tmpdir.mkdir('autodesk')
+    houdini_root = tmpdir.mkdir('opt')
+    changed = list()
+    notified = threading.Event()
+
+    def _on_changed(dcc_name):
+        changed.append(dcc_name)
+        notified.set()
+
+    roots_watcher = watcher.InstallRootsWatcher(_on_changed, interval=0.1, settle_time=0.0, use_inotify=use_inotify)
+    roots_watcher.watch('maya', [str(maya_root)])
+    roots_watcher.watch('houdini', [str(houdini_root)])
+    roots_watcher.start()
+    backend_name = roots_watcher.backend_name
+    try:
+        time.sleep(0.2)
+        os.makedirs(os.path.join(str(maya_root), 'maya2022'))
+        os.utime(str(maya_root), (time.time() + 10, time.time() + 10))
+        assert notified.wait(5.0)
+    finally:
+        roots_watcher.stop()
+
+    if use_inotify and platform.system().lower() == 'linux':
+        assert backend_name == watcher.InotifyBackend.name
+    else:
+        assert backend_name == watcher.PollingBackend.name
+    assert changed == ['maya']
+
+
+def test_watcher_falls_back_to_polling(tmpdir, monkeypatch):
+    maya_root = tmpdir.mkdir('autodesk')
+    notified = threading.Event()
+
+    def _inotify_not_available(roots, interval=None):
+        raise OSError('inotify_init1 failed')
+
+    monkeypatch.setattr(watcher, 'InotifyBackend', _inotify_not_available)
+    roots_watcher = watcher.InstallRootsWatcher(
+        lambda dcc_name: notified.set(), interval=0.1, settle_time=0.0, use_inotify=True)
+    roots_watcher.watch('maya', [str(maya_root)])
+    roots_watcher.start()
+    try:
+        assert roots_watcher.backend_name == watcher.PollingBackend.name
+        time.sleep(0.2)
+        os.makedirs(os.path.join(str(maya_root), 'maya2022'))
+        os.utime(str(maya_root), (time.time() + 10, time.time() + 10))
+        assert notified.wait(5.0)
+    finally:
+        roots_watcher.stop()